@@ -0,0 +1,44 @@
+"""Fixtures for the offline benchmark suite.
+
+Run with ``pytest benchmarks --benchmark-json=bench.json`` (needs
+``pytest-benchmark``). Compare runs with ``--benchmark-compare``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+# Reuse the integration test fixtures (mocked client, entry data, setup).
+from tests.conftest import (  # noqa: E402, F401
+    auto_enable_custom_integrations,
+    config_entry_data,
+    mock_client,
+    setup_integration,
+    verify_cleanup,
+)
+
+# Number of simulated controllers in the fleet scenario.
+FLEET_SIZE = int(os.environ.get("SIEGENIA_BENCH_FLEET", "100"))
+
+
+@pytest.fixture
+def bench_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """A private event loop for benchmarking client coroutines from sync tests."""
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
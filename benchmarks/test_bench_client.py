@@ -0,0 +1,101 @@
+"""Client hot paths: frame routing and request overhead."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from aiohttp import WSMessage, WSMsgType
+
+from custom_components.siegenia.siegenia_client import SiegeniaClient
+
+FRAMES = 2000
+
+_PARAMS_PUSH = json.dumps(
+    {
+        "command": "deviceParams",
+        "data": {"states": {"0": "MOVING"}, "warnings": [], "stopover": 3, "timer": {"enabled": False}},
+    }
+)
+_HEARTBEAT_PUSH = json.dumps({"command": "heartbeat", "data": {"uptime": 12345}})
+
+
+class _ReplayWebSocket:
+    """Yields a fixed list of frames, then closes."""
+
+    def __init__(self, frames: list[WSMessage]) -> None:
+        self._frames = iter(frames)
+        self.closed = False
+
+    def __aiter__(self) -> _ReplayWebSocket:
+        return self
+
+    async def __anext__(self) -> WSMessage:
+        try:
+            return next(self._frames)
+        except StopIteration:
+            self.closed = True
+            raise StopAsyncIteration from None
+
+
+class _AnsweringWebSocket:
+    """Answers every request synchronously from ``send_str``."""
+
+    def __init__(self, client: SiegeniaClient) -> None:
+        self._client = client
+        self.closed = False
+
+    async def send_str(self, message: str) -> None:
+        req_id = json.loads(message)["id"]
+        self._client._awaiting[req_id].set_result({"id": req_id, "status": "ok", "data": {}})
+
+
+def _frames(raw: str) -> list[WSMessage]:
+    return [WSMessage(WSMsgType.TEXT, raw, None)] * FRAMES
+
+
+def _run_receiver(loop: asyncio.AbstractEventLoop, client: SiegeniaClient, frames: list[WSMessage]) -> None:
+    client._closing = True  # no reconnect bookkeeping when the replay ends
+    loop.run_until_complete(client._receiver_loop(_ReplayWebSocket(frames)))  # type: ignore[arg-type]
+
+
+def test_receiver_routes_wanted_pushes(benchmark, bench_loop) -> None:  # noqa: ANN001
+    client = SiegeniaClient("192.0.2.1")
+    client.set_push_callback(lambda _msg: None, commands={"deviceParams"})
+    frames = _frames(_PARAMS_PUSH)
+    benchmark.extra_info["frames"] = FRAMES
+    benchmark(_run_receiver, bench_loop, client, frames)
+
+
+def test_receiver_skips_unwanted_pushes(benchmark, bench_loop) -> None:  # noqa: ANN001
+    client = SiegeniaClient("192.0.2.1")
+    client.set_push_callback(lambda _msg: None, commands={"deviceParams"})
+    frames = _frames(_HEARTBEAT_PUSH)
+    benchmark.extra_info["frames"] = FRAMES
+    benchmark(_run_receiver, bench_loop, client, frames)
+
+
+def test_receiver_matches_responses(benchmark, bench_loop) -> None:  # noqa: ANN001
+    client = SiegeniaClient("192.0.2.1")
+    frames = [WSMessage(WSMsgType.TEXT, json.dumps({"id": i, "status": "ok"}), None) for i in range(FRAMES)]
+
+    def _run() -> None:
+        for i in range(FRAMES):
+            client._awaiting[i] = bench_loop.create_future()
+        _run_receiver(bench_loop, client, frames)
+
+    benchmark.extra_info["frames"] = FRAMES
+    benchmark(_run)
+
+
+def test_send_request_overhead(benchmark, bench_loop) -> None:  # noqa: ANN001
+    client = SiegeniaClient("192.0.2.1")
+    client._ws = _AnsweringWebSocket(client)  # type: ignore[assignment]
+    requests = 500
+
+    async def _run() -> None:
+        for _ in range(requests):
+            await client._send_request("getDeviceParams")
+
+    benchmark.extra_info["requests"] = requests
+    benchmark(lambda: bench_loop.run_until_complete(_run()))
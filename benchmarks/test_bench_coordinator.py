@@ -0,0 +1,37 @@
+"""Coordinator hot paths on push and poll data."""
+
+from __future__ import annotations
+
+from custom_components.siegenia.const import DOMAIN
+
+
+def _push(states: dict[str, str], warnings: list[str] | None = None) -> dict:
+    return {
+        "command": "deviceParams",
+        "data": {"states": states, "warnings": warnings or [], "stopover": 3, "timer": {"enabled": False}},
+    }
+
+
+async def test_handle_push_update_merge(hass, setup_integration, benchmark) -> None:  # noqa: ANN001
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    messages = [_push({"0": "MOVING"}), _push({"0": "OPEN"})]
+    index = 0
+
+    def _run() -> None:
+        nonlocal index
+        coordinator._handle_push_update(messages[index & 1])
+        index += 1
+
+    benchmark(_run)
+
+
+async def test_adjust_interval(hass, setup_integration, benchmark) -> None:  # noqa: ANN001
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    benchmark(coordinator._adjust_interval)
+
+
+async def test_handle_warnings_unchanged(hass, setup_integration, benchmark) -> None:  # noqa: ANN001
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    payload = _push({"0": "CLOSED"}, ["Sash 0 blocked"])
+    coordinator._handle_warnings(payload)
+    benchmark(coordinator._handle_warnings, payload)
@@ -0,0 +1,23 @@
+"""Property evaluation for every Siegenia entity on a state write."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.siegenia.const import DOMAIN
+
+
+@pytest.mark.parametrize("platform", ["cover", "sensor", "select", "binary_sensor"])
+async def test_entity_properties(hass, setup_integration, benchmark, platform: str) -> None:  # noqa: ANN001
+    component = hass.data["entity_components"][platform]
+    entities = [entity for entity in component.entities if entity.platform.platform_name == DOMAIN]
+    assert entities
+
+    def _evaluate() -> None:
+        for entity in entities:
+            entity.available
+            entity.state
+            entity.extra_state_attributes
+
+    benchmark.extra_info["entities"] = len(entities)
+    benchmark(_evaluate)
@@ -0,0 +1,34 @@
+"""Many simulated controllers polled concurrently from one event loop."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.siegenia.siegenia_client import SiegeniaClient, SiegeniaSimulator
+
+from .conftest import FLEET_SIZE
+
+
+def test_fleet_poll_round(benchmark, bench_loop) -> None:  # noqa: ANN001
+    sims = [SiegeniaSimulator(serial=f"SIM{index:08d}", sashes=2) for index in range(FLEET_SIZE)]
+    clients = [SiegeniaClient(f"sim-{index}", ws_protocol="ws", transport=sim.transport()) for index, sim in enumerate(sims)]
+
+    async def _open() -> None:
+        for client in clients:
+            await client.connect()
+        await asyncio.gather(*(client.login("admin", "password") for client in clients))
+
+    async def _poll() -> None:
+        await asyncio.gather(*(client.get_device_params() for client in clients))
+
+    async def _close() -> None:
+        await asyncio.gather(*(client.disconnect() for client in clients))
+        await asyncio.gather(*(sim.close() for sim in sims))
+
+    bench_loop.run_until_complete(_open())
+    try:
+        benchmark.extra_info["devices"] = FLEET_SIZE
+        benchmark(lambda: bench_loop.run_until_complete(_poll()))
+    finally:
+        bench_loop.run_until_complete(_close())
+    assert all(sim.requests["getDeviceParams"] >= 1 for sim in sims)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from datetime import timedelta
+import time
 
 from typing import TYPE_CHECKING
 from homeassistant.config_entries import ConfigEntry
@@ -40,9 +41,17 @@ from .const import (
     DEFAULT_IDLE_INTERVAL,
     CONF_PREVENT_OPENING,
     DEFAULT_PREVENT_OPENING,
+    CONF_LONG_LIFE_SESSION,
+    DEFAULT_LONG_LIFE_SESSION,
+    CONF_PUSH_ONLY,
+    CONF_PUSH_WATCHDOG,
+    DEFAULT_PUSH_ONLY,
+    DEFAULT_PUSH_WATCHDOG,
 )
 from .coordinator import SiegeniaDataUpdateCoordinator
-from .device_registry import async_merge_devices
+from .scheduler import SiegeniaConnectGate, SiegeniaPollScheduler
+from .storage import async_get_device_cache, async_get_motion_profiles, async_get_session_cache
+from .device_registry import async_merge_devices, async_update_device_details
 from .__init_services__ import async_setup_services
 
 
@@ -56,6 +65,7 @@ else:  # runtime: fall back to non-parameterized
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    setup_started = time.monotonic()
     data = entry.data
     from .const import DEFAULT_POLL_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL
 
@@ -83,11 +93,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator.debug_logging = entry.options.get(CONF_DEBUG, False)
     coordinator.informational_logging = entry.options.get(CONF_INFORMATIONAL, False)
     coordinator.prevent_opening = entry.options.get(CONF_PREVENT_OPENING, DEFAULT_PREVENT_OPENING)
+    coordinator.long_life_session = entry.options.get(CONF_LONG_LIFE_SESSION, DEFAULT_LONG_LIFE_SESSION)
     # Advanced intervals
     motion_s = entry.options.get(CONF_MOTION_INTERVAL, DEFAULT_MOTION_INTERVAL)
     idle_s = entry.options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL)
     coordinator._motion_interval = timedelta(seconds=motion_s)  # type: ignore[attr-defined]
     coordinator._idle_interval = timedelta(seconds=idle_s)      # type: ignore[attr-defined]
+    coordinator.push_only = entry.options.get(CONF_PUSH_ONLY, DEFAULT_PUSH_ONLY)
+    coordinator.push_watchdog = entry.options.get(CONF_PUSH_WATCHDOG, DEFAULT_PUSH_WATCHDOG)
+    # Stagger polls across all entries and cap how many run at once
+    scheduler = _async_get_poll_scheduler(hass)
+    scheduler.register(entry.entry_id, coordinator.device_identifier())
+    coordinator.poll_scheduler = scheduler
+    entry.async_on_unload(lambda: scheduler.unregister(entry.entry_id))
 
     async def _async_shutdown_coordinator() -> None:
         """Stop connections and background tasks owned by the coordinator."""
@@ -116,33 +134,95 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise
 
     entry.async_on_unload(remove_stop_listener)
+    coordinator.setup_timing["platforms_ready"] = round(time.monotonic() - setup_started, 3)
+    # Connect after setup returns so many (or offline) devices do not hold up HA startup
+    entry.async_create_background_task(
+        hass,
+        _async_connect_in_background(hass, entry, coordinator, setup_started),
+        name=f"{DOMAIN} connect {entry.title}",
+    )
     return True
 
 
-async def _async_finish_setup(
+def _async_get_poll_scheduler(hass: HomeAssistant) -> SiegeniaPollScheduler:
+    """Return the poll scheduler shared by all Siegenia entries."""
+    key = f"{DOMAIN}_poll_scheduler"
+    scheduler = hass.data.get(key)
+    if scheduler is None:
+        scheduler = hass.data[key] = SiegeniaPollScheduler()
+    return scheduler
+
+
+def _async_get_connect_gate(hass: HomeAssistant) -> SiegeniaConnectGate:
+    """Return the connection admission gate shared by all Siegenia entries."""
+    key = f"{DOMAIN}_connect_gate"
+    gate = hass.data.get(key)
+    if gate is None:
+        gate = hass.data[key] = SiegeniaConnectGate()
+    return gate
+
+
+async def _async_connect_in_background(
     hass: HomeAssistant,
     entry: ConfigEntry,
     coordinator: SiegeniaDataUpdateCoordinator,
+    setup_started: float,
 ) -> None:
-    """Finish setup after early shutdown ownership has been registered."""
+    """Connect and fetch the first data once the admission gate lets this entry in."""
+    timing = coordinator.setup_timing
+    connect_error: Exception | None = None
+    async with _async_get_connect_gate(hass).admit() as waited:
+        timing["admission_wait"] = round(waited, 3)
+        connect_started = time.monotonic()
+        try:
+            await coordinator.async_setup()
+        except ConfigEntryAuthFailed as exc:
+            # Wrong credentials should still trigger HA's reauth flow; drop any
+            # cached state so entities do not stay available meanwhile.
+            timing["result"] = "auth_failed"
+            timing["total"] = round(time.monotonic() - setup_started, 3)
+            coordinator.awaiting_connect = False
+            coordinator.async_set_update_error(exc)
+            entry.async_start_reauth(hass)
+            return
+        except Exception as exc:  # noqa: BLE001
+            # Keep loading the integration while the device is offline.
+            coordinator.logger.warning("Initial connection failed; will retry in background: %s", exc)
+            connect_error = exc
+        timing["connect"] = round(time.monotonic() - connect_started, 3)
+        coordinator.awaiting_connect = False
 
-    try:
-        await coordinator.async_setup()
-    except ConfigEntryAuthFailed:
-        # Wrong credentials should still trigger HA's reauth flow.
-        raise
-    except Exception as exc:  # noqa: BLE001
-        # Keep loading the integration while the device is offline.
-        coordinator.logger.warning("Initial connection failed; will retry in background: %s", exc)
+        if connect_error is None:
+            refresh_started = time.monotonic()
+            # A failed refresh keeps entities unavailable and schedules the next poll.
+            await coordinator.async_refresh()
+            timing["first_refresh"] = round(time.monotonic() - refresh_started, 3)
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryAuthFailed:
-        # Wrong credentials should still trigger HA's reauth flow.
-        raise
-    except Exception as exc:  # noqa: BLE001
-        # The failed refresh marks coordinator entities unavailable until recovery.
-        coordinator.logger.warning("Initial refresh failed; will retry in background: %s", exc)
+    if connect_error is not None:
+        # Free the slot for other entries; the scheduled poll retries the connection.
+        coordinator.async_retry_later(connect_error)
+    else:
+        async_update_device_details(hass, coordinator.device_identifier(), coordinator.device_info)
+    timing["result"] = "connected" if coordinator.last_update_success else "offline"
+    timing["total"] = round(time.monotonic() - setup_started, 3)
+    coordinator.logger.debug(
+        "Setup of %s finished in %.2fs (%s)", coordinator.host, timing["total"], timing["result"]
+    )
+
+
+async def _async_finish_setup(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: SiegeniaDataUpdateCoordinator,
+) -> None:
+    """Finish setup after early shutdown ownership has been registered.
+
+    The device itself is connected later by ``_async_connect_in_background``;
+    until then its entities show the cached device, or are unavailable
+    without a cache.
+    """
+    coordinator.awaiting_connect = True
+    coordinator.last_update_success = await coordinator.async_load_device_cache()
 
     # Merge duplicate devices once per entry
     _lock_key = f"{DOMAIN}_migration_lock_{entry.entry_id}"
@@ -189,6 +269,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the device's cached state, learned travel times and session."""
+    serial = entry.data.get(CONF_SERIAL) or entry.unique_id
+    if not serial:
+        return
+    for get_store in (async_get_device_cache, async_get_motion_profiles, async_get_session_cache):
+        (await get_store(hass)).async_remove(serial)
+
+
 async def _async_migrate_devices(hass: HomeAssistant, entry: ConfigEntry) -> None:
     serial = entry.data.get(CONF_SERIAL) or entry.unique_id
     host = entry.data.get(CONF_HOST)
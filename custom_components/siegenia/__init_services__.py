@@ -152,6 +152,25 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
     hass.services.async_register(DOMAIN, "sync_clock", _sync_clock)
 
+    async def _start_capture(call: ServiceCall) -> None:
+        entity_id: str = call.data["entity_id"]
+        entity = hass.data["entity_components"]["cover"].get_entity(entity_id)  # type: ignore[index]
+        if entity is None:
+            return
+        coordinator = entity.coordinator  # type: ignore[attr-defined]
+        await coordinator.async_start_capture(compress=bool(call.data.get("compress", True)))
+
+    async def _stop_capture(call: ServiceCall) -> None:
+        entity_id: str = call.data["entity_id"]
+        entity = hass.data["entity_components"]["cover"].get_entity(entity_id)  # type: ignore[index]
+        if entity is None:
+            return
+        coordinator = entity.coordinator  # type: ignore[attr-defined]
+        await coordinator.async_stop_capture()
+
+    hass.services.async_register(DOMAIN, "start_capture", _start_capture)
+    hass.services.async_register(DOMAIN, "stop_capture", _stop_capture)
+
     def _parse_duration(text: str) -> tuple[int, int]:
         # Accept minutes as integer or HH:MM
         text = str(text).strip()
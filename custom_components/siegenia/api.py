@@ -1,5 +1,27 @@
 """Compatibility wrapper for the reusable Siegenia client package."""
 
-from .siegenia_client import AuthenticationError, SiegeniaClient, SiegeniaError
+from .siegenia_client import (
+    CONNECTION_CONNECTED,
+    CONNECTION_DISCONNECTED,
+    CONNECTION_RECONNECTING,
+    DEFAULT_CAPTURE_MAX_BYTES,
+    AuthenticationError,
+    FrameCapture,
+    SiegeniaClient,
+    SiegeniaError,
+    read_capture,
+    replay_frames,
+)
 
-__all__ = ["AuthenticationError", "SiegeniaClient", "SiegeniaError"]
+__all__ = [
+    "CONNECTION_CONNECTED",
+    "CONNECTION_DISCONNECTED",
+    "CONNECTION_RECONNECTING",
+    "DEFAULT_CAPTURE_MAX_BYTES",
+    "AuthenticationError",
+    "FrameCapture",
+    "SiegeniaClient",
+    "SiegeniaError",
+    "read_capture",
+    "replay_frames",
+]
@@ -4,9 +4,10 @@ from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, STATE_MOVING, device_configuration_url, resolve_model
+from .const import DOMAIN, device_configuration_url, resolve_model
+from .entity import SiegeniaCoordinatorEntity
+from .snapshot import KEY_DEVICESTATE, KEY_STATES, KEY_WARNINGS
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:  # type: ignore[no-untyped-def]
@@ -20,10 +21,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(entities)
 
 
-class SiegeniaOnlineBinary(CoordinatorEntity, BinarySensorEntity):
+class SiegeniaOnlineBinary(SiegeniaCoordinatorEntity, BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "online"
     _attr_icon = "mdi:lan-connect"
+    _listen_keys = (KEY_DEVICESTATE,)
 
     def __init__(self, coordinator, entry: ConfigEntry, serial: str) -> None:
         super().__init__(coordinator)
@@ -33,10 +35,7 @@ class SiegeniaOnlineBinary(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        devstate = data.get("devicestate") or {}
-        active = devstate.get("deviceactive")
+        active = self.coordinator.snapshot.device_active
         if active is None:
             # Fallback to update success
             return True if self.coordinator.last_update_success else None
@@ -59,10 +58,11 @@ class SiegeniaOnlineBinary(CoordinatorEntity, BinarySensorEntity):
         }
 
 
-class SiegeniaMovingBinary(CoordinatorEntity, BinarySensorEntity):
+class SiegeniaMovingBinary(SiegeniaCoordinatorEntity, BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "moving"
     _attr_icon = "mdi:motion"
+    _listen_keys = (KEY_STATES,)
 
     def __init__(self, coordinator, entry: ConfigEntry, serial: str) -> None:
         super().__init__(coordinator)
@@ -72,12 +72,10 @@ class SiegeniaMovingBinary(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        states = data.get("states") or {}
-        if not states:
+        snapshot = self.coordinator.snapshot
+        if not snapshot.states:
             return None
-        return any(state == STATE_MOVING for state in states.values())
+        return snapshot.moving
 
     @property
     def device_info(self):
@@ -96,11 +94,12 @@ class SiegeniaMovingBinary(CoordinatorEntity, BinarySensorEntity):
         }
 
 
-class SiegeniaWarningBinary(CoordinatorEntity, BinarySensorEntity):
+class SiegeniaWarningBinary(SiegeniaCoordinatorEntity, BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "warning_active"
     _attr_icon = "mdi:alert"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_keys = (KEY_WARNINGS,)
 
     def __init__(self, coordinator, entry: ConfigEntry, serial: str) -> None:
         super().__init__(coordinator)
@@ -110,10 +109,7 @@ class SiegeniaWarningBinary(CoordinatorEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        warnings = data.get("warnings") or []
-        return len(warnings) > 0
+        return len(self.coordinator.snapshot.warnings) > 0
 
     @property
     def device_info(self):
@@ -6,7 +6,6 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -19,6 +18,7 @@ from .const import (
     STATE_OPEN,
     STATE_STOP_OVER,
 )
+from .entity import SiegeniaCoordinatorEntity
 
 _ACTIONS = [
     ("open", STATE_OPEN),
@@ -42,7 +42,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(entities)
 
 
-class SiegeniaModeButton(CoordinatorEntity, ButtonEntity):
+class SiegeniaModeButton(SiegeniaCoordinatorEntity, ButtonEntity):
     def __init__(self, coordinator, entry: ConfigEntry, serial: str, key: str, mode: str) -> None:
         super().__init__(coordinator)
         self._entry = entry
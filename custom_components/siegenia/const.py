@@ -25,17 +25,54 @@ CONF_SERIAL = "serial"
 CONF_EXTENDED_DISCOVERY = "extended_discovery"
 CONF_PREVENT_OPENING = "prevent_opening"
 CONF_VERIFY_SSL = "verify_ssl"
+CONF_LONG_LIFE_SESSION = "long_life_session"
 
 # Advanced timing options
 CONF_MOTION_INTERVAL = "motion_interval"  # seconds while moving
 CONF_IDLE_INTERVAL = "idle_interval"      # seconds when idle (no push)
+CONF_PUSH_ONLY = "push_only"              # suspend polling while pushes flow
+CONF_PUSH_WATCHDOG = "push_watchdog"      # seconds without a push before verifying
 
 DEFAULT_MOTION_INTERVAL = 2
 DEFAULT_IDLE_INTERVAL = 60
+DEFAULT_PUSH_ONLY = False
+DEFAULT_PUSH_WATCHDOG = 120
 DEFAULT_AUTO_DISCOVER = False  # opt-in to avoid surprise scans
 DEFAULT_EXTENDED_DISCOVERY = False  # broader scan of common home subnets
 DEFAULT_PREVENT_OPENING = False
 DEFAULT_VERIFY_SSL = False
+DEFAULT_LONG_LIFE_SESSION = False
+
+# Unsolicited device messages the coordinator consumes
+PUSH_COMMANDS = frozenset({"getDeviceParams", "deviceParams"})
+
+# Traffic captures (under the HA config directory)
+CAPTURE_DIR = "siegenia_captures"
+
+# Persistent storage
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # seconds; coalesces bursts of cache writes
+LONG_LIFE_SESSION_MAX_AGE = 24 * 3600  # reuse a cached session for at most a day
+
+# Predictive motion polling
+MOTION_PROFILE_ALPHA = 0.3   # weight of the newest travel time in the learned mean
+MOTION_MAX_DURATION = 180    # seconds; longer runs are not learned
+MOTION_START_GRACE = 10      # seconds a command may take to report MOVING
+MOTION_CONFIRM_DELAY = 2     # seconds; follow-up poll when still moving at the predicted end
+
+# Poll scheduling states (see SiegeniaDataUpdateCoordinator._update_schedule)
+SCHEDULE_IDLE = "idle"
+SCHEDULE_PUSH = "push_active"
+SCHEDULE_MOTION = "motion"
+SCHEDULE_OFFLINE = "offline_backoff"
+SCHEDULE_HISTORY = 20        # recorded state transitions
+OFFLINE_BACKOFF_MAX = 300    # seconds between polls of an unreachable device
+
+# Fleet-wide poll scheduling (see scheduler.SiegeniaPollScheduler)
+POLL_MAX_CONCURRENT = 4      # getDeviceParams requests in flight across all devices
+POLL_PHASE_JITTER = 0.05     # random share of the interval added to the serial's phase
+STARTUP_MAX_CONCURRENT = 4   # devices connecting at once during setup
+STARTUP_JITTER = 2.0         # max seconds a device waits before connecting while others do
 
 # Repairs / issue ids
 ISSUE_UNREACHABLE = "cannot_connect"
@@ -48,7 +85,13 @@ REDISCOVER_MAX_SUBNETS = 5
 REDISCOVER_MAX_PER_SUBNET = 64
 REDISCOVER_MAX_HOSTS = 192
 REDISCOVER_CONCURRENCY = 8
-PROBE_TIMEOUT = 3.0
+PROBE_TIMEOUT = 3.0  # used until the device's RTT has been observed
+PROBE_TIMEOUT_MIN = 1.0
+PROBE_TIMEOUT_MAX = 10.0
+
+# Adaptive response deadlines derived from observed RTT
+RESPONSE_TIMEOUT_FLOOR = 2.0
+RESPONSE_TIMEOUT_CEILING = 10.0
 
 # Slider threshold options
 CONF_SLIDER_GAP_MAX = "slider_gap_max"            # 0 < x < 100; 1..x -> GAP_VENT
@@ -153,6 +196,15 @@ OPTION_TO_CMD = {
 # Reverse mapping command/state (uppercase) -> option key (lowercase)
 CMD_TO_OPTION = {v: k for k, v in OPTION_TO_CMD.items()}
 
+# Stable state a sash settles in after a motion command
+COMMAND_TO_STATE = {
+    STATE_OPEN: STATE_OPEN,
+    CMD_CLOSE: STATE_CLOSED,
+    STATE_GAP_VENT: STATE_GAP_VENT,
+    CMD_CLOSE_WO_LOCK: STATE_CLOSED_WO_LOCK,
+    STATE_STOP_OVER: STATE_STOP_OVER,
+}
+
 
 def is_opening_command(cmd: str) -> bool:
     return cmd in OPENING_COMMANDS
@@ -5,21 +5,32 @@ import logging
 import time
 import asyncio
 import ipaddress
-from collections.abc import Awaitable
+from collections import deque
+from contextlib import AbstractAsyncContextManager, nullcontext
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from typing import Any
 
 from aiohttp import ClientSession, ClientConnectorError, WSServerHandshakeError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, Context
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, Context, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.event import async_call_later
-from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import issue_registry as ir
 
-from .api import AuthenticationError, SiegeniaClient, SiegeniaError
+from .api import (
+    CONNECTION_CONNECTED,
+    CONNECTION_RECONNECTING,
+    DEFAULT_CAPTURE_MAX_BYTES,
+    AuthenticationError,
+    FrameCapture,
+    SiegeniaClient,
+    SiegeniaError,
+)
 from .const import (
     DEFAULT_HEARTBEAT_INTERVAL,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_PUSH_WATCHDOG,
     DOMAIN,
     DEFAULT_WS_PROTOCOL,
     DEFAULT_VERIFY_SSL,
@@ -41,9 +52,43 @@ from .const import (
     REDISCOVER_MAX_HOSTS,
     REDISCOVER_CONCURRENCY,
     PROBE_TIMEOUT,
+    PROBE_TIMEOUT_MAX,
+    PROBE_TIMEOUT_MIN,
+    RESPONSE_TIMEOUT_CEILING,
+    RESPONSE_TIMEOUT_FLOOR,
+    LONG_LIFE_SESSION_MAX_AGE,
+    PUSH_COMMANDS,
+    VALID_COMMANDS,
+    CAPTURE_DIR,
+    COMMAND_TO_STATE,
+    MOTION_CONFIRM_DELAY,
+    OFFLINE_BACKOFF_MAX,
+    SCHEDULE_HISTORY,
+    SCHEDULE_IDLE,
+    SCHEDULE_MOTION,
+    SCHEDULE_OFFLINE,
+    SCHEDULE_PUSH,
+)
+from .motion import MotionPredictor
+from .scheduler import SiegeniaPollScheduler
+from .snapshot import EMPTY_SNAPSHOT, KEY_STATES, DeviceSnapshot, changed_keys, state_key
+from .storage import (
+    SiegeniaDeviceCache,
+    SiegeniaMotionProfiles,
+    SiegeniaSessionCache,
+    async_get_device_cache,
+    async_get_motion_profiles,
+    async_get_session_cache,
 )
 
 
+def _without_request_id(response: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return a device response without its per-request ``id``."""
+    if response is None:
+        return None
+    return {key: value for key, value in response.items() if key != "id"}
+
+
 class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(
         self,
@@ -90,6 +135,11 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             session=self.session,
             logger=self.logger.debug,
             verify_ssl=self.verify_ssl,
+            auto_reconnect=True,
+            replay_requests=True,
+            response_timeout=RESPONSE_TIMEOUT_CEILING,
+            adaptive_timeouts=True,
+            timeout_floor=RESPONSE_TIMEOUT_FLOOR,
         )
         self._stopping = False
         self._connection_task: asyncio.Task[None] | None = None
@@ -106,7 +156,32 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._motion_interval = timedelta(seconds=max(1, min(2, poll_interval)))
         self._push_idle_timeout = 60
         self._last_push_monotonic: float | None = None
-        self._revert_handle = None
+        # Scheduling state machine; its one timer tracks push silence
+        self._schedule_state = SCHEDULE_IDLE
+        self._schedule_since = time.monotonic()
+        self._schedule_transitions: deque[dict[str, Any]] = deque(maxlen=SCHEDULE_HISTORY)
+        self._schedule_timer: CALLBACK_TYPE | None = None
+        self._pushes_active = False
+        self._failed_polls = 0
+        # Push-only mode: no polling while pushes arrive, watchdog verifies silence
+        self.push_only: bool = False
+        self.push_watchdog: int = DEFAULT_PUSH_WATCHDOG
+        self._watchdog_verifications = 0
+        self._watchdog_fallbacks = 0
+        # Values as of the last push, compared against watchdog check polls
+        self._push_snapshot: DeviceSnapshot | None = None
+        self._poll_times: deque[float] = deque()
+        # Set by async_setup_entry; shared by all entries of the domain.
+        self.poll_scheduler: SiegeniaPollScheduler | None = None
+        # True until the admission gate lets the initial connection through
+        self.awaiting_connect = False
+        self.setup_timing: dict[str, Any] = {}
+        self._polls_total = 0
+        self._poll_retries = 0
+        # Learned travel times; polls land at the predicted end of a motion
+        self._motion = MotionPredictor()
+        self._motion_profiles: SiegeniaMotionProfiles | None = None
+        self._motion_followup_sent = False
         # Warnings tracking
         self._last_warnings: str | None = None
         # Optional logging toggles
@@ -116,8 +191,24 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Options toggles (set from setup_entry)
         self.warning_notifications: bool = True
         self.warning_events: bool = True
-        self._motion_revert_handle = None
         self.prevent_opening: bool = False
+        self.long_life_session: bool = False
+        self._session_cache: SiegeniaSessionCache | None = None
+        self._device_cache: SiegeniaDeviceCache | None = None
+        self._device_cache_updated: float | None = None
+        self._seeded_from_cache = False
+        self._capture: FrameCapture | None = None
+        # Parsed view of self.data shared by all entities
+        self._snapshot: DeviceSnapshot = EMPTY_SNAPSHOT
+        self._snapshot_source: dict[str, Any] | None = None
+        self._snapshot_version = 0
+        # Change detection: what listeners last rendered
+        self._notified: tuple[bool, DeviceSnapshot, tuple[Any, ...]] | None = None
+        self._notified_updates = 0
+        self._suppressed_updates = 0
+        # Keys changed by the notification in progress; None means everything
+        self._changed_keys: set[str] | None = None
+        self._key_dispatches: dict[str, int] = {}
         # Last command per sash (shared across entities for better UX during motion)
         self._last_cmd_by_sash: dict[int, str | None] = {}
         self._last_cmd_ts_by_sash: dict[int, float] = {}
@@ -129,7 +220,7 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Push updates from device (no id) – update coordinator data immediately
         def _on_push(msg: dict[str, Any]) -> None:
             cmd = msg.get("command")
-            if cmd in {"getDeviceParams", "deviceParams"} and "data" in msg:
+            if cmd in PUSH_COMMANDS and "data" in msg:
                 # Update data and switch to push-optimized interval immediately
                 # (tests call this callback directly on the event loop thread).
                 try:
@@ -140,11 +231,42 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self._push_callback = _on_push
         try:
-            self.client.set_push_callback(self._push_callback)
+            self._bind_push_callback()
         except Exception:
             pass
+        self._client_state: str | None = None
+        self._watch_client_connection()
         self._issue_set = False
 
+    def _bind_push_callback(self) -> None:
+        """Subscribe to the pushes we handle so the client can skip the rest undecoded."""
+        try:
+            self.client.set_push_callback(self._push_callback, commands=PUSH_COMMANDS)
+        except TypeError:
+            # Clients without command filtering deliver every push.
+            self.client.set_push_callback(self._push_callback)
+
+    def _watch_client_connection(self) -> None:
+        """Follow the client's own reconnects instead of re-driving them."""
+        add_listener = getattr(self.client, "add_connection_listener", None)
+        if add_listener is None:
+            return
+        client = self.client
+
+        def _on_connection_state(state: str) -> None:
+            if client is not self.client:
+                return
+            previous = self._client_state
+            self._client_state = state
+            if state == CONNECTION_CONNECTED and previous == CONNECTION_RECONNECTING and not self._stopping:
+                # Background reconnect finished; refresh now instead of waiting a full interval.
+                self.hass.async_create_task(self.async_request_refresh())
+
+        try:
+            add_listener(_on_connection_state)
+        except Exception:
+            self.logger.debug("Failed to watch Siegenia connection state")
+
     # Shared helpers for entities
     def set_last_cmd(self, sash: int, cmd: str | None) -> None:
         s = int(sash)
@@ -161,6 +283,150 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def get_last_stable_state(self, sash: int) -> str | None:
         return self._last_stable_state_by_sash.get(int(sash))
 
+    @property
+    def snapshot(self) -> DeviceSnapshot:
+        """Return the parsed view of the current data.
+
+        Polls and pushes parse their payload as it arrives; data set any other
+        way is parsed on first access.
+        """
+        if self.data is not self._snapshot_source:
+            self._parse_snapshot(self.data)
+        return self._snapshot
+
+    def _parse_snapshot(self, payload: dict[str, Any] | None) -> DeviceSnapshot:
+        if payload is None:
+            self._snapshot = EMPTY_SNAPSHOT
+        else:
+            self._snapshot_version += 1
+            self._snapshot = DeviceSnapshot.from_params(payload, self._snapshot_version)
+        self._snapshot_source = payload
+        return self._snapshot
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners only when something entities render has changed.
+
+        Polls and pushes that repeat the last values (common while a sash
+        moves or the device idles) are counted as suppressed instead.
+        """
+        available = self.last_update_success
+        snapshot = self.snapshot
+        commands = self._command_fingerprint(snapshot)
+        notified = self._notified
+        if (
+            notified is not None
+            and notified[0] == available
+            and notified[2] == commands
+            and notified[1].same_values(snapshot)
+        ):
+            self._suppressed_updates += 1
+            return
+        changed: set[str] | None = None
+        if notified is not None and notified[0] == available:
+            changed = changed_keys(notified[1], snapshot)
+            before = {sash: rest for sash, *rest in notified[2]}
+            for sash, *rest in commands:
+                if before.get(sash) != rest:
+                    changed.update((state_key(sash), KEY_STATES))
+        self._notified = (available, snapshot, commands)
+        self._notified_updates += 1
+        self._changed_keys = changed
+        try:
+            super().async_update_listeners()
+        finally:
+            self._changed_keys = None
+
+    @callback
+    def async_add_keyed_listener(
+        self,
+        keys: Iterable[str],
+        update_callback: CALLBACK_TYPE,
+        context: Any = None,
+    ) -> Callable[[], None]:
+        """Listen for changes to some snapshot slices only.
+
+        Keys are ``states``, ``states/<sash>``, ``warnings``, ``timer``,
+        ``stopover``, ``devicestate`` and ``firmware_update``. Availability
+        changes reach every listener. Returns the unsubscribe callback.
+        """
+        wanted = frozenset(keys)
+
+        @callback
+        def _dispatch() -> None:
+            changed = self._changed_keys
+            hit = wanted if changed is None else wanted & changed
+            if changed is not None and not hit:
+                return
+            for key in hit:
+                self._key_dispatches[key] = self._key_dispatches.get(key, 0) + 1
+            update_callback()
+
+        return self.async_add_listener(_dispatch, context)
+
+    def _command_fingerprint(self, snapshot: DeviceSnapshot) -> tuple[Any, ...]:
+        # Entities also render the last command and whether it is recent.
+        return tuple(
+            (sash, self._last_cmd_by_sash.get(sash), self.is_recent_cmd(sash))
+            for sash in snapshot.sashes
+        )
+
+    @property
+    def suppressed_updates(self) -> int:
+        """Number of updates that did not reach listeners because nothing changed."""
+        return self._suppressed_updates
+
+    def stats(self) -> dict[str, Any]:
+        """Return coordinator-side counters for diagnostics."""
+        return {
+            "snapshot_version": self.snapshot.version,
+            "notified_updates": self._notified_updates,
+            "suppressed_updates": self._suppressed_updates,
+            "key_dispatches": dict(sorted(self._key_dispatches.items())),
+            "polls_total": self._polls_total,
+            "poll_retries": self._poll_retries,
+            "polls_last_hour": self.polls_last_hour(),
+            "push_only": self.push_only,
+            "push_only_active": self.push_only and self._pushes_active,
+            "watchdog_verifications": self._watchdog_verifications,
+            "watchdog_fallbacks": self._watchdog_fallbacks,
+            "motion": self._motion.stats(),
+            "schedule": {
+                "state": self._schedule_state,
+                "time_in_state": round(self.time_in_state, 3),
+                "update_interval": self.update_interval.total_seconds() if self.update_interval else None,
+                "transitions": list(self._schedule_transitions),
+            },
+            "poll_phase": self._poll_phase_stats(),
+            "setup": dict(self.setup_timing),
+            "device_cache": {
+                "seeded": self._seeded_from_cache,
+                "age": round(age, 1) if (age := self.cache_age) is not None else None,
+            },
+        }
+
+    def _poll_phase_stats(self) -> dict[str, Any] | None:
+        if self.poll_scheduler is None:
+            return None
+        stats = self.poll_scheduler.device_stats(self.entry.entry_id)
+        if stats is not None and self.update_interval:
+            stats["phase_offset"] = round(stats["phase"] * self.update_interval.total_seconds(), 3)
+        return stats
+
+    def _record_poll(self) -> None:
+        self._polls_total += 1
+        self._poll_times.append(time.monotonic())
+        self._motion.note_poll()
+        self.polls_last_hour()
+
+    def polls_last_hour(self) -> int:
+        """Return how many getDeviceParams polls were sent in the last hour."""
+        cutoff = time.monotonic() - 3600
+        times = self._poll_times
+        while times and times[0] < cutoff:
+            times.popleft()
+        return len(times)
+
     def device_identifier(self) -> str:
         """Return the stable identifier (serial preferred) for entities."""
         return self.serial or self.entry.unique_id or self.host
@@ -217,42 +483,90 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         entity_id: str | None = None,
         context: Context | None = None,
     ) -> None:
-        cmd = str(command).strip().upper()
+        await self._async_dispatch_commands(
+            {sash: str(command).strip().upper()},
+            source=source,
+            entity_id=entity_id,
+            context=context,
+        )
+
+    async def async_send_commands(
+        self,
+        commands: Mapping[int, str],
+        *,
+        source: str,
+        entity_id: str | None = None,
+        context: Context | None = None,
+    ) -> None:
+        """Send commands for several sashes in one round trip.
+
+        Every command must be in ``VALID_COMMANDS``. With ``prevent_opening``
+        the whole batch is rejected if any command would open a sash.
+        """
+        cmds = {int(sash): str(command).strip().upper() for sash, command in commands.items()}
+        if not cmds:
+            raise ServiceValidationError("No Siegenia sash commands given")
+        invalid = sorted({cmd for cmd in cmds.values() if cmd not in VALID_COMMANDS})
+        if invalid:
+            raise ServiceValidationError(f"Invalid Siegenia command(s): {', '.join(invalid)}")
+        await self._async_dispatch_commands(cmds, source=source, entity_id=entity_id, context=context)
+
+    async def _async_dispatch_commands(
+        self,
+        cmds: dict[int, str],
+        *,
+        source: str,
+        entity_id: str | None,
+        context: Context | None,
+    ) -> None:
         user_name = await self._context_user_name(context)
         origin = self._context_origin(context)
-        if self.prevent_opening and is_opening_command(cmd):
-            self.logger.warning(
-                "Blocked opening command %s (sash %s) from %s due to prevent_opening option",
-                cmd,
-                sash,
-                source,
-            )
+        blocked = {sash: cmd for sash, cmd in cmds.items() if self.prevent_opening and is_opening_command(cmd)}
+        if blocked:
+            for sash, cmd in blocked.items():
+                self.logger.warning(
+                    "Blocked opening command %s (sash %s) from %s due to prevent_opening option",
+                    cmd,
+                    sash,
+                    source,
+                )
+                self._emit_command_event(
+                    command=cmd,
+                    sash=sash,
+                    source=source,
+                    blocked=True,
+                    entity_id=entity_id,
+                    context=context,
+                    user_name=user_name,
+                    origin=origin,
+                )
+                self._log_command(cmd, sash, source, entity_id, blocked=True, user_name=user_name)
+            raise HomeAssistantError("Opening commands are disabled in Siegenia options.")
+        if len(cmds) == 1:
+            ((sash, cmd),) = cmds.items()
+            action = self.client.stop(sash) if cmd == "STOP" else self.client.open_close(sash, cmd)
+            action_name = f"send {cmd}"
+        else:
+            action = self.client.open_close_many(cmds)
+            action_name = "send " + ", ".join(f"{cmd} (sash {sash})" for sash, cmd in cmds.items())
+        await self.async_run_device_action(action, action_name=action_name)
+        now = time.monotonic()
+        for sash, cmd in cmds.items():
+            self.set_last_cmd(sash, cmd)
+            target = COMMAND_TO_STATE.get(cmd)
+            if target is not None:
+                self._motion.start(sash, self.snapshot.state(sash), target, now)
             self._emit_command_event(
                 command=cmd,
                 sash=sash,
                 source=source,
-                blocked=True,
+                blocked=False,
                 entity_id=entity_id,
                 context=context,
                 user_name=user_name,
                 origin=origin,
             )
-            self._log_command(cmd, sash, source, entity_id, blocked=True, user_name=user_name)
-            raise HomeAssistantError("Opening commands are disabled in Siegenia options.")
-        action = self.client.stop(sash) if cmd == "STOP" else self.client.open_close(sash, cmd)
-        await self.async_run_device_action(action, action_name=f"send {cmd}")
-        self.set_last_cmd(sash, cmd)
-        self._emit_command_event(
-            command=cmd,
-            sash=sash,
-            source=source,
-            blocked=False,
-            entity_id=entity_id,
-            context=context,
-            user_name=user_name,
-            origin=origin,
-        )
-        self._log_command(cmd, sash, source, entity_id, blocked=False, user_name=user_name)
+            self._log_command(cmd, sash, source, entity_id, blocked=False, user_name=user_name)
 
     async def async_run_device_action(
         self,
@@ -367,6 +681,9 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise asyncio.CancelledError
         if self.client.connected:
             return
+        if getattr(self.client, "reconnecting", False) is True:
+            # The client is already reconnecting with backoff; don't stack attempts.
+            raise UpdateFailed("Reconnecting to the Siegenia device")
         try:
             await self._async_connect_client()
         except AuthenticationError as exc:
@@ -403,13 +720,37 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await self.client.connect()
         if self._stopping:
             raise asyncio.CancelledError
-        await self.client.login(self.username, self.password)
+        await self._async_login()
         if self._stopping:
             raise asyncio.CancelledError
         await self.client.start_heartbeat(self.heartbeat_interval)
         if self._stopping:
             raise asyncio.CancelledError
 
+    async def _async_login(self) -> None:
+        """Log in, reusing a cached long-life session when the option is on."""
+        if not self.long_life_session:
+            await self.client.login(self.username, self.password)
+            return
+        cache = self._session_cache = await async_get_session_cache(self.hass)
+        cached = cache.get(self.serial) if self.serial else None
+        established = (cached or {}).get("established")
+        resume = getattr(self.client, "resume_session", None)
+        if (
+            callable(resume)
+            and isinstance(established, (int, float))
+            and 0 <= time.time() - established < LONG_LIFE_SESSION_MAX_AGE
+        ):
+            resume(self.username, self.password)
+            return
+        await self.client.login(self.username, self.password, long_life=True)
+        self._store_session_info(cache)
+
+    def _store_session_info(self, cache: SiegeniaSessionCache) -> None:
+        info = getattr(self.client, "session_info", None)
+        if self.serial and isinstance(info, dict) and info.get("established") is not None:
+            cache.async_set(self.serial, info)
+
     async def async_shutdown(self) -> None:
         """Stop coordinator refreshes, connections, and rediscovery."""
         self._stopping = True
@@ -434,9 +775,41 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._connection_task = None
             if self._rediscovery_task is rediscovery_task:
                 self._rediscovery_task = None
+            self._cancel_schedule_timer()
             await self.client.disconnect()
+            await self.async_stop_capture()
             self._shutdown_complete = True
 
+    async def async_start_capture(self, *, compress: bool = True, max_bytes: int = DEFAULT_CAPTURE_MAX_BYTES) -> str:
+        """Record redacted WebSocket frames to a rotating file; return its path."""
+        await self.async_stop_capture()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{self.device_serial()}-{stamp}.jsonl" + (".gz" if compress else "")
+        path = self.hass.config.path(CAPTURE_DIR, name)
+        self._capture = FrameCapture(
+            path,
+            max_bytes=max_bytes,
+            compress=compress,
+            meta={"serial": self.device_serial()},
+        )
+        set_capture = getattr(self.client, "set_capture", None)
+        if callable(set_capture):
+            set_capture(self._capture)
+        self.logger.info("Capturing Siegenia traffic to %s", path)
+        return path
+
+    async def async_stop_capture(self) -> str | None:
+        """Stop an active capture and flush it; return the file path."""
+        capture = self._capture
+        if capture is None:
+            return None
+        self._capture = None
+        set_capture = getattr(self.client, "set_capture", None)
+        if callable(set_capture):
+            set_capture(None)
+        await capture.async_close()
+        return str(capture.path)
+
     async def _disconnect_after_connection_failure(self) -> None:
         """Close a partially connected client without hiding the original error."""
         try:
@@ -604,6 +977,17 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await asyncio.gather(*tasks, return_exceptions=True)
         return found
 
+    def _probe_timeout(self) -> float:
+        """Scale probe deadlines with the RTT observed on the main connection."""
+        timeout_for = getattr(self.client, "timeout_for", None)
+        if not callable(timeout_for):
+            return PROBE_TIMEOUT
+        try:
+            timeout = float(timeout_for("getDeviceParams", PROBE_TIMEOUT))
+        except Exception:  # noqa: BLE001
+            return PROBE_TIMEOUT
+        return max(PROBE_TIMEOUT_MIN, min(PROBE_TIMEOUT_MAX, timeout))
+
     async def _probe_host(self, host: str) -> str | None:
         if self._stopping:
             return None
@@ -614,7 +998,7 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             port=self.port,
             ws_protocol=self.ws_protocol,
             session=self.session,
-            response_timeout=PROBE_TIMEOUT,
+            response_timeout=self._probe_timeout(),
             logger=self.logger.debug,
             verify_ssl=self.verify_ssl,
         )
@@ -664,12 +1048,20 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             session=self.session,
             logger=self.logger.debug,
             verify_ssl=self.verify_ssl,
+            auto_reconnect=True,
+            replay_requests=True,
+            response_timeout=RESPONSE_TIMEOUT_CEILING,
+            adaptive_timeouts=True,
+            timeout_floor=RESPONSE_TIMEOUT_FLOOR,
+            capture=self._capture,
         )
         if self._push_callback:
             try:
-                self.client.set_push_callback(self._push_callback)
+                self._bind_push_callback()
             except Exception:
                 self.logger.debug("Failed to rebind push callback after host switch")
+        self._client_state = None
+        self._watch_client_connection()
         # Ensure we still have a serial cached
         if self.serial:
             self._update_serial(self.serial)
@@ -688,6 +1080,7 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         await self._clear_issue()
 
     async def async_setup(self) -> None:
+        await self._async_load_motion_profiles()
         try:
             await self._async_connect_client()
         except AuthenticationError as exc:
@@ -704,25 +1097,102 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Exception as exc:  # noqa: BLE001
             self.logger.debug("Failed to get device info during setup: %s", exc)
 
+    async def async_load_device_cache(self) -> bool:
+        """Seed device info and the last params from the persistent device cache.
+
+        Returns True if cached params were applied. Both are refreshed once
+        the device answers a poll.
+        """
+        cache = self._device_cache = await async_get_device_cache(self.hass)
+        cached = cache.get(self.serial) if self.serial else None
+        if not cached:
+            return False
+        self._device_cache_updated = cached.get("updated")
+        info = cached.get("device_info")
+        params = cached.get("params")
+        if isinstance(info, dict) and self.device_info is None:
+            self.device_info = info
+        if isinstance(params, dict) and self.data is None:
+            self.data = params
+            self._seeded_from_cache = True
+        return self._seeded_from_cache
+
+    @property
+    def cache_age(self) -> float | None:
+        """Seconds since the cached device info and params were last written."""
+        if self._device_cache_updated is None:
+            return None
+        return max(0.0, time.time() - self._device_cache_updated)
+
+    def _store_device_cache(self, params: dict[str, Any]) -> None:
+        cache = self._device_cache
+        if cache is None or not self.serial:
+            return
+        # Every response carries a fresh request id; cache (and compare) only
+        # the payload so unchanged polls do not rewrite the shared store.
+        params = _without_request_id(params)
+        device_info = _without_request_id(self.device_info)
+        cached = cache.get(self.serial) or {}
+        if cached.get("params") == params and cached.get("device_info") == device_info:
+            return
+        self._device_cache_updated = time.time()
+        cache.async_set(
+            self.serial,
+            {"device_info": device_info, "params": params, "updated": self._device_cache_updated},
+        )
+
+    async def _async_load_motion_profiles(self) -> None:
+        store = self._motion_profiles = await async_get_motion_profiles(self.hass)
+        if self.serial:
+            self._motion.load((store.get(self.serial) or {}).get("transitions"))
+
+    def _observe_motion(self, snapshot: DeviceSnapshot, *, pushed: bool = False) -> None:
+        learned = self._motion.observe(
+            snapshot.states,
+            time.monotonic(),
+            self._motion_interval.total_seconds(),
+            pushed=pushed,
+        )
+        if not self._motion.active:
+            self._motion_followup_sent = False
+        if learned and self._motion_profiles is not None and self.serial:
+            self._motion_profiles.async_set(self.serial, {"transitions": dict(self._motion.profiles)})
+
+    def _motion_poll_interval(self) -> timedelta:
+        """Poll at the predicted end of travel, then once more shortly after.
+
+        Without a learned travel time this is the flat motion interval.
+        """
+        end = self._motion.predicted_end()
+        if end is None:
+            return self._motion_interval
+        remaining = end - time.monotonic()
+        if remaining > 0:
+            return timedelta(seconds=max(remaining, 1.0))
+        if not self._motion_followup_sent:
+            self._motion_followup_sent = True
+            return timedelta(seconds=MOTION_CONFIRM_DELAY)
+        # Slower than predicted: back to regular motion polling.
+        return self._motion_interval
+
     async def _async_update_data(self) -> dict[str, Any]:
         attempts = 0
         while attempts < 2:
             try:
                 await self._ensure_connected()
-                params = await self.client.get_device_params()
-                self._adjust_interval(params)
-                self._maybe_log_states(params, source="poll")
-                # Check warnings on polled data too
-                self._handle_warnings(params)
+                async with self._poll_slot():
+                    # A retry after reconnecting is part of the same poll.
+                    if attempts:
+                        self._poll_retries += 1
+                    else:
+                        self._record_poll()
+                    params = await self.client.get_device_params()
+                self._process_poll(params)
+                self._store_device_cache(params)
                 await self._clear_issue()
-                # Track last stable states per sash for UX when MOVING without a recent command
-                try:
-                    states = ((params or {}).get("data") or {}).get("states") or {}
-                    for k, v in states.items():
-                        if v and v != "MOVING":
-                            self._last_stable_state_by_sash[int(k)] = v
-                except Exception:
-                    pass
+                if self._session_cache is not None:
+                    # A resumed session may have fallen back to a fresh login.
+                    self._store_session_info(self._session_cache)
                 return params
             except ConfigEntryAuthFailed:
                 raise
@@ -734,35 +1204,32 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     attempts += 1
                     continue
                 await self._raise_issue()
+                self._record_poll_failure()
                 raise UpdateFailed(err) from err
         # Should not reach here
         raise UpdateFailed("Failed after retry")
 
+    def _process_poll(self, params: dict[str, Any]) -> None:
+        """Apply a polled getDeviceParams response (also used by capture replay)."""
+        snapshot = self._parse_snapshot(params)
+        self._observe_motion(snapshot)
+        self._adjust_interval()
+        self._maybe_log_states(params, source="poll")
+        # Check warnings on polled data too
+        self._handle_warnings(params)
+        # Track last stable states per sash for UX when MOVING without a recent command
+        for sash, state in snapshot.states.items():
+            if state and state != "MOVING":
+                self._last_stable_state_by_sash[sash] = state
+
     def _handle_push_update(self, msg: dict[str, Any]) -> None:
         # Mark push as active; slow down poller while push is flowing
         self._last_push_monotonic = time.monotonic()
-        # Prefer motion interval if moving; else push interval
+        self._pushes_active = True
+        self._failed_polls = 0
+        self._arm_schedule_timer()
         states_map = (msg.get("data") or {}).get("states", {})
         self._maybe_log_states(msg, source="push")
-        moving = any(v == "MOVING" for v in states_map.values())
-        if moving:
-            self.update_interval = self._motion_interval
-        else:
-            self.update_interval = self._push_interval
-
-        # schedule revert after idle timeout
-        if self._revert_handle is not None:
-            self._revert_handle()  # cancel
-            self._revert_handle = None
-
-        def _revert(_now):  # noqa: ANN001
-            if self._last_push_monotonic and (time.monotonic() - self._last_push_monotonic) >= self._push_idle_timeout:
-                self.update_interval = self._default_interval
-                self._revert_handle = None
-            else:
-                self._revert_handle = async_call_later(self.hass, self._push_idle_timeout, _revert)
-
-        self._revert_handle = async_call_later(self.hass, self._push_idle_timeout, _revert)
         # Merge push payload into last known params to avoid losing keys (e.g., timer)
         merged = self.data or {}
         try:
@@ -778,6 +1245,9 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 merged = md
         except Exception:
             merged = msg
+        self._push_snapshot = self._parse_snapshot(merged)
+        self._observe_motion(self._push_snapshot, pushed=True)
+        self._update_schedule("push")
         self.async_set_updated_data(merged)
         # Track last stable states
         try:
@@ -812,6 +1282,156 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # and a subsequent sleep(0) will process this event.
         self._handle_warnings(msg)
 
+    # Poll scheduling
+    #
+    # One state machine owns update_interval:
+    #   offline_backoff  polls failed; back off from the base interval
+    #   motion           a sash moves; poll at the predicted end (or motion interval)
+    #   push_active      pushes arrive; slow polling (none in push-only mode)
+    #   idle             nothing happening; idle interval
+    # Its only timer fires when pushes go quiet.
+
+    @property
+    def schedule_state(self) -> str:
+        return self._schedule_state
+
+    @property
+    def time_in_state(self) -> float:
+        """Seconds since the last scheduling state change."""
+        return time.monotonic() - self._schedule_since
+
+    def _update_schedule(self, reason: str) -> None:
+        """Derive the scheduling state from current facts and apply its interval."""
+        if self._failed_polls:
+            state = SCHEDULE_OFFLINE
+        elif self._snapshot.moving:
+            state = SCHEDULE_MOTION
+        elif self._pushes_active:
+            state = SCHEDULE_PUSH
+        else:
+            state = SCHEDULE_IDLE
+        previous = self._schedule_state
+        if state != previous:
+            now = time.monotonic()
+            self._schedule_transitions.append(
+                {"from": previous, "to": state, "reason": reason, "after": round(now - self._schedule_since, 3)}
+            )
+            self._schedule_state = state
+            self._schedule_since = now
+            if self.push_only and self._pushes_active and previous in (SCHEDULE_IDLE, SCHEDULE_OFFLINE):
+                self.logger.debug("Pushes are flowing; suspending polls for %s", self.host)
+        self.update_interval = self._interval_for(state)
+
+    def _interval_for(self, state: str) -> timedelta | None:
+        if state == SCHEDULE_OFFLINE:
+            backoff = self._default_interval * 2 ** min(self._failed_polls - 1, 8)
+            return min(backoff, max(self._default_interval, timedelta(seconds=OFFLINE_BACKOFF_MAX)))
+        if self.push_only and self._pushes_active:
+            return None
+        if state == SCHEDULE_MOTION:
+            return self._motion_poll_interval()
+        if state == SCHEDULE_PUSH:
+            return self._push_interval
+        return self._idle_interval
+
+    def _poll_slot(self) -> AbstractAsyncContextManager[Any]:
+        if self.poll_scheduler is None:
+            return nullcontext()
+        return self.poll_scheduler.slot(self.entry.entry_id)
+
+    def _schedule_refresh(self) -> None:
+        if self.awaiting_connect:
+            # The background setup refreshes (and schedules) once admitted.
+            return
+        super()._schedule_refresh()
+        if self.poll_scheduler is None or self._unsub_refresh is None or not self.update_interval:
+            return
+        if self._schedule_state == SCHEDULE_MOTION:
+            # Motion polls are timed to the predicted end of travel.
+            return
+        # Move the next poll onto this device's phase so devices sharing an
+        # interval do not poll together. Like the base class, this relies on
+        # DataUpdateCoordinator's private _unsub_refresh handle and
+        # _handle_refresh_interval entry point.
+        self._unsub_refresh()
+        loop = self.hass.loop
+        delay = self.poll_scheduler.next_delay(
+            self.entry.entry_id, self.update_interval.total_seconds(), loop.time()
+        )
+        self._unsub_refresh = loop.call_later(delay, self._on_phased_refresh).cancel
+
+    @callback
+    def _on_phased_refresh(self) -> None:
+        # Entry-bound, as in the base class, so unloading cancels a running poll.
+        self.entry.async_create_background_task(
+            self.hass,
+            self._handle_refresh_interval(),
+            name=f"{self.name} - {self.entry.title} - refresh",
+            eager_start=True,
+        )
+
+    @callback
+    def async_retry_later(self, err: Exception) -> None:
+        """Mark the device unreachable and leave the retry to the next scheduled poll."""
+        self.async_set_update_error(err)
+        self._record_poll_failure()
+        self._schedule_refresh()
+
+    def _record_poll_failure(self) -> None:
+        self._failed_polls += 1
+        self._update_schedule("poll_failed")
+
+    def _arm_schedule_timer(self) -> None:
+        self._cancel_schedule_timer()
+        delay = self.push_watchdog if self.push_only else self._push_idle_timeout
+        self._schedule_timer = async_call_later(self.hass, delay, self._on_push_silence)
+
+    def _cancel_schedule_timer(self) -> None:
+        if self._schedule_timer is not None:
+            self._schedule_timer()
+            self._schedule_timer = None
+
+    @callback
+    def _on_push_silence(self, _now: Any) -> None:
+        self._schedule_timer = None
+        if self._stopping or not self._pushes_active:
+            return
+        if self.push_only:
+            self.hass.async_create_task(self._async_verify_push_silence())
+            return
+        self._pushes_active = False
+        self._update_schedule("push_silence")
+
+    async def _async_verify_push_silence(self) -> None:
+        """No push within the window: poll once and compare with the last push.
+
+        A quiet device is normal while nothing moves, so a check that finds
+        the pushed values unchanged keeps polling suspended for another
+        window. If the check fails, or finds values no push reported, pushes
+        are not trustworthy and normal polling resumes.
+        """
+        self._watchdog_verifications += 1
+        pushed = self._push_snapshot
+        await self.async_refresh()
+        if self._stopping or not self._pushes_active:
+            return
+        if not self.last_update_success:
+            self.logger.debug("Push watchdog check failed for %s; resuming polls", self.host)
+            self._pushes_active = False
+            self._watchdog_fallbacks += 1
+            # The failed check already scheduled the next poll at the backoff interval.
+            self._update_schedule("watchdog_failed")
+            return
+        if pushed is None or self.snapshot.same_values(pushed):
+            self._arm_schedule_timer()
+            return
+        self.logger.debug("Push watchdog found changes no push reported for %s; resuming polls", self.host)
+        self._pushes_active = False
+        self._watchdog_fallbacks += 1
+        self._update_schedule("watchdog_stale")
+        # The check ran with polling suspended, so nothing is scheduled yet.
+        self._schedule_refresh()
+
     def _log_manual_operation(self, sash: int) -> None:
         try:
             serial = ((self.device_info or {}).get("data", {}) or {}).get("serialnr") or self.host
@@ -832,28 +1452,10 @@ class SiegeniaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Exception:
             pass
 
-    def _adjust_interval(self, payload: dict[str, Any]) -> None:
-        data = (payload or {}).get("data") or {}
-        states = (data.get("states") or {}).values()
-        if any(s == "MOVING" for s in states):
-            # Speed up while moving
-            self.update_interval = self._motion_interval
-            # schedule a revert after short delay if motion stops
-            if self._motion_revert_handle is not None:
-                self._motion_revert_handle()
-                self._motion_revert_handle = None
-
-            def _revert(_now):  # noqa: ANN001
-                # If not moving anymore, go to idle interval
-                self.update_interval = self._idle_interval
-                self._motion_revert_handle = None
-
-            from homeassistant.helpers.event import async_call_later as _later
-
-            self._motion_revert_handle = _later(self.hass, 10, _revert)
-        else:
-            # Idle: lengthen
-            self.update_interval = self._idle_interval
+    def _adjust_interval(self) -> None:
+        """Re-evaluate the scheduling state after a successful poll."""
+        self._failed_polls = 0
+        self._update_schedule("poll")
 
     def _maybe_log_states(self, payload: dict[str, Any], *, source: str) -> None:
         if not (self.debug_logging or self.informational_logging):
@@ -10,9 +10,10 @@ from homeassistant.components.cover import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import SiegeniaConfigEntry
+from .entity import SiegeniaCoordinatorEntity
+from .snapshot import state_key
 from .const import (
     CMD_CLOSE,
     DOMAIN,
@@ -36,16 +37,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     coordinator = hass.data[DOMAIN][entry.entry_id]
     known_sashes: set[int] = set()
 
-    def _current_sashes() -> list[int]:
-        data = coordinator.data or {}
-        states = (data.get("data") or {}).get("states") or {}
-        if not states:
-            return [0]
-        return sorted(map(int, states.keys()))
-
     def _add_missing() -> None:
         new_entities = []
-        for sash in _current_sashes():
+        for sash in coordinator.snapshot.sashes:
             if sash in known_sashes:
                 continue
             known_sashes.add(sash)
@@ -57,7 +51,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entry.async_on_unload(coordinator.async_add_listener(_add_missing))
 
 
-class SiegeniaWindowCover(CoordinatorEntity, CoverEntity):
+class SiegeniaWindowCover(SiegeniaCoordinatorEntity, CoverEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "window"
     _attr_device_class = "window"
@@ -76,6 +70,10 @@ class SiegeniaWindowCover(CoordinatorEntity, CoverEntity):
         enable_slider = entry.options.get("enable_position_slider", True)
         self._attr_supported_features = self._with_slider if enable_slider else self._base_features
 
+    @property
+    def listen_keys(self) -> tuple[str, ...]:
+        return (state_key(self._sash),)
+
     @property
     def device_info(self) -> DeviceInfo:
         info = (self.coordinator.device_info or {}).get("data", {})
@@ -102,10 +100,7 @@ class SiegeniaWindowCover(CoordinatorEntity, CoverEntity):
         return super().available and self.coordinator.last_update_success
 
     def _current_state(self) -> str | None:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        states = data.get("states") or {}
-        return states.get(str(self._sash))
+        return self.coordinator.snapshot.state(self._sash)
 
     @property
     def is_closed(self) -> bool | None:
@@ -5,7 +5,7 @@ import logging
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
-from .const import DOMAIN
+from .const import DOMAIN, resolve_model
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,3 +55,31 @@ async def async_merge_devices(
             dev_reg.async_remove_device(dev.id)
         except Exception as exc:  # noqa: BLE001
             _LOGGER.debug("Failed to remove device %s: %s", dev.id, exc)
+
+
+def async_update_device_details(
+    hass: HomeAssistant,
+    identifier: str,
+    device_info: dict | None,
+) -> None:
+    """Refresh name, model and versions of a registered device from getDevice data.
+
+    Entities only report their device info when they are added, so a device
+    that connects after its platforms were set up is updated here.
+    """
+    info = (device_info or {}).get("data") or {}
+    if not info:
+        return
+    dev_reg = dr.async_get(hass)
+    device = dev_reg.async_get_device(identifiers={(DOMAIN, identifier)})
+    if device is None:
+        return
+    changes = {
+        "model": str(resolve_model(info)),
+        "name": info.get("devicename") or device.name,
+        "sw_version": info.get("softwareversion") or device.sw_version,
+        "hw_version": info.get("hardwareversion") or device.hw_version,
+    }
+    changes = {key: value for key, value in changes.items() if getattr(device, key) != value}
+    if changes:
+        dev_reg.async_update_device(device.id, **changes)
@@ -15,6 +15,8 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    client_stats = getattr(coordinator.client, "stats", None)
+    coordinator_stats = getattr(coordinator, "stats", None)
     return async_redact_data(
         {
             "entry": {
@@ -23,6 +25,8 @@ async def async_get_config_entry_diagnostics(
             },
             "device_info": coordinator.device_info,
             "last_params": coordinator.data,
+            "client_stats": client_stats() if callable(client_stats) else None,
+            "coordinator_stats": coordinator_stats() if callable(coordinator_stats) else None,
         },
         TO_REDACT,
     )
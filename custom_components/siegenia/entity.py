@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from homeassistant.helpers.update_coordinator import BaseCoordinatorEntity, CoordinatorEntity
+
+
+class SiegeniaCoordinatorEntity(CoordinatorEntity):
+    """Coordinator entity that only updates when its slice of the data changes.
+
+    Subclasses list the snapshot keys they render in ``_listen_keys`` (or
+    override ``listen_keys``); an empty list means availability changes only.
+    """
+
+    _listen_keys: tuple[str, ...] = ()
+
+    @property
+    def listen_keys(self) -> tuple[str, ...]:
+        return self._listen_keys
+
+    async def async_added_to_hass(self) -> None:
+        # Skip CoordinatorEntity's catch-all listener in favour of a keyed one.
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_keyed_listener(
+                self.listen_keys,
+                self._handle_coordinator_update,
+                self.coordinator_context,
+            )
+        )
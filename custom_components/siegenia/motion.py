@@ -0,0 +1,177 @@
+"""Learn sash travel times and predict when a motion ends."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    MOTION_MAX_DURATION,
+    MOTION_PROFILE_ALPHA,
+    MOTION_START_GRACE,
+    STATE_MOVING,
+)
+
+
+def transition_key(sash: int, from_state: str, to_state: str) -> str:
+    return f"{int(sash)}:{from_state}->{to_state}"
+
+
+class _Run:
+    __slots__ = ("from_state", "target", "started", "predicted", "seen_moving", "last_moving")
+
+    def __init__(self, from_state: str | None, target: str | None, started: float, predicted: float | None) -> None:
+        self.from_state = from_state
+        self.target = target
+        self.started = started
+        self.predicted = predicted
+        self.seen_moving = False
+        self.last_moving: float | None = None
+
+
+class MotionPredictor:
+    """Per-sash travel times learned from observed state changes.
+
+    A run starts when a command is sent (``start``) or when a sash is first
+    seen ``MOVING``, and ends at the next stable state. Its duration updates
+    an exponentially weighted mean for that ``FROM->TO`` transition.
+
+    A push reports the end as it happens. A poll only shows that travel
+    ended somewhere since the last ``MOVING`` observation, so such a run
+    counts the midpoint of that gap, and only when no prediction timed the
+    polls: a sparse poll at the predicted end could never see a run
+    shorter than predicted, which would only ever lengthen the mean.
+    ``profiles`` holds ``{"mean": seconds, "samples": n}`` per transition key
+    and is what the coordinator persists.
+    """
+
+    def __init__(self, profiles: Mapping[str, Mapping[str, Any]] | None = None) -> None:
+        self.profiles: dict[str, dict[str, Any]] = {}
+        self.load(profiles)
+        self._runs: dict[int, _Run] = {}
+        self._last: dict[int, str] = {}
+        self._episode_started: float | None = None
+        self._episode_polls = 0
+        self.completed = 0
+        self.predicted_runs = 0
+        self.abs_error_total = 0.0
+        self.last_error: float | None = None
+        self.polls_saved = 0
+
+    def load(self, profiles: Mapping[str, Mapping[str, Any]] | None) -> None:
+        for key, profile in (profiles or {}).items():
+            try:
+                mean = float(profile["mean"])
+                samples = int(profile.get("samples", 1))
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 < mean <= MOTION_MAX_DURATION:
+                self.profiles[key] = {"mean": mean, "samples": max(1, samples)}
+
+    @property
+    def active(self) -> bool:
+        return bool(self._runs)
+
+    def expected(self, sash: int, from_state: str | None, target: str | None) -> float | None:
+        """Return the learned duration for a transition, or None if unknown."""
+        if from_state is None:
+            return None
+        if target is not None:
+            profile = self.profiles.get(transition_key(sash, from_state, target))
+            return profile["mean"] if profile else None
+        # Manual motion: the target is unknown, so assume the longest known travel.
+        prefix = f"{int(sash)}:{from_state}->"
+        means = [p["mean"] for key, p in self.profiles.items() if key.startswith(prefix)]
+        return max(means) if means else None
+
+    def start(self, sash: int, from_state: str | None, target: str | None, now: float) -> None:
+        """Start a run for a command sent to ``sash``."""
+        if from_state == STATE_MOVING:
+            from_state = self._runs[sash].from_state if sash in self._runs else None
+        self._begin(sash, from_state, target, now)
+
+    def _begin(self, sash: int, from_state: str | None, target: str | None, now: float) -> None:
+        if not self._runs:
+            self._episode_started = now
+            self._episode_polls = 0
+        self._runs[sash] = _Run(from_state, target, now, self.expected(sash, from_state, target))
+
+    def note_poll(self) -> None:
+        if self._runs:
+            self._episode_polls += 1
+
+    def observe(
+        self,
+        states: Mapping[int, str],
+        now: float,
+        motion_interval: float,
+        *,
+        pushed: bool = False,
+    ) -> bool:
+        """Feed the latest sash states; return True if a profile was learned.
+
+        ``pushed`` marks states the device pushed, whose stable states are
+        the actual end of travel.
+        """
+        learned = False
+        for sash, state in states.items():
+            run = self._runs.get(sash)
+            if state == STATE_MOVING:
+                if run is None:
+                    previous = self._last.get(sash)
+                    self._begin(sash, previous if previous != STATE_MOVING else None, None, now)
+                    run = self._runs[sash]
+                run.seen_moving = True
+                run.last_moving = now
+            elif run is not None:
+                if run.seen_moving:
+                    learned |= self._finish(sash, run, state, now, pushed)
+                elif now - run.started > MOTION_START_GRACE:
+                    # The command never produced motion (e.g. already at target).
+                    del self._runs[sash]
+            self._last[sash] = state
+        if self._episode_started is not None and not self._runs:
+            baseline = math.ceil((now - self._episode_started) / max(motion_interval, 0.1))
+            self.polls_saved += max(0, baseline - self._episode_polls)
+            self._episode_started = None
+        return learned
+
+    def _finish(self, sash: int, run: _Run, state: str, now: float, pushed: bool) -> bool:
+        del self._runs[sash]
+        ended = now if pushed or run.last_moving is None else (run.last_moving + now) / 2
+        duration = ended - run.started
+        self.completed += 1
+        if run.predicted is not None:
+            self.last_error = duration - run.predicted
+            self.abs_error_total += abs(self.last_error)
+            self.predicted_runs += 1
+        if not pushed and run.predicted is not None:
+            return False
+        if run.from_state is None or not (0 < duration <= MOTION_MAX_DURATION):
+            return False
+        key = transition_key(sash, run.from_state, state)
+        profile = self.profiles.get(key)
+        if profile is None:
+            self.profiles[key] = {"mean": round(duration, 3), "samples": 1}
+        else:
+            mean = profile["mean"] + MOTION_PROFILE_ALPHA * (duration - profile["mean"])
+            self.profiles[key] = {"mean": round(mean, 3), "samples": profile["samples"] + 1}
+        return True
+
+    def predicted_end(self) -> float | None:
+        """Return when every running sash should have settled, if all are predicted."""
+        if not self._runs or any(run.predicted is None for run in self._runs.values()):
+            return None
+        return max(run.started + run.predicted for run in self._runs.values())
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "profiles": dict(sorted(self.profiles.items())),
+            "active_runs": len(self._runs),
+            "completed_runs": self.completed,
+            "predicted_runs": self.predicted_runs,
+            "mean_abs_error": round(self.abs_error_total / self.predicted_runs, 3) if self.predicted_runs else None,
+            "last_error": round(self.last_error, 3) if self.last_error is not None else None,
+            "polls_saved": self.polls_saved,
+        }
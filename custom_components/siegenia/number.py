@@ -3,9 +3,10 @@ from __future__ import annotations
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import SiegeniaCoordinatorEntity
+from .snapshot import KEY_STOPOVER
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:  # type: ignore[no-untyped-def]
@@ -13,11 +14,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities([SiegeniaStopoverNumber(coordinator, entry)])
 
 
-class SiegeniaStopoverNumber(CoordinatorEntity, NumberEntity):
+class SiegeniaStopoverNumber(SiegeniaCoordinatorEntity, NumberEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "stopover_distance"
     _attr_mode = "slider"
     _attr_native_unit_of_measurement = "dm"
+    _listen_keys = (KEY_STOPOVER,)
 
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
@@ -32,8 +34,7 @@ class SiegeniaStopoverNumber(CoordinatorEntity, NumberEntity):
 
     @property
     def native_max_value(self) -> float:
-        data = (self.coordinator.data or {}).get("data", {})
-        max_so = data.get("max_stopover")
+        max_so = self.coordinator.snapshot.max_stopover
         return float(max_so) if max_so is not None else 20.0
 
     @property
@@ -42,8 +43,7 @@ class SiegeniaStopoverNumber(CoordinatorEntity, NumberEntity):
 
     @property
     def native_value(self) -> float | None:
-        data = (self.coordinator.data or {}).get("data", {})
-        val = data.get("stopover")
+        val = self.coordinator.snapshot.stopover
         return float(val) if val is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from .api import replay_frames
+from .const import PUSH_COMMANDS
+
+if TYPE_CHECKING:
+    from .coordinator import SiegeniaDataUpdateCoordinator
+
+
+async def async_replay_capture(
+    coordinator: SiegeniaDataUpdateCoordinator,
+    records: Iterable[dict[str, Any]],
+    *,
+    speed: float | None = 1.0,
+) -> dict[str, int]:
+    """Feed captured device frames into a coordinator without a device.
+
+    Pushes go through the coordinator's push handler; ``getDeviceParams``
+    responses go through the poll path and update the coordinator data.
+    ``speed`` scales the recorded timing (``2.0`` = twice as fast); ``None``
+    replays as fast as possible. Returns how many frames of each kind were fed.
+    """
+    sent_commands: dict[Any, str] = {}
+    counts = {"pushes": 0, "polls": 0, "skipped": 0}
+    async for record in replay_frames(records, speed=speed, direction=None):
+        frame = record.get("frame")
+        if not isinstance(frame, dict):
+            counts["skipped"] += 1
+            continue
+        if record.get("dir") == "send":
+            # Remember which command each request id carried to classify the answer.
+            sent_commands[frame.get("id")] = str(frame.get("command"))
+            continue
+        req_id = frame.get("id")
+        if req_id is None:
+            if frame.get("command") in PUSH_COMMANDS and "data" in frame:
+                coordinator._handle_push_update(frame)
+                counts["pushes"] += 1
+            else:
+                counts["skipped"] += 1
+        elif sent_commands.pop(req_id, None) == "getDeviceParams" and frame.get("status") == "ok":
+            coordinator._process_poll(frame)
+            coordinator.async_set_updated_data(frame)
+            counts["polls"] += 1
+        else:
+            counts["skipped"] += 1
+    return counts
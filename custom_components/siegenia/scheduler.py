@@ -0,0 +1,163 @@
+"""Domain-wide pacing of Siegenia devices: staggered polls and connection admission."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from .const import POLL_MAX_CONCURRENT, POLL_PHASE_JITTER, STARTUP_JITTER, STARTUP_MAX_CONCURRENT
+
+
+def serial_phase(serial: str) -> float:
+    """Return a stable share of the poll interval in [0, 1) for a serial."""
+    return zlib.crc32(serial.encode()) / 2**32
+
+
+class _Device:
+    __slots__ = ("phase", "polls", "queued", "last_delay", "max_delay", "total_delay")
+
+    def __init__(self, phase: float) -> None:
+        self.phase = phase
+        self.polls = 0
+        self.queued = 0
+        self.last_delay = 0.0
+        self.max_delay = 0.0
+        self.total_delay = 0.0
+
+
+class SiegeniaPollScheduler:
+    """Domain-wide poll phasing and concurrency limit.
+
+    Each registered device gets a fixed phase within its poll interval,
+    taken from a hash of its serial plus a little random jitter, so
+    devices sharing an interval do not poll in lockstep. ``slot`` bounds
+    how many ``getDeviceParams`` requests are in flight across all devices
+    and records how long each device waited for one.
+    """
+
+    def __init__(self, max_concurrent: int = POLL_MAX_CONCURRENT, jitter: float = POLL_PHASE_JITTER) -> None:
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._jitter = jitter
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._devices: dict[str, _Device] = {}
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    def register(self, key: str, serial: str) -> float:
+        """Register a device and return its phase (share of the interval)."""
+        phase = (serial_phase(serial) + random.uniform(-self._jitter, self._jitter)) % 1.0
+        self._devices[key] = _Device(phase)
+        return phase
+
+    def unregister(self, key: str) -> None:
+        self._devices.pop(key, None)
+
+    def phase(self, key: str) -> float | None:
+        device = self._devices.get(key)
+        return device.phase if device else None
+
+    def next_delay(self, key: str, interval: float, now: float) -> float:
+        """Return the delay until the device's next phase slot.
+
+        Slots repeat every ``interval`` on the shared ``now`` clock. The delay
+        stays within half an interval of ``interval``, so a device settles
+        onto its slot within one poll without polling much too early or late.
+        """
+        device = self._devices.get(key)
+        if device is None or interval <= 0:
+            return interval
+        target = now - now % interval + device.phase * interval
+        while target < now + interval / 2:
+            target += interval
+        return target - now
+
+    @asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        """Hold one of the fleet-wide poll slots for the duration of a poll."""
+        queued = self._semaphore.locked()
+        queued_at = time.monotonic()
+        async with self._semaphore:
+            self._record_wait(key, time.monotonic() - queued_at if queued else 0.0, queued)
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+
+    def _record_wait(self, key: str, delay: float, queued: bool) -> None:
+        device = self._devices.get(key)
+        if device is None:
+            return
+        device.polls += 1
+        device.last_delay = delay
+        device.total_delay += delay
+        device.max_delay = max(device.max_delay, delay)
+        if queued:
+            device.queued += 1
+
+    def device_stats(self, key: str) -> dict[str, Any] | None:
+        device = self._devices.get(key)
+        if device is None:
+            return None
+        return {
+            "phase": round(device.phase, 4),
+            "polls": device.polls,
+            "queued_polls": device.queued,
+            "last_queue_delay": round(device.last_delay, 3),
+            "max_queue_delay": round(device.max_delay, 3),
+            "mean_queue_delay": round(device.total_delay / device.polls, 3) if device.polls else None,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "devices": len(self._devices),
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+        }
+
+
+class SiegeniaConnectGate:
+    """Domain-wide admission control for the initial device connections.
+
+    At most ``max_concurrent`` entries connect at once. An entry arriving
+    while others connect first sleeps a random jitter, so a burst of
+    entries at startup does not open its TLS sessions in the same instant.
+    """
+
+    def __init__(self, max_concurrent: int = STARTUP_MAX_CONCURRENT, jitter: float = STARTUP_JITTER) -> None:
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._jitter = jitter
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._connecting = 0
+        self._peak_connecting = 0
+        self._admitted = 0
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[float]:
+        """Wait for a connection slot; yields the seconds spent waiting."""
+        queued_at = time.monotonic()
+        if self._jitter > 0 and (self._connecting or self._semaphore.locked()):
+            await asyncio.sleep(random.uniform(0, self._jitter))
+        async with self._semaphore:
+            self._admitted += 1
+            self._connecting += 1
+            self._peak_connecting = max(self._peak_connecting, self._connecting)
+            try:
+                yield time.monotonic() - queued_at
+            finally:
+                self._connecting -= 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "admitted": self._admitted,
+            "connecting": self._connecting,
+            "peak_connecting": self._peak_connecting,
+        }
@@ -3,7 +3,6 @@ from __future__ import annotations
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
 
 from .const import (
@@ -15,6 +14,8 @@ from .const import (
     OPTION_TO_CMD,
     CMD_TO_OPTION,
 )
+from .entity import SiegeniaCoordinatorEntity
+from .snapshot import state_key
 
 # Friendly labels for options (fallback English)
 # We expose raw options (OPEN/CLOSE/…) and let HA translate via
@@ -25,16 +26,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     coordinator = hass.data[DOMAIN][entry.entry_id]
     known_sashes: set[int] = set()
 
-    def _current_sashes() -> list[int]:
-        data = coordinator.data or {}
-        states = (data.get("data") or {}).get("states") or {}
-        if not states:
-            return [0]
-        return sorted(map(int, states.keys()))
-
     def _add_missing() -> None:
         new_entities = []
-        for sash in _current_sashes():
+        for sash in coordinator.snapshot.sashes:
             if sash in known_sashes:
                 continue
             known_sashes.add(sash)
@@ -46,7 +40,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entry.async_on_unload(coordinator.async_add_listener(_add_missing))
 
 
-class SiegeniaModeSelect(CoordinatorEntity, SelectEntity):
+class SiegeniaModeSelect(SiegeniaCoordinatorEntity, SelectEntity):
     _attr_has_entity_name = True
     # Raw options; frontend shows translated labels
     _attr_options = SELECT_OPTIONS
@@ -60,11 +54,13 @@ class SiegeniaModeSelect(CoordinatorEntity, SelectEntity):
         self._attr_unique_id = f"{serial}-mode-sash-{sash}"
         self._serial = serial
 
+    @property
+    def listen_keys(self) -> tuple[str, ...]:
+        return (state_key(self._sash),)
+
     @property
     def current_option(self) -> str | None:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        state = (data.get("states") or {}).get(str(self._sash))
+        state = self.coordinator.snapshot.state(self._sash)
         raw = STATE_TO_SELECT.get(state)
         # If device reports MOVING or an unmapped state, keep last commanded option
         if raw is None or state == STATE_MOVING:
@@ -99,9 +95,7 @@ class SiegeniaModeSelect(CoordinatorEntity, SelectEntity):
     @property
     def extra_state_attributes(self) -> dict | None:
         try:
-            params = self.coordinator.data or {}
-            data = params.get("data") or {}
-            state = (data.get("states") or {}).get(str(self._sash))
+            state = self.coordinator.snapshot.state(self._sash)
             moving = state == STATE_MOVING
             recent = self.coordinator.is_recent_cmd(self._sash, within=5.0)
             manual = bool(moving and not recent)
@@ -8,9 +8,10 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, resolve_model, STATE_TO_LOWER
+from .entity import SiegeniaCoordinatorEntity
+from .snapshot import KEY_FIRMWARE, KEY_TIMER, KEY_WARNINGS, state_key
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:  # type: ignore[no-untyped-def]
@@ -34,7 +35,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         async_add_entities(entities)
 
 
-class _BaseSiegeniaEntity(CoordinatorEntity):
+class _BaseSiegeniaEntity(SiegeniaCoordinatorEntity):
     def __init__(self, coordinator, entry: ConfigEntry, serial: str) -> None:
         super().__init__(coordinator)
         self._entry = entry
@@ -57,6 +58,7 @@ class SiegeniaStateSensor(_BaseSiegeniaEntity, SensorEntity):
     _attr_has_entity_name = True
     _attr_icon = "mdi:window-closed-variant"
     _attr_translation_key = "window_state"
+    _listen_keys = (state_key(0),)
 
     @property
     def unique_id(self) -> str:  # noqa: D401
@@ -64,10 +66,7 @@ class SiegeniaStateSensor(_BaseSiegeniaEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        states = data.get("states") or {}
-        raw = states.get("0")
+        raw = self.coordinator.snapshot.state(0)
         return STATE_TO_LOWER.get(raw, None)
 
 
@@ -76,6 +75,7 @@ class SiegeniaWarningsCountSensor(_BaseSiegeniaEntity, SensorEntity):
     _attr_translation_key = "warnings_count"
     _attr_icon = "mdi:alert"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_keys = (KEY_WARNINGS,)
 
     @property
     def unique_id(self) -> str:  # noqa: D401
@@ -83,10 +83,7 @@ class SiegeniaWarningsCountSensor(_BaseSiegeniaEntity, SensorEntity):
 
     @property
     def native_value(self) -> int:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        warnings = data.get("warnings") or []
-        return len(warnings)
+        return len(self.coordinator.snapshot.warnings)
 
 
 class SiegeniaWarningsTextSensor(_BaseSiegeniaEntity, SensorEntity):
@@ -94,6 +91,7 @@ class SiegeniaWarningsTextSensor(_BaseSiegeniaEntity, SensorEntity):
     _attr_translation_key = "warnings"
     _attr_icon = "mdi:alert-octagon"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_keys = (KEY_WARNINGS,)
 
     @property
     def unique_id(self) -> str:  # noqa: D401
@@ -101,13 +99,10 @@ class SiegeniaWarningsTextSensor(_BaseSiegeniaEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        warnings = data.get("warnings") or []
+        warnings = self.coordinator.snapshot.warnings
         if not warnings:
             return "None"
-        # warnings entries may be strings or dicts; stringify safely
-        return "; ".join(map(lambda w: w if isinstance(w, str) else str(w), warnings))
+        return "; ".join(warnings)
 
 
 class SiegeniaFirmwareUpdateSensor(_BaseSiegeniaEntity, SensorEntity):
@@ -115,6 +110,7 @@ class SiegeniaFirmwareUpdateSensor(_BaseSiegeniaEntity, SensorEntity):
     _attr_translation_key = "firmware_update"
     _attr_icon = "mdi:update"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_keys = (KEY_FIRMWARE,)
 
     @property
     def unique_id(self) -> str:  # noqa: D401
@@ -122,9 +118,7 @@ class SiegeniaFirmwareUpdateSensor(_BaseSiegeniaEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        val = data.get("firmware_update")
+        val = self.coordinator.snapshot.firmware_update
         if val is None:
             # try getDevice payload
             info = (self.coordinator.device_info or {}).get("data", {})
@@ -139,6 +133,7 @@ class SiegeniaTimerEnabledSensor(_BaseSiegeniaEntity, SensorEntity):
     _attr_translation_key = "timer_enabled"
     _attr_icon = "mdi:timer"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_keys = (KEY_TIMER,)
 
     @property
     def unique_id(self) -> str:
@@ -146,9 +141,7 @@ class SiegeniaTimerEnabledSensor(_BaseSiegeniaEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        data = (self.coordinator.data or {}).get("data", {})
-        timer = data.get("timer") or {}
-        enabled = timer.get("enabled")
+        enabled = self.coordinator.snapshot.timer_enabled
         if enabled is None:
             return None
         return "on" if enabled else "off"
@@ -159,6 +152,7 @@ class SiegeniaTimerRemainingSensor(_BaseSiegeniaEntity, SensorEntity):
     _attr_translation_key = "timer_remaining"
     _attr_icon = "mdi:timer-sand"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_keys = (KEY_TIMER,)
 
     @property
     def unique_id(self) -> str:
@@ -166,14 +160,11 @@ class SiegeniaTimerRemainingSensor(_BaseSiegeniaEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        data = (self.coordinator.data or {}).get("data", {})
-        timer = data.get("timer") or {}
-        remaining = timer.get("remainingtime") or {}
-        h = remaining.get("hour")
-        m = remaining.get("minute")
-        if h is None or m is None:
+        remaining = self.coordinator.snapshot.timer_remaining
+        if remaining is None:
             return None
-        return f"{int(h):02d}:{int(m):02d}"
+        h, m = remaining
+        return f"{h:02d}:{m:02d}"
 
 
 class SiegeniaOperationSourceSensor(_BaseSiegeniaEntity, SensorEntity):
@@ -181,6 +172,7 @@ class SiegeniaOperationSourceSensor(_BaseSiegeniaEntity, SensorEntity):
     _attr_translation_key = "operation_source"
     _attr_icon = "mdi:account-arrow-right"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_keys = (state_key(0),)
 
     @property
     def unique_id(self) -> str:
@@ -188,11 +180,7 @@ class SiegeniaOperationSourceSensor(_BaseSiegeniaEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        data = (self.coordinator.data or {}).get("data", {})
-        states = data.get("states") or {}
-        if not states:
-            return None
-        state = states.get("0")
+        state = self.coordinator.snapshot.state(0)
         if state is None:
             return None
         if state == "MOVING":
@@ -218,6 +206,7 @@ class SiegeniaOpenCountSensor(_BaseSiegeniaEntity, RestoreEntity, SensorEntity):
     _attr_translation_key = "open_count"
     _attr_icon = "mdi:counter"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _listen_keys = (state_key(0),)
     # Keep unit None for LTS compatibility
 
     def __init__(self, coordinator, entry: ConfigEntry, serial: str) -> None:
@@ -241,14 +230,8 @@ class SiegeniaOpenCountSensor(_BaseSiegeniaEntity, RestoreEntity, SensorEntity):
         # Initialize last state
         self._last_was_open = self._is_open()
 
-        # Subscribe to coordinator updates
-        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
-
     def _is_open(self) -> bool:
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        state = (data.get("states") or {}).get("0")
-        return state == "OPEN"
+        return self.coordinator.snapshot.state(0) == "OPEN"
 
     def _handle_coordinator_update(self) -> None:
         is_open = self._is_open()
@@ -1,5 +1,51 @@
 """Reusable Siegenia local client package."""
 
-from .client import AuthenticationError, SiegeniaClient, SiegeniaError
+from .client import (
+    CONNECTION_CONNECTED,
+    CONNECTION_DISCONNECTED,
+    CONNECTION_RECONNECTING,
+    SASH_ACTIONS,
+    AuthenticationError,
+    JsonCodec,
+    OrjsonCodec,
+    SiegeniaClient,
+    SiegeniaError,
+    async_get_ssl_context,
+    default_codec,
+    get_ssl_context,
+    tls_stats,
+)
+from .capture import DEFAULT_CAPTURE_MAX_BYTES, FrameCapture, read_capture, replay_frames
+from .simulator import SiegeniaSimulator
+from .stats import ClientStats, CommandStats
+from .subscription import OVERFLOW_COALESCE_LATEST, OVERFLOW_DROP_OLDEST, PushSubscription
+from .transport import AiohttpTransport, LoopbackTransport, Transport
 
-__all__ = ["AuthenticationError", "SiegeniaClient", "SiegeniaError"]
+__all__ = [
+    "CONNECTION_CONNECTED",
+    "CONNECTION_DISCONNECTED",
+    "CONNECTION_RECONNECTING",
+    "DEFAULT_CAPTURE_MAX_BYTES",
+    "OVERFLOW_COALESCE_LATEST",
+    "OVERFLOW_DROP_OLDEST",
+    "SASH_ACTIONS",
+    "AiohttpTransport",
+    "AuthenticationError",
+    "ClientStats",
+    "CommandStats",
+    "FrameCapture",
+    "JsonCodec",
+    "LoopbackTransport",
+    "OrjsonCodec",
+    "PushSubscription",
+    "SiegeniaClient",
+    "SiegeniaError",
+    "SiegeniaSimulator",
+    "Transport",
+    "async_get_ssl_context",
+    "default_codec",
+    "get_ssl_context",
+    "read_capture",
+    "replay_frames",
+    "tls_stats",
+]
@@ -0,0 +1,172 @@
+"""Record WebSocket frames to rotating JSONL files and play them back."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+CAPTURE_VERSION = 1
+DIRECTION_SEND = "send"
+DIRECTION_RECV = "recv"
+
+DEFAULT_CAPTURE_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_CAPTURE_BACKUPS = 3
+
+_STOP = object()
+
+
+class FrameCapture:
+    """Append timestamped frames to a JSONL file from a background thread.
+
+    ``record()`` only puts the frame on a queue, so it never does file I/O on
+    the event loop. Each line is ``{"t": seconds since start, "dir": "send" |
+    "recv", "frame": {...}}`` after a header line with the start time. When the
+    written (uncompressed) size passes ``max_bytes``, the file is rotated to
+    ``<path>.1`` … ``<path>.<backups>``. With ``compress`` every file is gzip.
+    Callers redact frames before recording them.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = DEFAULT_CAPTURE_MAX_BYTES,
+        backups: int = DEFAULT_CAPTURE_BACKUPS,
+        compress: bool = False,
+        meta: dict[str, Any] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = max(0, backups)
+        self.compress = compress
+        self.meta = dict(meta or {})
+        self.records = 0
+        self.rotations = 0
+        self._started = time.monotonic()
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def record(self, direction: str, frame: Any) -> None:
+        if self._closed:
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="siegenia-capture", daemon=True)
+            self._thread.start()
+        self.records += 1
+        self._queue.put((time.monotonic() - self._started, direction, frame))
+
+    def close(self) -> None:
+        """Flush queued frames and close the file (blocking; use an executor)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    async def async_close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def stats(self) -> dict[str, Any]:
+        return {"path": str(self.path), "records": self.records, "rotations": self.rotations, "closed": self._closed}
+
+    def _open(self) -> IO[str]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle: IO[str]
+        if self.compress:
+            handle = gzip.open(self.path, "wt", encoding="utf-8")
+        else:
+            handle = open(self.path, "w", encoding="utf-8")  # noqa: SIM115
+        header = {"capture": CAPTURE_VERSION, "started": time.time(), **self.meta}
+        handle.write(json.dumps(header, separators=(",", ":")) + "\n")
+        return handle
+
+    def _rotate(self) -> None:
+        for index in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backups:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        self.rotations += 1
+
+    def _run(self) -> None:
+        handle = self._open()
+        written = 0
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                offset, direction, frame = item
+                line = json.dumps({"t": round(offset, 6), "dir": direction, "frame": frame}, separators=(",", ":"))
+                handle.write(line + "\n")
+                written += len(line) + 1
+                if written >= self.max_bytes:
+                    handle.close()
+                    self._rotate()
+                    handle = self._open()
+                    written = 0
+        finally:
+            handle.close()
+
+
+def _open_capture(path: Path) -> IO[str]:
+    with open(path, "rb") as probe:
+        magic = probe.read(2)
+    if magic == b"\x1f\x8b":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")  # noqa: SIM115
+
+
+def read_capture(*paths: str | os.PathLike[str]) -> Iterator[dict[str, Any]]:
+    """Yield frame records from capture files (plain or gzip), skipping headers.
+
+    Pass rotated files oldest first to replay them as one stream; ``t``
+    counts from the start of the capture, not of each file, so it already
+    continues across rotations.
+    """
+    for path in paths:
+        with _open_capture(Path(path)) as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "capture" in record:
+                    continue
+                yield {**record, "t": float(record.get("t", 0.0))}
+
+
+async def replay_frames(
+    records: Iterable[dict[str, Any]],
+    *,
+    speed: float | None = 1.0,
+    direction: str | None = DIRECTION_RECV,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield records at their recorded pace divided by ``speed``.
+
+    ``speed=None`` yields as fast as possible (still yielding to the loop
+    between records). Only records of ``direction`` are produced unless it is
+    ``None``.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for record in records:
+        if direction is not None and record.get("dir") != direction:
+            continue
+        if speed:
+            delay = started + float(record.get("t", 0.0)) / speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(0)
+        yield record
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
+import logging
+import random
+import re
 import ssl
-from collections.abc import Mapping
+import threading
+import time
+from collections.abc import Iterable, Mapping
 from typing import Any, Callable
 
-from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
+from aiohttp import ClientSession, WSMsgType
+
+from .capture import DIRECTION_RECV, DIRECTION_SEND, FrameCapture
+from .stats import ClientStats
+from .transport import AiohttpTransport, Transport, WebSocketLike
+from .subscription import DEFAULT_SUBSCRIPTION_QUEUE, OVERFLOW_DROP_OLDEST, PushSubscription
+
+try:  # Optional fast JSON backend; Home Assistant ships it by default.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
 
 
 class SiegeniaError(Exception):
@@ -17,6 +33,290 @@ class AuthenticationError(SiegeniaError):
     pass
 
 
+class _ConnectionDropped(SiegeniaError):
+    """The socket closed while a request was waiting for its response."""
+
+
+class JsonCodec:
+    """Encode outgoing frames and decode incoming frames with the stdlib."""
+
+    name = "json"
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson; accepts bytes frames without decoding."""
+
+    name = "orjson"
+
+    def dumps(self, value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> Any:
+        return orjson.loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """Return the fastest JSON codec available in this environment."""
+    return OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+# Read-only commands whose concurrent calls can safely share one wire request.
+COALESCED_COMMANDS = frozenset({"getDevice", "getDeviceParams", "getDeviceDetails"})
+
+# Request priorities; lower values are granted a socket slot first.
+PRIORITY_SAFETY = 0
+PRIORITY_COMMAND = 1
+PRIORITY_READ = 2
+PRIORITY_NAMES = {
+    PRIORITY_SAFETY: "safety",
+    PRIORITY_COMMAND: "command",
+    PRIORITY_READ: "read",
+}
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Connection states reported to connection listeners.
+CONNECTION_CONNECTED = "connected"
+CONNECTION_DISCONNECTED = "disconnected"
+CONNECTION_RECONNECTING = "reconnecting"
+
+DEFAULT_TIMEOUT_FLOOR = 2.0
+
+DEFAULT_RECONNECT_MIN_DELAY = 1.0
+DEFAULT_RECONNECT_MAX_DELAY = 60.0
+
+_READ_COMMANDS = COALESCED_COMMANDS | {"keepAlive"}
+_SAFETY_ACTIONS = frozenset({"STOP", "CLOSE", "CLOSE_WO_LOCK"})
+SASH_ACTIONS = frozenset({"OPEN", "CLOSE", "GAP_VENT", "CLOSE_WO_LOCK", "STOP_OVER", "STOP"})
+
+# Pre-routing probes: a regex scan is far cheaper than a full JSON decode.
+_ID_KEY_TEXT = re.compile(r'"id"\s*:')
+_ID_KEY_BYTES = re.compile(rb'"id"\s*:')
+_COMMAND_TEXT = re.compile(r'"command"\s*:\s*"([^"\\]*)"')
+_COMMAND_BYTES = re.compile(rb'"command"\s*:\s*"([^"\\]*)"')
+
+
+def _peek_push_command(raw: str | bytes) -> tuple[bool, str | None]:
+    """Return ``(is_push, command)`` for a raw frame without decoding it.
+
+    A frame counts as a push only when it has no ``"id"`` key anywhere. The
+    command is returned only when exactly one ``"command"`` key is present;
+    otherwise it is ``None`` and the caller must decode the frame.
+    """
+    if isinstance(raw, str):
+        id_key, command_key = _ID_KEY_TEXT, _COMMAND_TEXT
+    else:
+        raw = bytes(raw)
+        id_key, command_key = _ID_KEY_BYTES, _COMMAND_BYTES
+    if id_key.search(raw) is not None:
+        return False, None
+    commands = command_key.findall(raw)
+    if len(commands) != 1:
+        return True, None
+    command = commands[0]
+    return True, command if isinstance(command, str) else command.decode("utf-8", "replace")
+
+
+def request_priority(command: str | None, params: Any = None) -> int:
+    """Classify a request: stop/close first, then user commands, then reads."""
+    if command in _READ_COMMANDS:
+        return PRIORITY_READ
+    if command == "setDeviceParams" and isinstance(params, Mapping):
+        if "stop" in params:
+            return PRIORITY_SAFETY
+        openclose = params.get("openclose")
+        if (
+            isinstance(openclose, Mapping)
+            and openclose
+            and all(str(action).upper() in _SAFETY_ACTIONS for action in openclose.values())
+        ):
+            return PRIORITY_SAFETY
+    return PRIORITY_COMMAND
+
+
+class _RequestScheduler:
+    """Grant in-flight request slots on one socket in priority order."""
+
+    def __init__(self, max_in_flight: int) -> None:
+        self._limit = max(1, int(max_in_flight))
+        self._in_flight = 0
+        self._seq = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        # priority -> [granted, total wait seconds, max wait seconds]
+        self._waits: dict[int, list[float]] = {p: [0, 0.0, 0.0] for p in PRIORITY_NAMES}
+
+    async def acquire(self, priority: int) -> None:
+        started = time.monotonic()
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._seq += 1
+            entry = (priority, self._seq, fut)
+            heapq.heappush(self._waiters, entry)
+            try:
+                await fut
+            except asyncio.CancelledError:
+                if fut.done() and not fut.cancelled():
+                    # The slot was handed over just before cancellation.
+                    self.release()
+                else:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                raise
+        waited = time.monotonic() - started
+        stats = self._waits.setdefault(priority, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += waited
+        if waited > stats[2]:
+            stats[2] = waited
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                # Hand the slot straight to the next waiter.
+                fut.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_in_flight": self._limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "wait": {
+                PRIORITY_NAMES.get(priority, str(priority)): {
+                    "count": int(count),
+                    "avg": (total / count) if count else 0.0,
+                    "max": peak,
+                }
+                for priority, (count, total, peak) in self._waits.items()
+            },
+        }
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """Client SSLContext that offers the last TLS session seen for each host.
+
+    asyncio has no hook for passing an ``SSLSession`` to a new connection, but
+    it creates every TLS object through ``wrap_bio``, so the session is
+    injected there. A stale or rejected session just falls back to a full
+    handshake.
+    """
+
+    _MAX_HOSTS = 256
+
+    def _ssl_objects(self) -> dict[str, ssl.SSLObject]:
+        objects = self.__dict__.get("_last_ssl_objects")
+        if objects is None:
+            objects = self.__dict__["_last_ssl_objects"] = {}
+        return objects
+
+    def wrap_bio(  # type: ignore[override]
+        self,
+        incoming: ssl.MemoryBIO,
+        outgoing: ssl.MemoryBIO,
+        server_side: bool = False,
+        server_hostname: str | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLObject:
+        objects = self._ssl_objects()
+        counts = self.handshake_counts()
+        counts["handshakes"] += 1
+        if session is None and server_hostname and not server_side:
+            previous = objects.get(server_hostname)
+            if previous is not None:
+                try:
+                    session = previous.session
+                except Exception:  # noqa: BLE001 - no session to offer
+                    session = None
+        if session is not None:
+            counts["sessions_offered"] += 1
+        try:
+            sslobj = super().wrap_bio(
+                incoming,
+                outgoing,
+                server_side=server_side,
+                server_hostname=server_hostname,
+                session=session,
+            )
+        except (ValueError, ssl.SSLError):
+            sslobj = super().wrap_bio(
+                incoming,
+                outgoing,
+                server_side=server_side,
+                server_hostname=server_hostname,
+            )
+        if server_hostname and not server_side:
+            objects.pop(server_hostname, None)
+            if len(objects) >= self._MAX_HOSTS:
+                objects.pop(next(iter(objects)))
+            objects[server_hostname] = sslobj
+        return sslobj
+
+    def last_ssl_object(self, host: str) -> ssl.SSLObject | None:
+        return self._ssl_objects().get(host)
+
+    def handshake_counts(self) -> dict[str, int]:
+        counts = self.__dict__.get("_handshake_counts")
+        if counts is None:
+            counts = self.__dict__["_handshake_counts"] = {"handshakes": 0, "sessions_offered": 0}
+        return counts
+
+
+_SSL_CONTEXTS: dict[bool, _ResumingSSLContext] = {}
+_SSL_CONTEXT_LOCK = threading.Lock()
+
+
+def _build_ssl_context(verify_ssl: bool) -> _ResumingSSLContext:
+    ctx = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    if verify_ssl:
+        # Loads the system trust store; this blocks, so callers on the event
+        # loop should go through async_get_ssl_context().
+        ctx.load_default_certs()
+    else:
+        # Accept the device's self-signed certificate without loading default certs.
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+def get_ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """Return the process-wide client SSLContext for a verification mode."""
+    verify_ssl = bool(verify_ssl)
+    ctx = _SSL_CONTEXTS.get(verify_ssl)
+    if ctx is None:
+        with _SSL_CONTEXT_LOCK:
+            ctx = _SSL_CONTEXTS.get(verify_ssl)
+            if ctx is None:
+                ctx = _SSL_CONTEXTS[verify_ssl] = _build_ssl_context(verify_ssl)
+    return ctx
+
+
+async def async_get_ssl_context(verify_ssl: bool) -> ssl.SSLContext:
+    """Return the shared SSLContext, building it in an executor the first time."""
+    ctx = _SSL_CONTEXTS.get(bool(verify_ssl))
+    if ctx is not None:
+        return ctx
+    return await asyncio.get_running_loop().run_in_executor(None, get_ssl_context, verify_ssl)
+
+
+def tls_stats() -> dict[str, dict[str, int]]:
+    """Return process-wide TLS handshake counts per verification mode."""
+    return {
+        ("verified" if verify else "unverified"): dict(ctx.handshake_counts())
+        for verify, ctx in _SSL_CONTEXTS.items()
+    }
+
+
 class SiegeniaClient:
     """Async WebSocket client for Siegenia devices (MHS family)."""
 
@@ -27,65 +327,199 @@ class SiegeniaClient:
         port: int = 443,
         ws_protocol: str = "wss",
         session: ClientSession | None = None,
+        transport: Transport | None = None,
         logger: Callable[[str], None] | None = None,
         response_timeout: float = 10.0,
         verify_ssl: bool = False,
+        codec: JsonCodec | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        auto_reconnect: bool = False,
+        replay_requests: bool = False,
+        reconnect_min_delay: float = DEFAULT_RECONNECT_MIN_DELAY,
+        reconnect_max_delay: float = DEFAULT_RECONNECT_MAX_DELAY,
+        adaptive_timeouts: bool = False,
+        timeout_floor: float = DEFAULT_TIMEOUT_FLOOR,
+        timeout_ceiling: float | None = None,
+        capture: FrameCapture | None = None,
     ) -> None:
         self._host = host
         self._port = port
         self._ws_protocol = ws_protocol
-        self._session = session
-        self._own_session = False
+        self._transport: Transport = transport if transport is not None else AiohttpTransport(session)
+        self._debug_logger = logger
         self._logger = logger or (lambda s: None)
+        self._codec = codec or default_codec()
         self._response_timeout = response_timeout
+        self._adaptive_timeouts = adaptive_timeouts
+        self._timeout_ceiling = response_timeout if timeout_ceiling is None else timeout_ceiling
+        self._timeout_floor = min(timeout_floor, self._timeout_ceiling)
         self._verify_ssl = verify_ssl
 
-        self._ws: ClientWebSocketResponse | None = None
+        self._ws: WebSocketLike | None = None
         self._req_id = 1
         self._awaiting: dict[int, asyncio.Future[dict[str, Any]]] = {}
         self._hb_task: asyncio.Task[None] | None = None
         self._receiver_task: asyncio.Task[None] | None = None
         self._on_push: Callable[[dict[str, Any]], None] | None = None
+        self._push_commands: frozenset[str] | None = None
+        self._subscriptions: list[PushSubscription] = []
+        self._capture = capture
+        self._scheduler = _RequestScheduler(max_in_flight)
+        self._stats = ClientStats()
+        # Monotonic time of the last request answered on this socket.
+        self._last_activity = 0.0
+        self._heartbeat_counts: dict[str, int] = {"sent": 0, "suppressed": 0}
+        self._connect_stats: dict[str, float] = {
+            "connects": 0,
+            "failures": 0,
+            "tls_resumed": 0,
+            "last_duration": 0.0,
+            "total_duration": 0.0,
+            "max_duration": 0.0,
+            "first_data_count": 0,
+            "first_data_last": 0.0,
+            "first_data_total": 0.0,
+            "first_data_max": 0.0,
+        }
+        self._connect_started = 0.0
+        self._first_data_pending = False
+        self._inflight_reads: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._coalesce_counts: dict[str, int] = {"requests": 0, "coalesced": 0}
+        # Auto-reconnect
+        self._auto_reconnect = auto_reconnect
+        self._replay_requests = replay_requests
+        self._reconnect_min_delay = max(0.0, reconnect_min_delay)
+        self._reconnect_max_delay = max(self._reconnect_min_delay, reconnect_max_delay)
+        self._credentials: tuple[str, str] | None = None
+        # Long-life sessions
+        self._long_life = False
+        self._session_resumed = False
+        self._session_info: dict[str, Any] | None = None
+        self._session_counts: dict[str, int] = {
+            "logins": 0,
+            "resumed": 0,
+            "resumed_ok": 0,
+            "fallback_logins": 0,
+            "relogins": 0,
+        }
+        # Bumped on every login/resume so requests answered for an older
+        # session retry without starting another login.
+        self._auth_epoch = 0
+        self._relogin_task: asyncio.Task[None] | None = None
+        self._closing = False
+        # Set when a reconnect login is rejected; cleared by the next connect().
+        self._auth_rejected = False
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._reconnect_counts: dict[str, int] = {"attempts": 0, "reconnects": 0, "replayed": 0}
+        self._connection_state = CONNECTION_DISCONNECTED
+        self._connected_event = asyncio.Event()
+        self._connection_listeners: list[Callable[[str], None]] = []
 
     @property
     def connected(self) -> bool:
         return self._ws is not None and not self._ws.closed
 
-    async def connect(self) -> None:
-        if self.connected:
+    @property
+    def codec(self) -> JsonCodec:
+        return self._codec
+
+    @property
+    def connection_state(self) -> str:
+        return self._connection_state
+
+    @property
+    def reconnecting(self) -> bool:
+        return self._reconnect_task is not None and not self._reconnect_task.done()
+
+    def add_connection_listener(self, cb: Callable[[str], None]) -> Callable[[], None]:
+        """Register a callback for connection state changes.
+
+        Called with one of ``CONNECTION_CONNECTED``, ``CONNECTION_DISCONNECTED``
+        or ``CONNECTION_RECONNECTING``. Returns a callable that unregisters it.
+        """
+        self._connection_listeners.append(cb)
+
+        def _remove() -> None:
+            if cb in self._connection_listeners:
+                self._connection_listeners.remove(cb)
+
+        return _remove
+
+    def _set_connection_state(self, state: str) -> None:
+        if state == CONNECTION_CONNECTED:
+            self._connected_event.set()
+        else:
+            self._connected_event.clear()
+        if state == self._connection_state:
             return
+        self._connection_state = state
+        for listener in list(self._connection_listeners):
+            try:
+                listener(state)
+            except Exception as exc:  # noqa: BLE001
+                self._logger(f"Connection listener error: {exc}")
 
-        if self._session is None:
-            self._session = ClientSession()
-            self._own_session = True
+    def _debug_enabled(self) -> bool:
+        """Return True when SEND/RECV frames would actually be logged."""
+        log = self._debug_logger
+        if log is None:
+            return False
+        owner = getattr(log, "__self__", None)
+        if isinstance(owner, logging.Logger):
+            return owner.isEnabledFor(logging.DEBUG)
+        return True
 
-        ssl_ctx: ssl.SSLContext | bool
-        if self._ws_protocol == "wss":
-            if self._verify_ssl:
-                ssl_ctx = True
-            else:
-                # Accept self-signed cert on device without loading default certs.
-                # Avoid ssl.create_default_context() to prevent blocking certificate path loads in the event loop.
-                ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-                ssl_ctx.check_hostname = False
-                ssl_ctx.verify_mode = ssl.CERT_NONE
+    async def connect(self) -> None:
+        if self.connected:
+            return
+        self._closing = False
+        self._auth_rejected = False
+        self._connect_started = time.monotonic()
 
         url = f"{self._ws_protocol}://{self._host}:{self._port}/WebSocket"
         headers = {"Origin": f"{self._ws_protocol}://{self._host}:{self._port}"}
-        connect_kwargs: dict[str, Any] = {"headers": headers}
+        ssl_ctx: ssl.SSLContext | None = None
         if self._ws_protocol == "wss":
-            connect_kwargs["ssl"] = ssl_ctx
+            ssl_ctx = await async_get_ssl_context(self._verify_ssl)
+        started = time.monotonic()
         try:
-            self._ws = await self._session.ws_connect(url, **connect_kwargs)
+            self._ws = await self._transport.connect(url, headers=headers, ssl_context=ssl_ctx)
         except Exception:
-            if self._own_session:
-                await self._session.close()
-                self._session = None
-                self._own_session = False
+            self._connect_stats["failures"] += 1
+            await self._transport.close()
             raise
+        self._record_connect(time.monotonic() - started, ssl_ctx)
+        self._first_data_pending = True
+        self._last_activity = time.monotonic()
         self._receiver_task = asyncio.create_task(self._receiver_loop(self._ws))
 
+    def _record_connect(self, duration: float, ssl_ctx: ssl.SSLContext | None) -> None:
+        stats = self._connect_stats
+        stats["connects"] += 1
+        stats["last_duration"] = duration
+        stats["total_duration"] += duration
+        stats["max_duration"] = max(stats["max_duration"], duration)
+        if isinstance(ssl_ctx, _ResumingSSLContext):
+            sslobj = ssl_ctx.last_ssl_object(self._host)
+            if sslobj is not None and getattr(sslobj, "session_reused", False):
+                stats["tls_resumed"] += 1
+
+    def connect_stats(self) -> dict[str, float]:
+        """Return connect counts, TLS session reuse and handshake durations.
+
+        Durations cover TCP connect, TLS handshake and the WebSocket upgrade.
+        ``first_data_*`` measure from the start of ``connect()`` to the first
+        answered read on the new socket.
+        """
+        return dict(self._connect_stats)
+
     async def disconnect(self) -> None:
+        self._closing = True
+        reconnect_task = self._reconnect_task
+        self._reconnect_task = None
+        if reconnect_task and reconnect_task is not asyncio.current_task():
+            reconnect_task.cancel()
+
         heartbeat_task = self._hb_task
         self._hb_task = None
         if heartbeat_task:
@@ -103,32 +537,57 @@ class SiegeniaClient:
 
         tasks = [
             task
-            for task in (heartbeat_task, receiver_task)
+            for task in (reconnect_task, heartbeat_task, receiver_task)
             if task is not None and task is not asyncio.current_task()
         ]
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
+        # Subscriptions outlive automatic reconnects but end on an explicit close.
+        for subscription in list(self._subscriptions):
+            subscription.close()
+        self._set_connection_state(CONNECTION_DISCONNECTED)
 
-        if self._own_session and self._session:
-            await self._session.close()
-            self._session = None
-            self._own_session = False
+        await self._transport.close()
 
-    async def _receiver_loop(self, websocket: ClientWebSocketResponse) -> None:
+    async def _receiver_loop(self, websocket: WebSocketLike) -> None:
         try:
             async for msg in websocket:
-                if msg.type == WSMsgType.TEXT:
+                if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                    self._stats.record_received(len(msg.data))
+                    if self._capture is not None:
+                        self._capture_received(msg.data)
+                    is_push, command = _peek_push_command(msg.data)
+                    if is_push and command is not None and not self._wants_push(command):
+                        # Nobody listens for this push; skip decoding it.
+                        self._stats.record_push(command)
+                        self._stats.record_push_dropped(command)
+                        continue
                     try:
-                        data = json.loads(msg.data)
+                        data = self._codec.loads(msg.data)
                     except Exception as exc:  # noqa: BLE001
                         self._logger(f"Failed to parse message: {exc}")
                         continue
+                    if not isinstance(data, dict):
+                        self._logger(f"Ignoring non-object message: {data!r}")
+                        continue
                     req_id = data.get("id")
                     # Route to waiter if matching id
                     fut = self._awaiting.pop(int(req_id), None) if req_id is not None else None
                     if fut and not fut.done():
                         fut.set_result(data)
-                    elif self._on_push is not None:
+                        continue
+                    if req_id is not None:
+                        # Late answer to a request that already timed out or was cancelled.
+                        self._stats.record_unmatched(req_id)
+                    else:
+                        command = data.get("command")
+                        self._stats.record_push(command)
+                        for subscription in self._subscriptions:
+                            if subscription.wants(command):
+                                subscription.offer(data)
+                    if self._on_push is not None and (
+                        self._push_commands is None or data.get("command") in self._push_commands
+                    ):
                         try:
                             self._on_push(data)
                         except Exception as exc:  # noqa: BLE001
@@ -138,45 +597,131 @@ class SiegeniaClient:
         finally:
             if self._ws is websocket:
                 self._ws = None
-            # Fail any pending futures
+            # Fail any pending futures; replayable requests retry after reconnect.
             for fut in self._awaiting.values():
                 if not fut.done():
-                    fut.set_exception(SiegeniaError("Connection closed"))
+                    fut.set_exception(_ConnectionDropped("Connection closed"))
             self._awaiting.clear()
+            if not self._closing:
+                if self._auto_reconnect and self._credentials is not None and not self._auth_rejected:
+                    self._schedule_reconnect()
+                else:
+                    self._set_connection_state(CONNECTION_DISCONNECTED)
+
+    def _capture_received(self, raw: str | bytes) -> None:
+        try:
+            frame = _redact_sensitive_values(self._codec.loads(raw))
+        except Exception:  # noqa: BLE001
+            frame = raw if isinstance(raw, str) else bytes(raw).decode("utf-8", "replace")
+        self._capture.record(DIRECTION_RECV, frame)  # type: ignore[union-attr]
+
+    @property
+    def capture(self) -> FrameCapture | None:
+        return self._capture
+
+    def set_capture(self, capture: FrameCapture | None) -> None:
+        """Start (or with ``None`` stop) recording redacted frames.
 
-    async def _send_request(self, command: str | Mapping[str, Any], params: Any | None = None) -> dict[str, Any]:
+        The caller owns the capture and closes it; ``disconnect()`` does not.
+        """
+        self._capture = capture
+
+    def _schedule_reconnect(self) -> None:
+        if self.reconnecting or self._auth_rejected:
+            return
+        self._set_connection_state(CONNECTION_RECONNECTING)
+        self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self) -> None:
+        """Reconnect and log in again with exponential backoff and jitter."""
+        attempt = 0
+        while True:
+            delay = min(self._reconnect_max_delay, self._reconnect_min_delay * (2 ** min(attempt, 16)))
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            attempt += 1
+            self._reconnect_counts["attempts"] += 1
+            try:
+                await self.connect()
+                assert self._credentials is not None
+                if self._long_life and self._session_info is not None:
+                    self.resume_session(*self._credentials)
+                else:
+                    await self.login(*self._credentials)
+            except AuthenticationError as exc:
+                # Rejected credentials will not fix themselves; stop retrying.
+                self._logger(f"Reconnect login rejected: {exc}")
+                # Mark before dropping so the receiver's exit does not start another loop.
+                self._auth_rejected = True
+                await self._drop_socket()
+                self._set_connection_state(CONNECTION_DISCONNECTED)
+                return
+            except Exception as exc:  # noqa: BLE001
+                self._logger(f"Reconnect attempt {attempt} failed: {exc}")
+                await self._drop_socket()
+                continue
+            self._reconnect_counts["reconnects"] += 1
+            return
+
+    async def _drop_socket(self) -> None:
+        websocket = self._ws
+        self._ws = None
+        if websocket is not None and not websocket.closed:
+            try:
+                await websocket.close()
+            except Exception as exc:  # noqa: BLE001
+                self._logger(f"Failed to close socket: {exc}")
+
+    async def _wait_reconnected(self) -> None:
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), timeout=self._response_timeout)
+        except asyncio.TimeoutError as exc:
+            raise SiegeniaError("Connection closed") from exc
+
+    def reconnect_stats(self) -> dict[str, int]:
+        """Return reconnect attempts, successful reconnects and replayed requests."""
+        return dict(self._reconnect_counts)
+
+    async def _send_request(
+        self,
+        command: str | Mapping[str, Any],
+        params: Any | None = None,
+        *,
+        priority: int | None = None,
+    ) -> dict[str, Any]:
         if not self.connected:
             raise SiegeniaError("Not connected")
 
-        self._req_id += 1
-        req_id = self._req_id
-
         if isinstance(command, str):
-            payload: dict[str, Any] = {"command": command, "id": req_id}
+            payload: dict[str, Any] = {"command": command}
         else:
             payload = dict(command)
-            payload["id"] = req_id
 
         if params is not None:
             payload["params"] = params
 
-        fut: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
-        self._awaiting[req_id] = fut
-        try:
-            assert self._ws is not None
-            safe_payload = _redact_sensitive_values(payload)
-            self._logger(f"SEND: {json.dumps(safe_payload, separators=(',', ':'))}")
-            await self._ws.send_str(json.dumps(payload))
-            resp = await asyncio.wait_for(fut, timeout=self._response_timeout)
-        except asyncio.TimeoutError as exc:  # noqa: PERF203
-            raise SiegeniaError("Timeout waiting for response") from exc
-        finally:
-            self._awaiting.pop(req_id, None)
+        if priority is None:
+            priority = request_priority(payload.get("command"), params)
+        epoch = self._auth_epoch
+        resp = await self._dispatch(payload, priority)
+
+        status = resp.get("status") if isinstance(resp, dict) and payload.get("command") != "login" else None
+        if status == "not_authenticated" and self._credentials is not None:
+            # The session expired (or a resumed one was never valid): log in
+            # again on the same socket and retry once. A login that is really
+            # rejected raises AuthenticationError from here.
+            if self._auth_epoch == epoch:
+                await self._relogin()
+            resp = await self._dispatch(payload, priority)
+        elif status == "ok" and self._session_resumed:
+            self._session_resumed = False
+            self._session_counts["resumed_ok"] += 1
 
         if not isinstance(resp, dict):
             raise SiegeniaError("Malformed response")
 
         status = resp.get("status")
+        if status is not None and status != "ok":
+            self._stats.command(str(payload.get("command"))).errors += 1
         if status in {"not_authenticated", "authentication_error"}:
             raise AuthenticationError(status or "authentication_error")
         if status is not None and status != "ok":
@@ -184,30 +729,236 @@ class SiegeniaClient:
                 raise AuthenticationError(str(status))
             raise SiegeniaError(f"Device returned status: {status}")
 
+        if self._first_data_pending and payload.get("command") in COALESCED_COMMANDS:
+            self._record_first_data()
         return resp
 
-    async def login(self, user: str, password: str) -> None:
+    async def _dispatch(self, payload: dict[str, Any], priority: int) -> Any:
+        """Exchange one request under the scheduler, replaying reads if allowed."""
+        replay = (
+            self._auto_reconnect
+            and self._replay_requests
+            and payload.get("command") in _READ_COMMANDS
+        )
+        while True:
+            await self._scheduler.acquire(priority)
+            try:
+                # The socket may have dropped while this request was queued.
+                if not self.connected:
+                    raise SiegeniaError("Not connected")
+                return await self._exchange(payload)
+            except _ConnectionDropped:
+                if not replay:
+                    raise
+                replay = False
+            finally:
+                self._scheduler.release()
+            # Idempotent request lost with the socket: replay it once reconnected.
+            await self._wait_reconnected()
+            self._reconnect_counts["replayed"] += 1
+
+    async def _relogin(self) -> None:
+        """Log in again with the stored credentials; concurrent callers share one login."""
+        if self._relogin_task is None:
+            assert self._credentials is not None
+            key = "fallback_logins" if self._session_resumed else "relogins"
+            self._session_counts[key] += 1
+            self._relogin_task = asyncio.create_task(self.login(*self._credentials, long_life=self._long_life))
+            self._relogin_task.add_done_callback(self._relogin_done)
+        await asyncio.shield(self._relogin_task)
+
+    def _relogin_done(self, task: asyncio.Task[None]) -> None:
+        if self._relogin_task is task:
+            self._relogin_task = None
+        if not task.cancelled():
+            task.exception()  # retrieved by the waiters; avoid "never retrieved" warnings
+
+    def _record_first_data(self) -> None:
+        self._first_data_pending = False
+        elapsed = time.monotonic() - self._connect_started
+        stats = self._connect_stats
+        stats["first_data_count"] += 1
+        stats["first_data_last"] = elapsed
+        stats["first_data_total"] += elapsed
+        stats["first_data_max"] = max(stats["first_data_max"], elapsed)
+
+    async def _exchange(self, payload: dict[str, Any]) -> Any:
+        """Send one frame and wait for the response carrying its id."""
+        self._req_id += 1
+        req_id = self._req_id
+        payload["id"] = req_id
+
+        command_stats = self._stats.command(str(payload.get("command")))
+        if self._adaptive_timeouts:
+            timeout = command_stats.timeout(self._timeout_floor, self._timeout_ceiling)
+        else:
+            timeout = self._response_timeout
+        fut: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._awaiting[req_id] = fut
+        try:
+            assert self._ws is not None
+            if self._debug_enabled():
+                safe_payload = _redact_sensitive_values(payload)
+                self._logger(f"SEND: {self._codec.dumps(safe_payload)}")
+            frame = self._codec.dumps(payload)
+            if self._capture is not None:
+                self._capture.record(DIRECTION_SEND, _redact_sensitive_values(payload))
+            started = time.monotonic()
+            await self._ws.send_str(frame)
+            self._stats.record_sent(len(frame))
+            resp = await asyncio.wait_for(fut, timeout=timeout)
+            self._last_activity = time.monotonic()
+            command_stats.record(self._last_activity - started)
+            return resp
+        except asyncio.TimeoutError as exc:  # noqa: PERF203
+            command_stats.record_timeout()
+            raise SiegeniaError("Timeout waiting for response") from exc
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            command_stats.errors += 1
+            raise
+        finally:
+            self._awaiting.pop(req_id, None)
+
+    def timeout_for(self, command: str, default: float | None = None) -> float:
+        """Return the response deadline derived from the command's observed RTT.
+
+        Uses ``default`` (or the configured ceiling) until the command has been
+        answered at least once.
+        """
+        command_stats = self._stats.commands.get(command)
+        if command_stats is None or command_stats.srtt is None:
+            return self._timeout_ceiling if default is None else default
+        return command_stats.timeout(self._timeout_floor, self._timeout_ceiling)
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of request, traffic and connection counters.
+
+        Safe to call at any time; no debug logging is needed.
+        """
+        snapshot = self._stats.as_dict()
+        snapshot["coalesced"] = self.coalesce_stats()
+        snapshot["queue"] = self.queue_stats()
+        snapshot["heartbeat"] = self.heartbeat_stats()
+        snapshot["reconnect"] = self.reconnect_stats()
+        snapshot["connect"] = self.connect_stats()
+        snapshot["session"] = self.session_stats()
+        snapshot["subscriptions"] = self.subscription_stats()
+        snapshot["connection_state"] = self._connection_state
+        return snapshot
+
+    def queue_stats(self) -> dict[str, Any]:
+        """Return scheduler occupancy and queue wait times per priority class."""
+        return self._scheduler.stats()
+
+    async def _send_coalesced(self, command: str) -> dict[str, Any]:
+        """Send a read command, sharing an identical in-flight request if any.
+
+        Every waiter receives the same response object, so callers must treat
+        it as read-only.
+        """
+        self._coalesce_counts["requests"] += 1
+        inflight = self._inflight_reads.get(command)
+        if inflight is not None and not inflight.done():
+            self._coalesce_counts["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._send_request(command))
+        self._inflight_reads[command] = task
+
+        def _release(done: asyncio.Future[dict[str, Any]]) -> None:
+            if self._inflight_reads.get(command) is done:
+                del self._inflight_reads[command]
+            if not done.cancelled():
+                # Mark the exception retrieved when every waiter was cancelled.
+                done.exception()
+
+        task.add_done_callback(_release)
+        # Shield so one cancelled caller does not fail the other waiters.
+        return await asyncio.shield(task)
+
+    def coalesce_stats(self) -> dict[str, int]:
+        """Return read request totals and how many were served by sharing."""
+        return dict(self._coalesce_counts)
+
+    async def login(self, user: str, password: str, *, long_life: bool = False) -> None:
+        """Authenticate the socket.
+
+        With ``long_life`` the device is asked for a long-lived session that
+        later connections can reuse through ``resume_session()``.
+        """
         resp = await self._send_request(
             {
                 "command": "login",
                 "user": user,
                 "password": password,
-                "long_life": False,
+                "long_life": long_life,
             }
         )
         if resp.get("status") != "ok":
             raise AuthenticationError(str(resp))
+        self._credentials = (user, password)
+        self._long_life = long_life
+        self._session_resumed = False
+        self._auth_epoch += 1
+        self._session_counts["logins"] += 1
+        data = resp.get("data")
+        self._session_info = {
+            "long_life": long_life,
+            "established": time.time(),
+            "data": data if isinstance(data, dict) else None,
+        }
+        self._set_connection_state(CONNECTION_CONNECTED)
+
+    def resume_session(self, user: str, password: str) -> None:
+        """Reuse a long-life session without sending ``login``.
+
+        The first request the device answers with ``not_authenticated`` runs a
+        full long-life login and is retried once.
+        """
+        self._credentials = (user, password)
+        self._long_life = True
+        self._session_resumed = True
+        self._auth_epoch += 1
+        self._session_counts["resumed"] += 1
+        if self._session_info is None:
+            self._session_info = {"long_life": True, "established": None, "data": None}
+        self._set_connection_state(CONNECTION_CONNECTED)
+
+    @property
+    def session_info(self) -> dict[str, Any] | None:
+        """Return details of the last successful login (``None`` before login)."""
+        return dict(self._session_info) if self._session_info is not None else None
+
+    def session_stats(self) -> dict[str, int]:
+        """Return full logins, resumed sessions, resume fallbacks and expiry re-logins."""
+        return dict(self._session_counts)
 
     async def keep_alive(self) -> None:
         await self._send_request("keepAlive", {"extend_session": True})
 
     async def start_heartbeat(self, interval: float = 10.0) -> None:
+        """Send keepAlive whenever the socket has been idle for ``interval``.
+
+        Any answered request counts as activity, so regular polling keeps the
+        session alive without extra keepAlive frames.
+        """
+
         async def _loop() -> None:
+            delay = interval
             try:
                 while True:
-                    await asyncio.sleep(interval)
+                    await asyncio.sleep(delay)
+                    idle = time.monotonic() - self._last_activity
+                    if idle < interval:
+                        self._heartbeat_counts["suppressed"] += 1
+                        delay = interval - idle
+                        continue
+                    delay = interval
                     try:
                         await self.keep_alive()
+                        self._heartbeat_counts["sent"] += 1
                     except Exception as exc:  # noqa: BLE001
                         self._logger(f"Heartbeat error: {exc}")
             except asyncio.CancelledError:  # task cancelled on disconnect
@@ -216,14 +967,18 @@ class SiegeniaClient:
         if self._hb_task is None or self._hb_task.done():
             self._hb_task = asyncio.create_task(_loop())
 
+    def heartbeat_stats(self) -> dict[str, int]:
+        """Return how many keepAlive frames were sent and suppressed."""
+        return dict(self._heartbeat_counts)
+
     async def get_device(self) -> dict[str, Any]:
-        return await self._send_request("getDevice")
+        return await self._send_coalesced("getDevice")
 
     async def get_device_params(self) -> dict[str, Any]:
-        return await self._send_request("getDeviceParams")
+        return await self._send_coalesced("getDeviceParams")
 
     async def get_device_details(self) -> dict[str, Any]:
-        return await self._send_request("getDeviceDetails")
+        return await self._send_coalesced("getDeviceDetails")
 
     async def set_device_params(self, params: Mapping[str, Any]) -> dict[str, Any]:
         return await self._send_request("setDeviceParams", params)
@@ -235,6 +990,30 @@ class SiegeniaClient:
     async def stop(self, sash: int) -> None:
         await self.set_device_params({"stop": {str(sash): True}})
 
+    async def open_close_many(self, actions: Mapping[int, str]) -> None:
+        """Send actions for several sashes in as few frames as possible.
+
+        ``STOP`` entries go out first as one ``stop`` frame; all other actions
+        share one ``openclose`` frame. Raises ``ValueError`` for an empty
+        mapping or an action outside ``SASH_ACTIONS``.
+        """
+        stops: dict[str, bool] = {}
+        moves: dict[str, str] = {}
+        for sash, action in actions.items():
+            name = str(action).strip().upper()
+            if name not in SASH_ACTIONS:
+                raise ValueError(f"Unknown sash action: {action}")
+            if name == "STOP":
+                stops[str(sash)] = True
+            else:
+                moves[str(sash)] = name
+        if not stops and not moves:
+            raise ValueError("No sash actions given")
+        if stops:
+            await self.set_device_params({"stop": stops})
+        if moves:
+            await self.set_device_params({"openclose": moves})
+
     async def reset_device(self) -> None:
         await self._send_request("resetDevice")
 
@@ -244,12 +1023,54 @@ class SiegeniaClient:
     async def renew_cert(self) -> None:
         await self._send_request("renewCert")
 
-    def set_push_callback(self, cb: Callable[[dict[str, Any]], None] | None) -> None:
+    def set_push_callback(
+        self,
+        cb: Callable[[dict[str, Any]], None] | None,
+        *,
+        commands: Iterable[str] | None = None,
+    ) -> None:
         """Register a callback for unsolicited device messages.
 
-        Called with the raw message dictionary from the device.
+        Called with the raw message dictionary from the device. With
+        ``commands`` only those pushes are delivered, and pushes nobody
+        listens for are counted and dropped before they are decoded.
         """
         self._on_push = cb
+        self._push_commands = frozenset(commands) if commands is not None else None
+
+    def _wants_push(self, command: str) -> bool:
+        if self._on_push is not None and (self._push_commands is None or command in self._push_commands):
+            return True
+        return any(subscription.wants(command) for subscription in self._subscriptions)
+
+    def subscribe(
+        self,
+        commands: Iterable[str] | None = None,
+        *,
+        maxsize: int = DEFAULT_SUBSCRIPTION_QUEUE,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+    ) -> PushSubscription:
+        """Return an async iterator over push messages.
+
+        ``commands`` limits the stream to those push commands (all when
+        ``None``). Each subscription has its own queue of ``maxsize`` messages;
+        ``overflow`` is ``"drop_oldest"`` or ``"coalesce_latest"``. The receiver
+        loop never waits for subscribers. Iteration ends after ``close()``,
+        leaving an ``async with`` block, or ``disconnect()``. Messages are shared
+        between subscribers and must not be modified.
+        """
+        subscription = PushSubscription(
+            commands,
+            maxsize=maxsize,
+            overflow=overflow,
+            on_close=self._subscriptions.remove,
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def subscription_stats(self) -> list[dict[str, Any]]:
+        """Return queue depth and delivered/dropped/coalesced counts per subscriber."""
+        return [subscription.stats() for subscription in self._subscriptions]
 
 
 _SENSITIVE_KEYS = frozenset({"password", "passwd", "secret", "token", "authorization"})
@@ -0,0 +1,251 @@
+"""Scriptable in-process Siegenia device for tests and benchmarks.
+
+``SiegeniaSimulator`` speaks the device's WebSocket protocol over a
+``LoopbackTransport``::
+
+    sim = SiegeniaSimulator(sashes=2, latency=0.005)
+    client = SiegeniaClient("sim", ws_protocol="ws", transport=sim.transport())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .transport import LoopbackPeer, LoopbackTransport
+
+# Final state a sash settles in after each openclose action.
+ACTION_TARGET_STATES: dict[str, str] = {
+    "OPEN": "OPEN",
+    "CLOSE": "CLOSED",
+    "CLOSE_WO_LOCK": "CLOSED_WO_LOCK",
+    "GAP_VENT": "GAP_VENT",
+    "STOP_OVER": "STOP_OVER",
+}
+
+ScriptHandler = Callable[["SiegeniaSimulator", dict[str, Any]], dict[str, Any] | None]
+
+
+class _Session:
+    __slots__ = ("peer", "authenticated")
+
+    def __init__(self, peer: LoopbackPeer) -> None:
+        self.peer = peer
+        self.authenticated = False
+
+
+class SiegeniaSimulator:
+    """One virtual Siegenia controller.
+
+    ``latency`` is a delay in seconds applied before each answer, or a
+    callable ``latency(command) -> seconds``. ``failure_rate`` answers that
+    share of requests with ``status: "error"``. Motion commands report
+    ``MOVING`` and push ``deviceParams`` every ``push_interval`` seconds
+    until the sash settles after ``motion_time`` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        serial: str = "SIM00000001",
+        name: str = "Siegenia Simulator",
+        sashes: int = 1,
+        user: str = "admin",
+        password: str = "password",
+        latency: float | Callable[[str], float] = 0.0,
+        motion_time: float = 1.0,
+        push_interval: float = 0.25,
+        failure_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.user = user
+        self.password = password
+        self.latency = latency
+        self.motion_time = motion_time
+        self.push_interval = push_interval
+        self.failure_rate = failure_rate
+        self.device: dict[str, Any] = {
+            "devicename": name,
+            "serialnr": serial,
+            "type": 6,
+            "softwareversion": "1.7.2",
+            "hardwareversion": "1.2",
+        }
+        self.params: dict[str, Any] = {
+            "states": {str(sash): "CLOSED" for sash in range(sashes)},
+            "warnings": [],
+            "stopover": 3,
+            "max_stopover": 13,
+            "timer": {"enabled": False, "duration": {"hour": 0, "minute": 0}, "remainingtime": {"hour": 0, "minute": 0}},
+            "firmware_update": 0,
+        }
+        self.requests: dict[str, int] = {}
+        # Every request frame in arrival order, across connections.
+        self.received: list[dict[str, Any]] = []
+        self.pushes_sent = 0
+        self._random = random.Random(seed)
+        self._sessions: set[_Session] = set()
+        self._scripts: dict[str, ScriptHandler] = {}
+        self._failures: dict[str, list[str]] = {}
+        self._motions: dict[str, asyncio.Task[None]] = {}
+
+    def transport(self) -> LoopbackTransport:
+        """Return a new loopback transport connected to this device."""
+        return LoopbackTransport(self.serve)
+
+    # Scripting and fault injection
+
+    def script(self, command: str, handler: ScriptHandler | None) -> None:
+        """Answer ``command`` with ``handler(sim, request)``; ``None`` restores the default.
+
+        A handler returning ``None`` sends no answer, which lets tests
+        provoke client timeouts.
+        """
+        if handler is None:
+            self._scripts.pop(command, None)
+        else:
+            self._scripts[command] = handler
+
+    def inject_failure(self, command: str, status: str = "error", *, times: int = 1) -> None:
+        """Answer the next ``times`` ``command`` requests with ``status``."""
+        self._failures.setdefault(command, []).extend([status] * times)
+
+    def expire_sessions(self) -> None:
+        """Forget all logins; requests get ``not_authenticated`` until a new login."""
+        for session in self._sessions:
+            session.authenticated = False
+
+    def drop_connections(self) -> None:
+        """Close every open socket from the device side."""
+        for session in list(self._sessions):
+            session.peer.close()
+
+    @property
+    def connections(self) -> int:
+        return len(self._sessions)
+
+    # Protocol
+
+    async def serve(self, peer: LoopbackPeer) -> None:
+        session = _Session(peer)
+        self._sessions.add(session)
+        try:
+            async for raw in peer:
+                request = json.loads(raw)
+                self.received.append(request)
+                delay = self.latency(request.get("command", "")) if callable(self.latency) else self.latency
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                response = self._answer(session, request)
+                if response is not None:
+                    if "id" in request:
+                        response["id"] = request["id"]
+                    peer.send_nowait(json.dumps(response))
+        finally:
+            self._sessions.discard(session)
+
+    def _answer(self, session: _Session, request: dict[str, Any]) -> dict[str, Any] | None:
+        command = str(request.get("command"))
+        self.requests[command] = self.requests.get(command, 0) + 1
+        failures = self._failures.get(command)
+        if failures:
+            return {"status": failures.pop(0)}
+        script = self._scripts.get(command)
+        if script is not None:
+            response = script(self, request)
+            if response is not None and command == "login" and response.get("status") == "ok":
+                session.authenticated = True
+            return response
+        if command == "login":
+            if request.get("user") == self.user and request.get("password") == self.password:
+                session.authenticated = True
+                return {"status": "ok", "data": {"isadmin": True}}
+            return {"status": "authentication_error"}
+        if not session.authenticated:
+            return {"status": "not_authenticated"}
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            return {"status": "error"}
+        if command == "getDevice":
+            return {"status": "ok", "data": dict(self.device)}
+        if command == "getDeviceParams":
+            return {"status": "ok", "data": self._params_snapshot()}
+        if command == "getDeviceDetails":
+            return {"status": "ok", "data": {"serialnr": self.device["serialnr"], "sashes": len(self.params["states"])}}
+        if command == "setDeviceParams":
+            return self._set_params(request.get("params") or {})
+        if command in {"keepAlive", "resetDevice", "rebootDevice", "renewCert"}:
+            return {"status": "ok"}
+        return {"status": "unknown_command"}
+
+    def _params_snapshot(self) -> dict[str, Any]:
+        snapshot = dict(self.params)
+        snapshot["states"] = dict(self.params["states"])
+        return snapshot
+
+    def _set_params(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        states = self.params["states"]
+        # Reject the whole request before moving anything, like the device.
+        targets: dict[str, str] = {}
+        for sash, action in (params.get("openclose") or {}).items():
+            target = ACTION_TARGET_STATES.get(str(action).upper())
+            if sash not in states or target is None:
+                return {"status": "error"}
+            targets[sash] = target
+        for sash in (params.get("stop") or {}):
+            if sash in states:
+                self._cancel_motion(sash)
+                states[sash] = "STOPPED"
+        for sash, target in targets.items():
+            self._start_motion(sash, target)
+        for key, value in params.items():
+            if key not in {"stop", "openclose"}:
+                self.params[key] = value
+        if params.get("stop") or params.get("openclose"):
+            self.push_params()
+        return {"status": "ok"}
+
+    def push_params(self) -> None:
+        """Push the current ``deviceParams`` to every logged-in connection."""
+        self.push({"command": "deviceParams", "data": self._params_snapshot()})
+
+    def push(self, message: Mapping[str, Any]) -> None:
+        """Send ``message`` unsolicited to every logged-in connection."""
+        frame = json.dumps(message)
+        for session in self._sessions:
+            if session.authenticated:
+                session.peer.send_nowait(frame)
+                self.pushes_sent += 1
+
+    def _start_motion(self, sash: str, target: str) -> None:
+        self._cancel_motion(sash)
+        self.params["states"][sash] = "MOVING"
+        self._motions[sash] = asyncio.create_task(self._move(sash, target))
+
+    def _cancel_motion(self, sash: str) -> None:
+        task = self._motions.pop(sash, None)
+        if task is not None:
+            task.cancel()
+
+    async def _move(self, sash: str, target: str) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.motion_time
+        while (remaining := deadline - loop.time()) > 0:
+            await asyncio.sleep(min(self.push_interval, remaining))
+            if loop.time() < deadline:
+                self.push_params()
+        self.params["states"][sash] = target
+        self._motions.pop(sash, None)
+        self.push_params()
+
+    async def close(self) -> None:
+        """Stop motions and close every connection."""
+        motions = list(self._motions.values())
+        self._motions.clear()
+        for task in motions:
+            task.cancel()
+        if motions:
+            await asyncio.gather(*motions, return_exceptions=True)
+        self.drop_connections()
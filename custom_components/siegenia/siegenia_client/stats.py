@@ -0,0 +1,154 @@
+"""Request latency and traffic counters for SiegeniaClient."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from typing import Any
+
+# Histogram bucket upper bounds in seconds: 1 ms growing by 1.5x to ~25 s.
+# Anything slower lands in one extra overflow bucket.
+RTT_BUCKETS: tuple[float, ...] = tuple(0.001 * 1.5**i for i in range(26))
+
+_RECENT_UNMATCHED = 16
+
+
+class CommandStats:
+    """Round-trip counters and a fixed-bucket RTT histogram for one command."""
+
+    __slots__ = ("count", "errors", "timeouts", "total", "max", "buckets", "srtt", "rttvar", "backoff")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(RTT_BUCKETS) + 1)
+        # Smoothed RTT and its mean deviation (RFC 6298 style EWMA).
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.backoff = 0
+
+    def record(self, rtt: float) -> None:
+        self.count += 1
+        self.total += rtt
+        if rtt > self.max:
+            self.max = rtt
+        self.buckets[bisect_left(RTT_BUCKETS, rtt)] += 1
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.backoff = 0
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+        # Double the next deadline, like a TCP retransmission timer.
+        self.backoff = min(self.backoff + 1, 6)
+
+    def timeout(self, floor: float, ceiling: float) -> float:
+        """Return the adaptive response deadline clamped to ``[floor, ceiling]``."""
+        if self.srtt is None:
+            return ceiling
+        deadline = (self.srtt + 4 * self.rttvar) * (2**self.backoff)
+        return max(floor, min(ceiling, deadline))
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket upper bound covering ``fraction`` of samples."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if hits and seen >= rank:
+                if index >= len(RTT_BUCKETS):
+                    return self.max
+                return min(RTT_BUCKETS[index], self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "avg": (self.total / self.count) if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "srtt": self.srtt,
+            "rttvar": self.rttvar if self.srtt is not None else None,
+        }
+
+
+class ClientStats:
+    """Counters updated on the client's hot paths.
+
+    Recording only bumps integers and preallocated histogram buckets; the
+    dictionaries returned by ``as_dict`` are built on demand.
+    """
+
+    __slots__ = (
+        "commands",
+        "bytes_in",
+        "bytes_out",
+        "frames_in",
+        "frames_out",
+        "push_frames",
+        "dropped_pushes",
+        "unmatched_responses",
+        "recent_unmatched_ids",
+    )
+
+    def __init__(self) -> None:
+        self.commands: dict[str, CommandStats] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.frames_in = 0
+        self.frames_out = 0
+        self.push_frames: dict[str, int] = {}
+        self.dropped_pushes: dict[str, int] = {}
+        self.unmatched_responses = 0
+        self.recent_unmatched_ids: deque[Any] = deque(maxlen=_RECENT_UNMATCHED)
+
+    def command(self, name: str) -> CommandStats:
+        stats = self.commands.get(name)
+        if stats is None:
+            stats = self.commands[name] = CommandStats()
+        return stats
+
+    def record_sent(self, size: int) -> None:
+        self.frames_out += 1
+        self.bytes_out += size
+
+    def record_received(self, size: int) -> None:
+        self.frames_in += 1
+        self.bytes_in += size
+
+    def record_push(self, command: str | None) -> None:
+        key = command or "unknown"
+        self.push_frames[key] = self.push_frames.get(key, 0) + 1
+
+    def record_push_dropped(self, command: str) -> None:
+        self.dropped_pushes[command] = self.dropped_pushes.get(command, 0) + 1
+
+    def record_unmatched(self, req_id: Any) -> None:
+        self.unmatched_responses += 1
+        self.recent_unmatched_ids.append(req_id)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": {name: stats.as_dict() for name, stats in self.commands.items()},
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "push_frames": dict(self.push_frames),
+            "dropped_pushes": dict(self.dropped_pushes),
+            "unmatched_responses": self.unmatched_responses,
+            "recent_unmatched_ids": list(self.recent_unmatched_ids),
+        }
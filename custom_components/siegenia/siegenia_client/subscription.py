@@ -0,0 +1,118 @@
+"""Bounded push-message streams for SiegeniaClient subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_COALESCE_LATEST = "coalesce_latest"
+OVERFLOW_POLICIES = frozenset({OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE_LATEST})
+
+DEFAULT_SUBSCRIPTION_QUEUE = 32
+
+
+class PushSubscription:
+    """Async iterator over push messages with a bounded queue.
+
+    ``offer()`` is called from the client's receiver loop and never waits:
+    when the queue is full the oldest message is dropped. With the
+    ``coalesce_latest`` policy a queued message for the same command is
+    replaced by the newer one first, so a slow consumer still sees the
+    latest state of every command.
+    """
+
+    def __init__(
+        self,
+        commands: Iterable[str] | None = None,
+        *,
+        maxsize: int = DEFAULT_SUBSCRIPTION_QUEUE,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        on_close: Callable[[PushSubscription], None] | None = None,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.commands: frozenset[str] | None = frozenset(commands) if commands is not None else None
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._queue: deque[dict[str, Any]] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._closed = False
+        self._on_close = on_close
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def wants(self, command: str | None) -> bool:
+        return self.commands is None or command in self.commands
+
+    def offer(self, message: dict[str, Any]) -> None:
+        """Queue ``message`` without blocking; apply the overflow policy."""
+        if self._closed:
+            return
+        queue = self._queue
+        if self.overflow == OVERFLOW_COALESCE_LATEST:
+            command = message.get("command")
+            for index, queued in enumerate(queue):
+                if queued.get("command") == command:
+                    queue[index] = message
+                    self.coalesced += 1
+                    return
+        if len(queue) >= self.maxsize:
+            queue.popleft()
+            self.dropped += 1
+        queue.append(message)
+        self._wake()
+
+    def close(self) -> None:
+        """End iteration once the queued messages are consumed."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake()
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def __aiter__(self) -> PushSubscription:
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        while not self._queue:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        self.delivered += 1
+        return self._queue.popleft()
+
+    async def __aenter__(self) -> PushSubscription:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "commands": sorted(self.commands) if self.commands is not None else None,
+            "overflow": self.overflow,
+            "queued": len(self._queue),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
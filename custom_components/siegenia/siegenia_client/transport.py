@@ -0,0 +1,180 @@
+"""WebSocket transports for SiegeniaClient."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Protocol
+
+from aiohttp import ClientSession, WSMessage, WSMsgType
+
+
+class WebSocketLike(Protocol):
+    """The part of ``aiohttp.ClientWebSocketResponse`` the client uses."""
+
+    @property
+    def closed(self) -> bool: ...
+
+    async def send_str(self, data: str) -> None: ...
+
+    async def close(self) -> Any: ...
+
+    def __aiter__(self) -> Any: ...
+
+
+class Transport(Protocol):
+    """Opens WebSockets for a client; ``close()`` releases what it owns."""
+
+    async def connect(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        ssl_context: ssl.SSLContext | None,
+    ) -> WebSocketLike: ...
+
+    async def close(self) -> None: ...
+
+
+class AiohttpTransport:
+    """Default transport on an aiohttp ``ClientSession``.
+
+    A session passed in is left open on ``close()``; one created here is
+    closed and re-created on the next ``connect()``.
+    """
+
+    def __init__(self, session: ClientSession | None = None) -> None:
+        self._session = session
+        self._own_session = False
+
+    async def connect(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        ssl_context: ssl.SSLContext | None,
+    ) -> WebSocketLike:
+        if self._session is None:
+            self._session = ClientSession()
+            self._own_session = True
+        kwargs: dict[str, Any] = {"headers": dict(headers)}
+        if ssl_context is not None:
+            kwargs["ssl"] = ssl_context
+        return await self._session.ws_connect(url, **kwargs)
+
+    async def close(self) -> None:
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._own_session = False
+
+
+_CLOSE = WSMessage(WSMsgType.CLOSED, None, None)
+
+
+class LoopbackPeer:
+    """Server end of an in-process socket, handed to the loopback handler."""
+
+    def __init__(self) -> None:
+        self._to_server: asyncio.Queue[str | None] = asyncio.Queue()
+        self._to_client: asyncio.Queue[WSMessage] = asyncio.Queue()
+        self.closed = False
+
+    async def send_str(self, data: str) -> None:
+        self.send_nowait(data)
+
+    def send_nowait(self, data: str) -> None:
+        if not self.closed:
+            self._to_client.put_nowait(WSMessage(WSMsgType.TEXT, data, None))
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._to_client.put_nowait(_CLOSE)
+            self._to_server.put_nowait(None)
+
+    def __aiter__(self) -> LoopbackPeer:
+        return self
+
+    async def __anext__(self) -> str:
+        data = await self._to_server.get()
+        if data is None:
+            raise StopAsyncIteration
+        return data
+
+
+class LoopbackWebSocket:
+    """Client end of an in-process socket; mimics ``ClientWebSocketResponse``."""
+
+    def __init__(self, peer: LoopbackPeer) -> None:
+        self._peer = peer
+        # Like aiohttp, a close by the server is only noticed once read.
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def send_str(self, data: str) -> None:
+        if self._closed:
+            raise ConnectionResetError("Loopback socket is closed")
+        if not self._peer.closed:
+            self._peer._to_server.put_nowait(data)
+
+    async def close(self) -> bool:
+        self._closed = True
+        self._peer.close()
+        return True
+
+    def __aiter__(self) -> LoopbackWebSocket:
+        return self
+
+    async def __anext__(self) -> WSMessage:
+        if self._closed:
+            raise StopAsyncIteration
+        msg = await self._peer._to_client.get()
+        if msg.type == WSMsgType.CLOSED:
+            self._closed = True
+            raise StopAsyncIteration
+        return msg
+
+
+class LoopbackTransport:
+    """In-process transport: each ``connect()`` runs ``handler(peer)`` as a task.
+
+    No sockets, TLS or event-loop I/O are involved, so hundreds of clients can
+    talk to simulated devices inside one process.
+    """
+
+    def __init__(self, handler: Callable[[LoopbackPeer], Awaitable[None]]) -> None:
+        self._handler = handler
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.connects = 0
+
+    async def connect(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        ssl_context: ssl.SSLContext | None,
+    ) -> WebSocketLike:
+        peer = LoopbackPeer()
+        self.connects += 1
+        task = asyncio.create_task(self._serve(peer))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return LoopbackWebSocket(peer)
+
+    async def _serve(self, peer: LoopbackPeer) -> None:
+        try:
+            await self._handler(peer)
+        finally:
+            peer.close()
+
+    async def close(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,201 @@
+"""Parsed, read-only view of a device's getDeviceParams payload."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from .const import STATE_MOVING
+
+_EMPTY_MAPPING: Mapping[Any, Any] = MappingProxyType({})
+
+# Listener keys for the slices entities depend on; see ``changed_keys``.
+KEY_STATES = "states"
+KEY_WARNINGS = "warnings"
+KEY_TIMER = "timer"
+KEY_STOPOVER = "stopover"
+KEY_DEVICESTATE = "devicestate"
+KEY_FIRMWARE = "firmware_update"
+
+
+def state_key(sash: int) -> str:
+    """Return the listener key for one sash's state (``states/<sash>``)."""
+    return f"{KEY_STATES}/{int(sash)}"
+
+
+def _as_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class DeviceSnapshot:
+    """Immutable device parameters, parsed once per poll or push.
+
+    ``version`` increases with every payload the coordinator parses, so
+    consumers can tell snapshots apart without comparing fields. ``states``
+    maps integer sash numbers to the raw device state (``OPEN``, ``MOVING`` …).
+    Fields missing from the payload are ``None`` (or empty for ``states`` and
+    ``warnings``).
+    """
+
+    __slots__ = (
+        "version",
+        "states",
+        "warnings",
+        "timer_enabled",
+        "timer_remaining",
+        "stopover",
+        "max_stopover",
+        "devicestate",
+        "device_active",
+        "firmware_update",
+    )
+
+    version: int
+    states: Mapping[int, str]
+    warnings: tuple[str, ...]
+    timer_enabled: bool | None
+    timer_remaining: tuple[int, int] | None
+    stopover: int | None
+    max_stopover: int | None
+    devicestate: Mapping[str, Any]
+    device_active: bool | None
+    firmware_update: Any
+
+    def __init__(
+        self,
+        *,
+        version: int = 0,
+        states: Mapping[int, str] | None = None,
+        warnings: tuple[str, ...] = (),
+        timer_enabled: bool | None = None,
+        timer_remaining: tuple[int, int] | None = None,
+        stopover: int | None = None,
+        max_stopover: int | None = None,
+        devicestate: Mapping[str, Any] | None = None,
+        device_active: bool | None = None,
+        firmware_update: Any = None,
+    ) -> None:
+        _set = object.__setattr__
+        _set(self, "version", version)
+        _set(self, "states", MappingProxyType(dict(states)) if states else _EMPTY_MAPPING)
+        _set(self, "warnings", tuple(warnings))
+        _set(self, "timer_enabled", timer_enabled)
+        _set(self, "timer_remaining", timer_remaining)
+        _set(self, "stopover", stopover)
+        _set(self, "max_stopover", max_stopover)
+        _set(self, "devicestate", MappingProxyType(dict(devicestate)) if devicestate else _EMPTY_MAPPING)
+        _set(self, "device_active", device_active)
+        _set(self, "firmware_update", firmware_update)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"<DeviceSnapshot v{self.version} states={dict(self.states)} warnings={len(self.warnings)}>"
+
+    @classmethod
+    def from_params(cls, params: Mapping[str, Any] | None, version: int) -> DeviceSnapshot:
+        """Parse a ``getDeviceParams`` response or ``deviceParams`` push."""
+        data = (params or {}).get("data") or {}
+        if not isinstance(data, Mapping):
+            return cls(version=version)
+
+        states: dict[int, str] = {}
+        raw_states = data.get("states")
+        if isinstance(raw_states, Mapping):
+            for key, value in raw_states.items():
+                sash = _as_int(key)
+                if sash is not None and value is not None:
+                    states[sash] = str(value)
+
+        raw_warnings = data.get("warnings") or ()
+        if isinstance(raw_warnings, (str, Mapping)):
+            raw_warnings = (raw_warnings,)
+        warnings = tuple(w if isinstance(w, str) else str(w) for w in raw_warnings)
+
+        timer_enabled: bool | None = None
+        timer_remaining: tuple[int, int] | None = None
+        timer = data.get("timer")
+        if isinstance(timer, Mapping):
+            enabled = timer.get("enabled")
+            timer_enabled = None if enabled is None else bool(enabled)
+            remaining = timer.get("remainingtime")
+            if isinstance(remaining, Mapping):
+                hour = _as_int(remaining.get("hour"))
+                minute = _as_int(remaining.get("minute"))
+                if hour is not None and minute is not None:
+                    timer_remaining = (hour, minute)
+
+        devicestate = data.get("devicestate")
+        if not isinstance(devicestate, Mapping):
+            devicestate = None
+        active = (devicestate or {}).get("deviceactive")
+
+        return cls(
+            version=version,
+            states=states,
+            warnings=warnings,
+            timer_enabled=timer_enabled,
+            timer_remaining=timer_remaining,
+            stopover=_as_int(data.get("stopover")),
+            max_stopover=_as_int(data.get("max_stopover")),
+            devicestate=devicestate,
+            device_active=None if active is None else bool(active),
+            firmware_update=data.get("firmware_update"),
+        )
+
+    def same_values(self, other: DeviceSnapshot) -> bool:
+        """Return True if ``other`` carries the same device values (any version)."""
+        if other is self:
+            return True
+        return all(getattr(self, name) == getattr(other, name) for name in _VALUE_FIELDS)
+
+    def state(self, sash: int) -> str | None:
+        return self.states.get(int(sash))
+
+    @property
+    def sashes(self) -> list[int]:
+        """Reported sash numbers; ``[0]`` before the first payload."""
+        return sorted(self.states) or [0]
+
+    @property
+    def moving(self) -> bool:
+        return any(state == STATE_MOVING for state in self.states.values())
+
+
+_VALUE_FIELDS = tuple(name for name in DeviceSnapshot.__slots__ if name != "version")
+
+_FIELD_KEYS: tuple[tuple[str, str], ...] = (
+    ("warnings", KEY_WARNINGS),
+    ("timer_enabled", KEY_TIMER),
+    ("timer_remaining", KEY_TIMER),
+    ("stopover", KEY_STOPOVER),
+    ("max_stopover", KEY_STOPOVER),
+    ("devicestate", KEY_DEVICESTATE),
+    ("device_active", KEY_DEVICESTATE),
+    ("firmware_update", KEY_FIRMWARE),
+)
+
+
+def changed_keys(old: DeviceSnapshot, new: DeviceSnapshot) -> set[str]:
+    """Return the listener keys whose values differ between two snapshots.
+
+    A changed sash yields both ``states/<sash>`` and ``states``.
+    """
+    keys = {key for name, key in _FIELD_KEYS if getattr(old, name) != getattr(new, name)}
+    for sash in old.states.keys() | new.states.keys():
+        if old.states.get(sash) != new.states.get(sash):
+            keys.add(state_key(sash))
+    if any(key.startswith(f"{KEY_STATES}/") for key in keys):
+        keys.add(KEY_STATES)
+    return keys
+
+
+EMPTY_SNAPSHOT = DeviceSnapshot()
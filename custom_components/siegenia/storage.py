@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+STORAGE_KEY_SESSIONS = f"{DOMAIN}.sessions"
+STORAGE_KEY_MOTION = f"{DOMAIN}.motion_profiles"
+STORAGE_KEY_DEVICES = f"{DOMAIN}.devices"
+
+_StoreT = TypeVar("_StoreT", bound="SiegeniaSerialStore")
+
+
+class SiegeniaSerialStore:
+    """Records per device serial, persisted in HA storage with debounced writes."""
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, key)
+        self._data: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        self._data = dict(stored) if isinstance(stored, dict) else {}
+
+    def get(self, serial: str) -> dict[str, Any] | None:
+        return self._data.get(serial)
+
+    def async_set(self, serial: str, info: dict[str, Any]) -> None:
+        if self._data.get(serial) == info:
+            return
+        self._data[serial] = dict(info)
+        self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
+
+    def async_remove(self, serial: str) -> None:
+        if self._data.pop(serial, None) is not None:
+            self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
+
+
+class SiegeniaSessionCache(SiegeniaSerialStore):
+    """Long-life login sessions per device serial."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(hass, STORAGE_KEY_SESSIONS)
+
+
+class SiegeniaMotionProfiles(SiegeniaSerialStore):
+    """Learned travel times per device serial (see ``motion.MotionPredictor``)."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(hass, STORAGE_KEY_MOTION)
+
+
+class SiegeniaDeviceCache(SiegeniaSerialStore):
+    """Last device info and getDeviceParams payload per device serial."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(hass, STORAGE_KEY_DEVICES)
+
+
+async def _async_get_shared(hass: HomeAssistant, key: str, factory: Callable[[HomeAssistant], _StoreT]) -> _StoreT:
+    lock = hass.data.setdefault(f"{key}_lock", asyncio.Lock())
+    async with lock:
+        store = hass.data.get(key)
+        if store is None:
+            store = factory(hass)
+            await store.async_load()
+            hass.data[key] = store
+    return store
+
+
+async def async_get_session_cache(hass: HomeAssistant) -> SiegeniaSessionCache:
+    """Return the domain-wide session cache, loading it on first use."""
+    return await _async_get_shared(hass, f"{DOMAIN}_session_cache", SiegeniaSessionCache)
+
+
+async def async_get_motion_profiles(hass: HomeAssistant) -> SiegeniaMotionProfiles:
+    """Return the domain-wide motion profile store, loading it on first use."""
+    return await _async_get_shared(hass, f"{DOMAIN}_motion_profiles", SiegeniaMotionProfiles)
+
+
+async def async_get_device_cache(hass: HomeAssistant) -> SiegeniaDeviceCache:
+    """Return the domain-wide device cache, loading it on first use."""
+    return await _async_get_shared(hass, f"{DOMAIN}_device_cache", SiegeniaDeviceCache)
@@ -4,7 +4,6 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -13,6 +12,7 @@ from .const import (
     device_configuration_url,
     resolve_model,
 )
+from .entity import SiegeniaCoordinatorEntity
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:  # type: ignore[no-untyped-def]
@@ -21,7 +21,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities([SiegeniaOpeningLockSwitch(coordinator, entry, serial)])
 
 
-class SiegeniaOpeningLockSwitch(CoordinatorEntity, SwitchEntity):
+class SiegeniaOpeningLockSwitch(SiegeniaCoordinatorEntity, SwitchEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "opening_lock"
     _attr_entity_category = EntityCategory.CONFIG
@@ -5,9 +5,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, device_configuration_url, resolve_model
+from .entity import SiegeniaCoordinatorEntity
+from .snapshot import KEY_FIRMWARE
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:  # type: ignore[no-untyped-def]
@@ -15,10 +16,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities([SiegeniaFirmwareUpdate(coordinator, entry)])
 
 
-class SiegeniaFirmwareUpdate(CoordinatorEntity, UpdateEntity):
+class SiegeniaFirmwareUpdate(SiegeniaCoordinatorEntity, UpdateEntity):
     _attr_has_entity_name = True
     _attr_translation_key = "firmware"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_keys = (KEY_FIRMWARE,)
 
     def __init__(self, coordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
@@ -73,9 +75,7 @@ class SiegeniaFirmwareUpdate(CoordinatorEntity, UpdateEntity):
     @property
     def available_updates(self) -> int | None:  # noqa: D401
         # Map firmware_update flag: non-zero means available
-        params = self.coordinator.data or {}
-        data = params.get("data") or {}
-        flag = data.get("firmware_update")
+        flag = self.coordinator.snapshot.firmware_update
         if flag is None:
             info = (self.coordinator.device_info or {}).get("data", {})
             flag = info.get("firmware_update")
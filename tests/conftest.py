@@ -62,6 +62,7 @@ def mock_client(monkeypatch):
                 }
             })
             self.open_close = AsyncMock()
+            self.open_close_many = AsyncMock()
             self.stop = AsyncMock()
             self.reboot_device = AsyncMock()
             self.reset_device = AsyncMock()
@@ -108,5 +109,6 @@ async def setup_integration(hass, mock_client, config_entry_data):  # noqa: ARG0
     entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data, title="Siegenia Test")
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    # Devices connect in a background task after setup returns
+    await hass.async_block_till_done(wait_background_tasks=True)
     return entry
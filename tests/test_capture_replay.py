@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.siegenia.const import DOMAIN
+from custom_components.siegenia.replay import async_replay_capture
+from custom_components.siegenia.siegenia_client import (
+    FrameCapture,
+    SiegeniaClient,
+    SiegeniaSimulator,
+    read_capture,
+)
+from custom_components.siegenia.siegenia_client import capture as capture_module
+
+
+async def test_capture_records_redacted_frames_with_rotation(tmp_path) -> None:  # noqa: ANN001
+    path = tmp_path / "device.jsonl.gz"
+    capture = FrameCapture(path, max_bytes=400, backups=5, compress=True)
+    sim = SiegeniaSimulator()
+    client = SiegeniaClient("sim", ws_protocol="ws", transport=sim.transport(), capture=capture)
+    await client.connect()
+    await client.login("admin", "password")
+    for _ in range(3):
+        await client.get_device_params()
+    await client.disconnect()
+    await sim.close()
+    await capture.async_close()
+
+    assert capture.rotations >= 1
+    rotated = sorted(tmp_path.glob("device.jsonl.gz.*"), key=lambda p: -int(p.suffix[1:]))
+    records = list(read_capture(*rotated, path))
+
+    assert len(records) == capture.records == 8
+    assert [r["dir"] for r in records[:2]] == ["send", "recv"]
+    assert records[0]["frame"]["command"] == "login"
+    assert records[0]["frame"]["password"] == "***"
+    assert [r["t"] for r in records] == sorted(r["t"] for r in records)
+
+
+def test_rotated_captures_read_back_with_recorded_timing(tmp_path, monkeypatch) -> None:  # noqa: ANN001
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(capture_module, "time", SimpleNamespace(monotonic=lambda: clock.now, time=time.time))
+    path = tmp_path / "device.jsonl"
+    capture = FrameCapture(path, max_bytes=150, backups=10)
+    for index in range(20):
+        clock.now = index * 0.05
+        capture.record("recv", {"command": "deviceParams", "seq": index})
+    capture.close()
+
+    rotated = sorted(tmp_path.glob("device.jsonl.*"), key=lambda p: -int(p.suffix[1:]))
+    assert len(rotated) >= 4
+    records = list(read_capture(*rotated, path))
+
+    assert [r["frame"]["seq"] for r in records] == list(range(20))
+    assert [r["t"] for r in records] == pytest.approx([index * 0.05 for index in range(20)])
+
+
+async def test_replay_feeds_pushes_and_polls_into_coordinator(hass, setup_integration) -> None:  # noqa: ANN001
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    records = [
+        {"t": 0.0, "dir": "send", "frame": {"id": 7, "command": "getDeviceParams"}},
+        {"t": 0.1, "dir": "recv", "frame": {"id": 7, "status": "ok", "data": {"states": {"0": "OPEN"}, "warnings": []}}},
+        {"t": 0.2, "dir": "recv", "frame": {"command": "deviceParams", "data": {"states": {"0": "MOVING"}}}},
+        {"t": 0.3, "dir": "recv", "frame": {"command": "heartbeat"}},
+        {"t": 0.4, "dir": "recv", "frame": {"command": "deviceParams", "data": {"states": {"0": "CLOSED"}}}},
+    ]
+
+    counts = await async_replay_capture(coordinator, records, speed=None)
+
+    assert counts == {"pushes": 2, "polls": 1, "skipped": 1}
+    assert coordinator.data["data"]["states"] == {"0": "CLOSED"}
+    assert coordinator.data["data"]["warnings"] == []
+
+
+async def test_capture_services_attach_and_detach(hass, setup_integration) -> None:  # noqa: ANN001
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    attached: list[object] = []
+    coordinator.client.set_capture = attached.append
+    eid = next(s.entity_id for s in hass.states.async_all("cover") if s.entity_id.endswith("_window"))
+
+    await hass.services.async_call(DOMAIN, "start_capture", {"entity_id": eid, "compress": False}, blocking=True)
+    capture = attached[-1]
+    assert isinstance(capture, FrameCapture)
+    assert capture.path.parent.name == "siegenia_captures"
+    assert capture.path.name.endswith(".jsonl")
+
+    await hass.services.async_call(DOMAIN, "stop_capture", {"entity_id": eid}, blocking=True)
+    assert attached[-1] is None
+    assert capture.stats()["closed"] is True
@@ -2,14 +2,30 @@ from __future__ import annotations
 
 import asyncio
 import json
+import ssl
 
 import pytest
 
+from custom_components.siegenia.siegenia_client import client as client_module
 from custom_components.siegenia.siegenia_client.client import (
+    CONNECTION_CONNECTED,
+    CONNECTION_DISCONNECTED,
+    CONNECTION_RECONNECTING,
+    PRIORITY_COMMAND,
+    PRIORITY_READ,
+    PRIORITY_SAFETY,
     AuthenticationError,
+    JsonCodec,
     SiegeniaClient,
     SiegeniaError,
+    _peek_push_command,
+    async_get_ssl_context,
+    default_codec,
+    get_ssl_context,
+    request_priority,
 )
+from custom_components.siegenia.siegenia_client.simulator import SiegeniaSimulator
+from custom_components.siegenia.siegenia_client.stats import CommandStats
 
 
 class _ImmediateResponseWebSocket:
@@ -96,3 +112,465 @@ async def test_disconnect_waits_for_background_tasks() -> None:
     assert websocket.closed
     assert heartbeat_task.done()
     assert receiver_task.done()
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), default_codec()])
+def test_codec_decodes_text_and_bytes_frames(codec: JsonCodec) -> None:
+    frame = '{"id":3,"status":"ok","data":{"states":{"0":"OPEN"}}}'
+
+    assert codec.loads(frame) == codec.loads(frame.encode())
+    assert codec.loads(codec.dumps({"command": "getDevice", "id": 3})) == {
+        "command": "getDevice",
+        "id": 3,
+    }
+
+
+async def test_redaction_is_skipped_without_debug_logger(monkeypatch) -> None:
+    def _fail(_value):  # noqa: ANN001
+        raise AssertionError("redaction should not run without a logger")
+
+    monkeypatch.setattr(client_module, "_redact_sensitive_values", _fail)
+    client = SiegeniaClient("192.0.2.1")
+    client._ws = _ImmediateResponseWebSocket(client, {"status": "ok"})  # type: ignore[assignment]
+
+    await client.login("admin", "super-secret-password")
+
+
+async def _drain_loop() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class _DeferredResponseWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, object]] = []
+        self.closed = False
+
+    async def send_str(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+
+async def test_concurrent_identical_reads_share_one_request() -> None:
+    client = SiegeniaClient("192.0.2.1")
+    websocket = _DeferredResponseWebSocket()
+    client._ws = websocket  # type: ignore[assignment]
+
+    waiters = [asyncio.create_task(client.get_device_params()) for _ in range(3)]
+    await _drain_loop()
+
+    assert len(websocket.sent) == 1
+    req_id = websocket.sent[0]["id"]
+    client._awaiting[req_id].set_result({"id": req_id, "status": "ok", "data": {}})  # type: ignore[index]
+    responses = await asyncio.gather(*waiters)
+
+    assert all(response["id"] == req_id for response in responses)
+    assert client.coalesce_stats() == {"requests": 3, "coalesced": 2}
+
+    # A later read after completion goes back on the wire.
+    follow_up = asyncio.create_task(client.get_device_params())
+    await _drain_loop()
+    assert len(websocket.sent) == 2
+    req_id = websocket.sent[1]["id"]
+    client._awaiting[req_id].set_result({"id": req_id, "status": "ok"})  # type: ignore[index]
+    await follow_up
+
+
+async def test_queued_stop_is_sent_before_queued_reads() -> None:
+    client = SiegeniaClient("192.0.2.1", max_in_flight=1)
+    websocket = _DeferredResponseWebSocket()
+    client._ws = websocket  # type: ignore[assignment]
+
+    first = asyncio.create_task(client.keep_alive())
+    await _drain_loop()
+    poll = asyncio.create_task(client.get_device_params())
+    stop = asyncio.create_task(client.stop(0))
+    await _drain_loop()
+
+    assert [frame["command"] for frame in websocket.sent] == ["keepAlive"]
+    assert client.queue_stats()["queued"] == 2
+
+    for expected in ("keepAlive", "setDeviceParams", "getDeviceParams"):
+        frame = websocket.sent[-1]
+        assert frame["command"] == expected
+        client._awaiting[frame["id"]].set_result({"id": frame["id"], "status": "ok"})  # type: ignore[index]
+        await _drain_loop()
+
+    await asyncio.gather(first, poll, stop)
+    stats = client.queue_stats()
+    assert stats["in_flight"] == 0
+    assert stats["wait"]["safety"]["count"] == 1
+    assert stats["wait"]["read"]["count"] == 2
+
+
+def test_request_priority_classifies_safety_commands() -> None:
+    assert request_priority("setDeviceParams", {"stop": {"0": True}}) == PRIORITY_SAFETY
+    assert request_priority("setDeviceParams", {"openclose": {"0": "CLOSE"}}) == PRIORITY_SAFETY
+    assert request_priority("setDeviceParams", {"openclose": {"0": "OPEN"}}) == PRIORITY_COMMAND
+    assert request_priority("getDeviceParams") == PRIORITY_READ
+
+
+async def test_heartbeat_skips_keepalive_while_socket_is_busy() -> None:
+    client = SiegeniaClient("192.0.2.1")
+    websocket = _ImmediateResponseWebSocket(client, {"status": "ok"})
+    sent: list[str] = []
+    send_str = websocket.send_str
+
+    async def _record(message: str) -> None:
+        sent.append(json.loads(message)["command"])
+        await send_str(message)
+
+    websocket.send_str = _record  # type: ignore[method-assign]
+    client._ws = websocket  # type: ignore[assignment]
+
+    await client.start_heartbeat(0.05)
+    for _ in range(6):
+        await client.get_device_params()
+        await asyncio.sleep(0.02)
+    busy = client.heartbeat_stats()
+
+    assert "keepAlive" not in sent
+    assert busy["sent"] == 0
+    assert busy["suppressed"] >= 1
+
+    await asyncio.sleep(0.12)
+    heartbeat_task = client._hb_task
+    assert heartbeat_task is not None
+    heartbeat_task.cancel()
+    await asyncio.gather(heartbeat_task, return_exceptions=True)
+
+    assert "keepAlive" in sent
+    assert client.heartbeat_stats()["sent"] >= 1
+
+
+def _sim_client(sim: SiegeniaSimulator, **kwargs) -> SiegeniaClient:  # noqa: ANN003
+    return SiegeniaClient("sim", ws_protocol="ws", transport=sim.transport(), **kwargs)
+
+
+def _hold(sim: SiegeniaSimulator, command: str) -> None:
+    """Leave ``command`` unanswered until the script is cleared."""
+    sim.script(command, lambda _sim, _request: None)
+
+
+def _commands(sim: SiegeniaSimulator, start: int = 0) -> list[str]:
+    return [frame["command"] for frame in sim.received[start:]]
+
+
+async def test_auto_reconnect_replays_inflight_reads() -> None:
+    sim = SiegeniaSimulator()
+    _hold(sim, "getDeviceParams")
+    client = _sim_client(sim, auto_reconnect=True, replay_requests=True, reconnect_min_delay=0)
+    states: list[str] = []
+    client.add_connection_listener(states.append)
+    await client.connect()
+    await client.login("admin", "password")
+
+    poll = asyncio.create_task(client.get_device_params())
+    await _drain_loop()
+    mark = len(sim.received)
+    sim.script("getDeviceParams", None)
+    sim.drop_connections()
+    response = await asyncio.wait_for(poll, timeout=2)
+
+    assert response["status"] == "ok"
+    assert _commands(sim, mark) == ["login", "getDeviceParams"]
+    assert states == [CONNECTION_CONNECTED, CONNECTION_RECONNECTING, CONNECTION_CONNECTED]
+    assert client.reconnect_stats() == {"attempts": 1, "reconnects": 1, "replayed": 1}
+
+    await client.disconnect()
+    assert states[-1] == CONNECTION_DISCONNECTED
+    await sim.close()
+
+
+async def test_rejected_reconnect_login_stops_retrying() -> None:
+    sim = SiegeniaSimulator()
+    client = _sim_client(sim, auto_reconnect=True, reconnect_min_delay=0.001, reconnect_max_delay=0.002)
+    states: list[str] = []
+    client.add_connection_listener(states.append)
+    await client.connect()
+    await client.login("admin", "password")
+
+    # The password is changed on the device while the session runs.
+    sim.password = "changed"
+    sim.drop_connections()
+    await asyncio.sleep(0.2)
+
+    assert client.reconnect_stats()["attempts"] == 1
+    assert sim.requests["login"] == 2
+    assert client.reconnecting is False
+    assert client.connection_state == CONNECTION_DISCONNECTED
+    assert states[-2:] == [CONNECTION_RECONNECTING, CONNECTION_DISCONNECTED]
+
+    # An explicit connect and login surfaces the rejection to the caller.
+    await client.connect()
+    with pytest.raises(AuthenticationError):
+        await client.login("admin", "password")
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_dropped_socket_fails_writes_without_replay() -> None:
+    sim = SiegeniaSimulator()
+    _hold(sim, "setDeviceParams")
+    client = _sim_client(sim, auto_reconnect=True, replay_requests=True, reconnect_min_delay=0)
+    await client.connect()
+    await client.login("admin", "password")
+
+    command = asyncio.create_task(client.open_close(0, "OPEN"))
+    await _drain_loop()
+    sim.drop_connections()
+
+    with pytest.raises(SiegeniaError, match="Connection closed"):
+        await command
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_resumed_session_falls_back_to_login_once() -> None:
+    sim = SiegeniaSimulator()
+    client = _sim_client(sim)
+    await client.connect()
+    await client.login("admin", "password", long_life=True)
+    assert sim.received[0]["long_life"] is True
+    await client.disconnect()
+
+    # The device does not know the resumed session on the new socket.
+    mark = len(sim.received)
+    await client.connect()
+    client.resume_session("admin", "password")
+    response = await client.get_device_params()
+
+    assert response["status"] == "ok"
+    assert _commands(sim, mark) == ["getDeviceParams", "login", "getDeviceParams"]
+    assert client.session_stats() == {
+        "logins": 2,
+        "resumed": 1,
+        "resumed_ok": 0,
+        "fallback_logins": 1,
+        "relogins": 0,
+    }
+    assert client.session_info is not None and client.session_info["long_life"] is True
+    assert client.connect_stats()["first_data_count"] == 1
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_expired_session_relogs_in_on_same_socket() -> None:
+    sim = SiegeniaSimulator()
+    client = _sim_client(sim)
+    await client.connect()
+    await client.login("admin", "password")
+    sim.expire_sessions()
+
+    params, details = await asyncio.gather(client.get_device_params(), client.get_device_details())
+
+    assert params["status"] == details["status"] == "ok"
+    commands = _commands(sim)
+    assert commands.count("login") == 2
+    assert commands.count("getDeviceParams") == commands.count("getDeviceDetails") == 2
+    assert client.session_stats()["relogins"] == 1
+    assert client.connected is True
+    assert sim.connections == 1
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_rejected_relogin_raises_authentication_error() -> None:
+    sim = SiegeniaSimulator()
+    client = _sim_client(sim)
+    await client.connect()
+    await client.login("admin", "password")
+    sim.expire_sessions()
+    sim.inject_failure("login", "authentication_error")
+
+    with pytest.raises(AuthenticationError):
+        await client.get_device_params()
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_subscribers_get_bounded_push_streams() -> None:
+    sim = SiegeniaSimulator()
+    client = _sim_client(sim)
+    await client.connect()
+    await client.login("admin", "password")
+    everything = client.subscribe(maxsize=2)
+    params_only = client.subscribe(commands={"deviceParams"}, maxsize=2, overflow="coalesce_latest")
+
+    for index in range(3):
+        sim.push({"command": "deviceParams", "data": {"seq": index}})
+    sim.push({"command": "warnings", "data": {}})
+    # Nobody is consuming yet; responses must still be routed.
+    assert (await asyncio.wait_for(client.get_device(), timeout=1))["status"] == "ok"
+
+    assert [msg["command"] async for msg in _take(everything, 2)] == ["deviceParams", "warnings"]
+    assert everything.stats()["dropped"] == 2
+    assert [msg["data"]["seq"] async for msg in _take(params_only, 1)] == [2]
+    assert params_only.stats()["coalesced"] == 2
+
+    await client.disconnect()
+    assert [msg async for msg in everything] == []
+    assert client.subscription_stats() == []
+    await sim.close()
+
+
+async def _take(subscription, count: int):  # noqa: ANN001, ANN201
+    for _ in range(count):
+        yield await asyncio.wait_for(anext(subscription), timeout=1)
+
+
+def test_subscription_rejects_unknown_overflow_policy() -> None:
+    with pytest.raises(ValueError):
+        SiegeniaClient("192.0.2.1").subscribe(overflow="block")
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('{"command": "deviceParams", "data": {}}', (True, "deviceParams")),
+        (b'{"data": {"x": 1}, "command":"warnings"}', (True, "warnings")),
+        ('{"id": 4, "status": "ok", "command": "getDevice"}', (False, None)),
+        ('{"command": "a", "data": {"command": "b"}}', (True, None)),
+        ('{"data": {}}', (True, None)),
+    ],
+)
+def test_peek_push_command(raw: str | bytes, expected: tuple[bool, str | None]) -> None:
+    assert _peek_push_command(raw) == expected
+
+
+async def test_unwanted_pushes_are_dropped_before_decoding(monkeypatch) -> None:
+    sim = SiegeniaSimulator()
+    client = _sim_client(sim)
+    await client.connect()
+    await client.login("admin", "password")
+    received: list[dict[str, object]] = []
+    client.set_push_callback(received.append, commands={"deviceParams"})
+    decoded: list[object] = []
+    loads = client.codec.loads
+    monkeypatch.setattr(client.codec, "loads", lambda raw: decoded.append(raw) or loads(raw))
+
+    sim.push({"command": "deviceParams", "data": {}})
+    sim.push({"command": "heartbeat"})
+    sim.push({"command": "heartbeat"})
+    await client.get_device()
+
+    assert [msg["command"] for msg in received] == ["deviceParams"]
+    assert len(decoded) == 2  # deviceParams push and the getDevice response
+    stats = client.stats()
+    assert stats["dropped_pushes"] == {"heartbeat": 2}
+    assert stats["push_frames"] == {"deviceParams": 1, "heartbeat": 2}
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_open_close_many_batches_sashes_into_few_frames() -> None:
+    sim = SiegeniaSimulator(sashes=3, motion_time=0.01)
+    client = _sim_client(sim)
+    await client.connect()
+    await client.login("admin", "password")
+    mark = len(sim.received)
+
+    await client.open_close_many({0: "close", 1: "CLOSE_WO_LOCK", 2: "STOP"})
+
+    assert [frame["params"] for frame in sim.received[mark:]] == [
+        {"stop": {"2": True}},
+        {"openclose": {"0": "CLOSE", "1": "CLOSE_WO_LOCK"}},
+    ]
+    with pytest.raises(ValueError):
+        await client.open_close_many({0: "FLY"})
+    with pytest.raises(ValueError):
+        await client.open_close_many({})
+    assert len(sim.received) == mark + 2
+    await client.disconnect()
+    await sim.close()
+
+
+class _RecordingSession:
+    """aiohttp-like session that records ``ws_connect`` kwargs and serves a simulator."""
+
+    def __init__(self, sim: SiegeniaSimulator) -> None:
+        self.kwargs: list[dict[str, object]] = []
+        self._transport = sim.transport()
+
+    async def ws_connect(self, url: str, **kwargs):  # noqa: ANN003, ANN201
+        self.kwargs.append(kwargs)
+        return await self._transport.connect(url, headers=kwargs.get("headers", {}), ssl_context=None)
+
+
+async def test_connect_reuses_shared_ssl_context_per_verify_mode() -> None:
+    sim = SiegeniaSimulator()
+    session = _RecordingSession(sim)
+    for host in ("192.0.2.1", "192.0.2.2"):
+        client = SiegeniaClient(host, session=session)  # type: ignore[arg-type]
+        await client.connect()
+        assert client.connect_stats()["connects"] == 1
+        await client.disconnect()
+
+    first, second = (kwargs["ssl"] for kwargs in session.kwargs)
+    assert first is second
+    assert first is await async_get_ssl_context(False)
+    assert first.verify_mode == ssl.CERT_NONE
+    assert get_ssl_context(True) is not first
+    await sim.close()
+
+
+async def test_stats_track_rtt_pushes_and_unmatched_responses() -> None:
+    sim = SiegeniaSimulator()
+    client = _sim_client(sim)
+    await client.connect()
+    await client.login("admin", "password")
+    for _ in range(3):
+        await client.get_device_params()
+
+    sim.push({"command": "deviceParams", "data": {}})
+    sim.push({"id": 999, "status": "ok"})
+    await _drain_loop()
+
+    stats = client.stats()
+    params = stats["requests"]["getDeviceParams"]
+    assert params["count"] == 3
+    assert params["p50"] is not None and params["p50"] <= params["p99"]
+    assert stats["frames_out"] == 4
+    assert stats["bytes_out"] > 0 and stats["bytes_in"] > 0
+    assert stats["push_frames"] == {"deviceParams": 1}
+    assert stats["unmatched_responses"] == 1
+    assert stats["recent_unmatched_ids"] == [999]
+    assert stats["connection_state"] == CONNECTION_CONNECTED
+    await client.disconnect()
+    await sim.close()
+
+
+def test_command_stats_percentiles_use_histogram_buckets() -> None:
+    stats = CommandStats()
+    for _ in range(98):
+        stats.record(0.002)
+    stats.record(0.5)
+    stats.record(40.0)
+
+    assert stats.percentile(0.5) == pytest.approx(0.00225)
+    assert stats.percentile(0.99) <= 0.5 * 1.5
+    assert stats.percentile(1.0) == 40.0
+
+
+async def test_adaptive_timeout_follows_observed_rtt() -> None:
+    client = SiegeniaClient(
+        "192.0.2.1",
+        response_timeout=10.0,
+        adaptive_timeouts=True,
+        timeout_floor=0.5,
+    )
+    client._ws = _ImmediateResponseWebSocket(client, {"status": "ok"})  # type: ignore[assignment]
+
+    assert client.timeout_for("getDeviceParams") == 10.0
+    assert client.timeout_for("getDeviceParams", 3.0) == 3.0
+    for _ in range(5):
+        await client.get_device_params()
+
+    # Instant responses clamp the deadline to the floor.
+    assert client.timeout_for("getDeviceParams") == 0.5
+
+    stats = client._stats.command("getDeviceParams")
+    stats.srtt, stats.rttvar = 4.0, 2.0
+    assert client.timeout_for("getDeviceParams") == 10.0
+    stats.srtt, stats.rttvar = 0.2, 0.1
+    stats.record_timeout()
+    assert client.timeout_for("getDeviceParams") == pytest.approx(1.2)
@@ -3,7 +3,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 from homeassistant.core import Context, Event
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from homeassistant.const import ATTR_ENTITY_ID
@@ -193,6 +193,24 @@ async def test_blocked_command_emits_blocked_event(hass, setup_integration):
     assert events[0].data["entity_id"] == cover_eid
 
 
+async def test_batched_commands_use_one_client_call(hass, setup_integration):
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+
+    await coordinator.async_send_commands({0: "close", 1: "STOP"}, source="automation")
+
+    coordinator.client.open_close_many.assert_awaited_once_with({0: "CLOSE", 1: "STOP"})
+    coordinator.client.open_close.assert_not_called()
+    assert coordinator.get_last_cmd(1) == "STOP"
+
+    with pytest.raises(ServiceValidationError):
+        await coordinator.async_send_commands({0: "FLY"}, source="automation")
+    coordinator.prevent_opening = True
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_send_commands({0: "CLOSE", 1: "OPEN"}, source="automation")
+    coordinator.client.open_close_many.assert_awaited_once()
+
+
 async def test_offline_command_raises_home_assistant_error(hass, setup_integration):
     entry = setup_integration
     coordinator = hass.data[entry.domain][entry.entry_id]
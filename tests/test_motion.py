@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+from custom_components.siegenia.motion import MotionPredictor, transition_key
+from custom_components.siegenia.storage import async_get_motion_profiles
+
+
+def test_predictor_learns_transitions_and_reports_errors():
+    predictor = MotionPredictor()
+    predictor.observe({0: "CLOSED"}, 0.0, 2.0)
+
+    # Commanded run: start from the command, end at the pushed stable state
+    predictor.start(0, "CLOSED", "OPEN", 10.0)
+    assert predictor.predicted_end() is None
+    assert predictor.observe({0: "MOVING"}, 11.0, 2.0) is False
+    assert predictor.observe({0: "OPEN"}, 30.0, 2.0, pushed=True) is True
+    assert predictor.profiles[transition_key(0, "CLOSED", "OPEN")] == {"mean": 20.0, "samples": 1}
+    # 20 s of motion at a 2 s interval would have taken 10 polls; none were sent
+    assert predictor.stats()["polls_saved"] == 10
+
+    predictor.observe({0: "CLOSED"}, 40.0, 2.0)
+    predictor.start(0, "CLOSED", "OPEN", 50.0)
+    assert predictor.predicted_end() == 70.0
+    predictor.observe({0: "MOVING"}, 51.0, 2.0)
+    predictor.note_poll()
+    predictor.observe({0: "OPEN"}, 60.0, 2.0, pushed=True)
+    stats = predictor.stats()
+    assert stats["last_error"] == -10.0
+    assert stats["mean_abs_error"] == 10.0
+    assert stats["profiles"]["0:CLOSED->OPEN"]["samples"] == 2
+    assert 10.0 < stats["profiles"]["0:CLOSED->OPEN"]["mean"] < 20.0
+
+
+def test_polled_ends_do_not_bias_learned_travel_times():
+    key = transition_key(0, "CLOSED", "OPEN")
+    predictor = MotionPredictor()
+    predictor.observe({0: "CLOSED"}, 0.0, 2.0)
+
+    # Flat polling: travel ended between the last MOVING poll and the stable one
+    predictor.start(0, "CLOSED", "OPEN", 0.0)
+    for now in (2.0, 4.0, 6.0, 8.0, 10.0):
+        predictor.observe({0: "MOVING"}, now, 2.0)
+    assert predictor.observe({0: "OPEN"}, 12.0, 2.0) is True
+    assert predictor.profiles[key] == {"mean": 11.0, "samples": 1}
+
+    # A sparse poll at the predicted end cannot see a shorter run, so it is not learned
+    for _ in range(5):
+        predictor.observe({0: "CLOSED"}, 20.0, 2.0)
+        predictor.start(0, "CLOSED", "OPEN", 20.0)
+        predictor.observe({0: "MOVING"}, 21.0, 2.0)
+        assert predictor.observe({0: "OPEN"}, 31.0, 2.0) is False
+    assert predictor.profiles[key] == {"mean": 11.0, "samples": 1}
+    assert predictor.stats()["predicted_runs"] == 5
+
+
+def test_predictor_drops_commands_that_never_move():
+    predictor = MotionPredictor({"0:CLOSED->OPEN": {"mean": 12, "samples": 3}, "bad": {"mean": "x"}})
+    assert list(predictor.profiles) == ["0:CLOSED->OPEN"]
+    predictor.start(0, "OPEN", "OPEN", 0.0)
+    predictor.observe({0: "OPEN"}, 20.0, 2.0)
+    assert predictor.active is False
+    assert predictor.completed == 0
+    # Manual motion uses the longest known travel from the current state
+    predictor.observe({0: "CLOSED"}, 30.0, 2.0)
+    predictor.observe({0: "MOVING"}, 31.0, 2.0)
+    assert predictor.predicted_end() == 43.0
+
+
+async def test_coordinator_polls_at_predicted_end_and_persists(hass, setup_integration):
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    coordinator._motion.load({"0:CLOSED->OPEN": {"mean": 30.0, "samples": 4}})  # noqa: SLF001
+
+    await coordinator.async_send_command(0, "OPEN", source="test")
+    coordinator._process_poll({"data": {"states": {"0": "MOVING"}}})  # noqa: SLF001
+    # One sparse poll near the predicted end instead of every motion interval
+    assert coordinator.update_interval > timedelta(seconds=25)
+
+    coordinator._motion._runs[0].started -= 40  # noqa: SLF001 - travel ran past the prediction
+    coordinator._process_poll({"data": {"states": {"0": "MOVING"}}})  # noqa: SLF001
+    assert coordinator.update_interval == timedelta(seconds=2)
+    coordinator._process_poll({"data": {"states": {"0": "MOVING"}}})  # noqa: SLF001
+    assert coordinator.update_interval == coordinator._motion_interval  # noqa: SLF001
+
+    coordinator._handle_push_update({"command": "deviceParams", "data": {"states": {"0": "OPEN"}}})  # noqa: SLF001
+    motion = coordinator.stats()["motion"]
+    assert motion["predicted_runs"] == 1
+    assert motion["last_error"] > 5
+    store = await async_get_motion_profiles(hass)
+    assert store.get(coordinator.serial)["transitions"]["0:CLOSED->OPEN"]["samples"] == 5
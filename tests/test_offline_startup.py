@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import time
 from unittest.mock import AsyncMock
 
 import pytest
+from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -105,3 +107,206 @@ async def test_transient_reconnect_login_failure_closes_socket_before_retry(
     assert client.connected is True
     assert client.login_attempts == 2
     assert client.heartbeat_calls == 1
+
+
+async def test_coordinator_waits_for_client_background_reconnect(
+    hass,
+    config_entry_data,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=config_entry_data,
+        title="Siegenia Test",
+    )
+    entry.add_to_hass(hass)
+    coordinator = SiegeniaDataUpdateCoordinator(
+        hass,
+        entry=entry,
+        host=config_entry_data["host"],
+        port=config_entry_data["port"],
+        username=config_entry_data["username"],
+        password=config_entry_data["password"],
+        auto_discover=False,
+    )
+
+    class _ReconnectingClient:
+        connected = False
+        reconnecting = True
+
+        def __init__(self) -> None:
+            self.connect = AsyncMock()
+
+    client = _ReconnectingClient()
+    coordinator.client = client  # type: ignore[assignment]
+
+    with pytest.raises(UpdateFailed):
+        await coordinator._ensure_connected()
+
+    client.connect.assert_not_awaited()
+
+
+async def test_long_life_session_is_cached_and_resumed(
+    hass,
+    config_entry_data,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=config_entry_data,
+        title="Siegenia Test",
+        unique_id="SN123",
+    )
+    entry.add_to_hass(hass)
+    coordinator = SiegeniaDataUpdateCoordinator(
+        hass,
+        entry=entry,
+        host=config_entry_data["host"],
+        port=config_entry_data["port"],
+        username=config_entry_data["username"],
+        password=config_entry_data["password"],
+        auto_discover=False,
+    )
+    coordinator.long_life_session = True
+
+    class _SessionClient:
+        def __init__(self) -> None:
+            self.login = AsyncMock()
+            self.resumed: list[tuple[str, str]] = []
+            self.session_info = {"long_life": True, "established": time.time(), "data": None}
+
+        def resume_session(self, user: str, password: str) -> None:
+            self.resumed.append((user, password))
+
+    client = _SessionClient()
+    coordinator.client = client  # type: ignore[assignment]
+
+    await coordinator._async_login()
+    client.login.assert_awaited_once_with(
+        config_entry_data["username"], config_entry_data["password"], long_life=True
+    )
+    assert client.resumed == []
+
+    await coordinator._async_login()
+    client.login.assert_awaited_once()
+    assert client.resumed == [(config_entry_data["username"], config_entry_data["password"])]
+
+
+def _seed_device_cache(hass_storage) -> None:  # noqa: ANN001
+    hass_storage[f"{DOMAIN}.devices"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.devices",
+        "data": {
+            "00112233": {
+                "device_info": {"data": {"devicename": "Living room", "serialnr": "00112233", "type": 6}},
+                "params": {"status": "ok", "data": {"states": {"0": "OPEN"}, "warnings": []}},
+                "updated": time.time() - 600,
+            }
+        },
+    }
+
+
+async def test_cached_device_is_shown_before_it_connects(
+    hass,
+    hass_storage,
+    mock_client,  # noqa: ARG001
+    monkeypatch,
+    config_entry_data,
+) -> None:
+    import asyncio
+
+    from homeassistant.helpers import device_registry as dr
+
+    _seed_device_cache(hass_storage)
+    release = asyncio.Event()
+    original_setup = SiegeniaDataUpdateCoordinator.async_setup
+
+    async def _slow_setup(self):  # noqa: ANN001
+        await release.wait()
+        await original_setup(self)
+
+    monkeypatch.setattr(SiegeniaDataUpdateCoordinator, "async_setup", _slow_setup)
+    entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data, title="Siegenia Test", unique_id="00112233")
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    cover = next(s.entity_id for s in hass.states.async_all("cover") if s.entity_id.endswith("_window"))
+    assert hass.states.get(cover).state == "open"
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "00112233")})
+    assert device.name == "Living room"
+    cache_stats = coordinator.stats()["device_cache"]
+    assert cache_stats["seeded"] is True
+    assert 590 <= cache_stats["age"] <= 700
+
+    # Once the device answers, its values replace the cached ones and are cached in turn
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.states.get(cover).state == "closed"
+    assert coordinator.cache_age < 5
+    cached = coordinator._device_cache.get("00112233")  # noqa: SLF001
+    assert cached["params"]["data"]["states"] == {"0": "CLOSED"}
+    assert cached["device_info"]["data"]["devicename"] == "Siegenia Test"
+
+
+async def test_cached_device_goes_unavailable_when_login_is_rejected(
+    hass,
+    hass_storage,
+    mock_client,  # noqa: ARG001
+    monkeypatch,
+    config_entry_data,
+) -> None:
+    _seed_device_cache(hass_storage)
+
+    async def _rejected_setup(self):  # noqa: ANN001
+        raise ConfigEntryAuthFailed("Invalid credentials")
+
+    monkeypatch.setattr(SiegeniaDataUpdateCoordinator, "async_setup", _rejected_setup)
+    entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data, title="Siegenia Test", unique_id="00112233")
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    cover = next(s.entity_id for s in hass.states.async_all("cover") if s.entity_id.endswith("_window"))
+    assert hass.states.get(cover).state == "unavailable"
+    assert coordinator.last_update_success is False
+    assert coordinator.awaiting_connect is False
+    assert coordinator.setup_timing["result"] == "auth_failed"
+    flows = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert [flow["context"]["source"] for flow in flows] == ["reauth"]
+
+
+async def test_unchanged_polls_do_not_rewrite_the_device_cache(hass, setup_integration, monkeypatch) -> None:
+    from unittest.mock import MagicMock
+
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    cache = coordinator._device_cache  # noqa: SLF001
+    payload = {"states": {"0": "CLOSED"}, "warnings": []}
+    coordinator.client.get_device_params.side_effect = [
+        {"id": request_id, "status": "ok", "data": payload} for request_id in (2, 3, 4)
+    ]
+    save = MagicMock()
+    monkeypatch.setattr(cache._store, "async_delay_save", save)  # noqa: SLF001
+
+    await coordinator.async_refresh()
+    assert save.call_count == 1
+    updated = coordinator.cache_age
+    assert "id" not in cache.get("00112233")["params"]
+
+    # Same values under new request ids: nothing to write, the age keeps growing
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert save.call_count == 1
+    assert coordinator.cache_age >= updated
+
+
+async def test_removing_the_entry_forgets_its_cached_device(hass, setup_integration) -> None:
+    entry = setup_integration
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    cache = coordinator._device_cache  # noqa: SLF001
+    assert cache.get("00112233") is not None
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert cache.get("00112233") is None
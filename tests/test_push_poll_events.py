@@ -32,3 +32,186 @@ async def test_push_slows_poll_and_fires_event(hass, setup_integration):
     assert len(events) == 1
     assert events[0].data["warnings"] == ["Test"]
     assert events[0].data["cleared"] is False
+
+
+async def test_unchanged_polls_and_pushes_do_not_notify_listeners(hass, setup_integration):
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    calls = []
+    unsub = coordinator.async_add_listener(lambda: calls.append(coordinator.snapshot.version))
+    suppressed = coordinator.suppressed_updates
+
+    # Same params again: parsed, but nothing changed for entities
+    await coordinator.async_refresh()
+    coordinator._handle_push_update({"command": "deviceParams", "data": {"states": {"0": "CLOSED"}}})  # noqa: SLF001
+    assert calls == []
+    assert coordinator.suppressed_updates == suppressed + 2
+
+    coordinator._handle_push_update({"command": "deviceParams", "data": {"states": {"0": "OPEN"}}})  # noqa: SLF001
+    assert calls == [coordinator.snapshot.version]
+
+    # Availability changes always reach listeners
+    coordinator.async_set_update_error(Exception("offline"))
+    assert len(calls) == 2
+    assert coordinator.stats()["suppressed_updates"] == coordinator.suppressed_updates
+    unsub()
+
+
+async def test_keyed_listeners_only_see_their_slice(hass, setup_integration):
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    calls: dict[str, int] = {"sash0": 0, "timer": 0, "states": 0}
+
+    def _count(name):
+        def _cb():
+            calls[name] += 1
+        return _cb
+
+    unsubs = [
+        coordinator.async_add_keyed_listener(["states/0"], _count("sash0")),
+        coordinator.async_add_keyed_listener(["timer"], _count("timer")),
+        coordinator.async_add_keyed_listener(["states"], _count("states")),
+    ]
+    before = dict(coordinator.stats()["key_dispatches"])
+
+    push = coordinator._handle_push_update  # noqa: SLF001
+    push({"command": "deviceParams", "data": {"timer": {"enabled": True, "remainingtime": {"hour": 0, "minute": 5}}}})
+    assert calls == {"sash0": 0, "timer": 1, "states": 0}
+    dispatches = coordinator.stats()["key_dispatches"]
+    assert dispatches["timer"] > before.get("timer", 0)
+    assert dispatches.get("states/0", 0) == before.get("states/0", 0)
+
+    push({"command": "deviceParams", "data": {"states": {"0": "CLOSED", "1": "OPEN"}}})
+    assert calls == {"sash0": 0, "timer": 1, "states": 1}
+
+    push({"command": "deviceParams", "data": {"states": {"0": "MOVING", "1": "OPEN"}}})
+    assert calls == {"sash0": 1, "timer": 1, "states": 2}
+    assert coordinator.stats()["key_dispatches"]["states/0"] > before.get("states/0", 0)
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_push_only_suspends_polls_with_watchdog_fallback(hass, setup_integration):
+    from datetime import timedelta
+
+    from homeassistant.util import dt as dt_util
+    from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    coordinator.push_only = True
+    coordinator.push_watchdog = 30
+    client = coordinator.client
+    polls = client.get_device_params.await_count
+
+    coordinator._handle_push_update({"command": "deviceParams", "data": {"states": {"0": "CLOSED"}}})  # noqa: SLF001
+    assert coordinator.update_interval is None
+    assert coordinator.stats()["push_only_active"] is True
+
+    # Quiet window: one verification poll matching the last push, polling stays suspended
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    assert client.get_device_params.await_count == polls + 1
+    assert coordinator.update_interval is None
+    assert coordinator.stats()["watchdog_verifications"] == 1
+
+    # Failed verification: fall back to the normal schedule
+    client.get_device_params.side_effect = OSError("offline")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=62))
+    await hass.async_block_till_done()
+    stats = coordinator.stats()
+    assert stats["push_only_active"] is False
+    assert stats["watchdog_fallbacks"] == 1
+    assert coordinator.update_interval == coordinator._default_interval  # noqa: SLF001
+    assert stats["polls_last_hour"] >= 2
+
+
+async def test_push_only_watchdog_resumes_polls_when_pushes_miss_changes(hass, setup_integration):
+    from datetime import timedelta
+
+    from homeassistant.util import dt as dt_util
+    from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    coordinator.push_only = True
+    coordinator.push_watchdog = 30
+    client = coordinator.client
+
+    coordinator._handle_push_update({"command": "deviceParams", "data": {"states": {"0": "CLOSED"}}})  # noqa: SLF001
+    assert coordinator.update_interval is None
+
+    # The socket stays up but the window opened without a push
+    client.get_device_params.return_value = {"status": "ok", "data": {"states": {"0": "OPEN"}, "warnings": []}}
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+
+    stats = coordinator.stats()
+    assert coordinator.last_update_success is True
+    assert coordinator.snapshot.state(0) == "OPEN"
+    assert stats["push_only_active"] is False
+    assert stats["watchdog_fallbacks"] == 1
+    assert stats["schedule"]["transitions"][-1]["reason"] == "watchdog_stale"
+    assert coordinator.update_interval == coordinator._idle_interval  # noqa: SLF001
+    assert coordinator._unsub_refresh is not None  # noqa: SLF001
+
+
+async def test_schedule_state_machine_owns_the_interval(hass, setup_integration):
+    from datetime import timedelta
+
+    from homeassistant.util import dt as dt_util
+    from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    push = coordinator._handle_push_update  # noqa: SLF001
+    assert coordinator.schedule_state == "idle"
+
+    push({"command": "deviceParams", "data": {"states": {"0": "MOVING"}}})
+    assert coordinator.schedule_state == "motion"
+    assert coordinator.update_interval == coordinator._motion_interval  # noqa: SLF001
+
+    push({"command": "deviceParams", "data": {"states": {"0": "OPEN"}}})
+    assert coordinator.schedule_state == "push_active"
+    assert coordinator.update_interval == coordinator._push_interval  # noqa: SLF001
+    assert coordinator.time_in_state < 1
+
+    # Pushes go quiet: the single timer drops back to idle polling
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    assert coordinator.schedule_state == "idle"
+    assert coordinator.update_interval == coordinator._idle_interval  # noqa: SLF001
+
+    coordinator.client.get_device_params.side_effect = OSError("offline")
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert coordinator.schedule_state == "offline_backoff"
+    assert coordinator.update_interval == coordinator._default_interval * 2  # noqa: SLF001
+
+    schedule = coordinator.stats()["schedule"]
+    assert [(t["from"], t["to"]) for t in schedule["transitions"]] == [
+        ("idle", "motion"),
+        ("motion", "push_active"),
+        ("push_active", "idle"),
+        ("idle", "offline_backoff"),
+    ]
+    assert schedule["transitions"][2]["reason"] == "push_silence"
+
+
+async def test_poll_retried_after_rediscovery_counts_once(hass, setup_integration, monkeypatch):
+    from unittest.mock import AsyncMock
+
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    client = coordinator.client
+    before = coordinator.stats()
+    ok = await client.get_device_params()
+    client.get_device_params.side_effect = [OSError("moved"), ok]
+    monkeypatch.setattr(coordinator, "_handle_connection_error", AsyncMock(return_value=True))
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    stats = coordinator.stats()
+    assert stats["polls_total"] == before["polls_total"] + 1
+    assert stats["polls_last_hour"] == before["polls_last_hour"] + 1
+    assert stats["poll_retries"] == before["poll_retries"] + 1
@@ -87,7 +87,7 @@ async def test_options_override_intervals(hass, mock_client, config_entry_data,
     from pytest_homeassistant_custom_component.common import MockConfigEntry
     from custom_components.siegenia.coordinator import SiegeniaDataUpdateCoordinator
 
-    def _no_adjust(self, _payload):  # noqa: ANN001
+    def _no_adjust(self):  # noqa: ANN001
         return None
 
     monkeypatch.setattr(SiegeniaDataUpdateCoordinator, "_adjust_interval", _no_adjust)
@@ -0,0 +1,160 @@
+import asyncio
+
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.siegenia.const import DOMAIN
+from custom_components.siegenia.coordinator import SiegeniaDataUpdateCoordinator
+from custom_components.siegenia.scheduler import SiegeniaConnectGate, SiegeniaPollScheduler
+
+
+async def test_phases_spread_polls_and_slots_cap_concurrency():
+    scheduler = SiegeniaPollScheduler(max_concurrent=2, jitter=0.0)
+    phases = [scheduler.register(f"entry{i}", f"SN{i:04d}") for i in range(40)]
+    # Forty devices land in most tenths of the interval instead of one instant
+    assert len({int(phase * 10) for phase in phases}) >= 8
+
+    # Each device's next poll falls on its own phase, one interval apart once settled
+    interval = 60.0
+    now = 1000.0
+    delay = scheduler.next_delay("entry0", interval, now)
+    assert interval / 2 <= delay < interval * 1.5
+    assert abs((now + delay) % interval - phases[0] * interval) < 1e-6
+    assert abs(scheduler.next_delay("entry0", interval, now + delay) - interval) < 1e-6
+
+    gate = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def _poll(key):
+        nonlocal running, peak
+        async with scheduler.slot(key):
+            running += 1
+            peak = max(peak, running)
+            await gate.wait()
+            running -= 1
+
+    tasks = [asyncio.create_task(_poll(f"entry{i}")) for i in range(5)]
+    await asyncio.sleep(0)
+    assert running == 2
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2
+    assert scheduler.stats()["peak_in_flight"] == 2
+    assert sum(scheduler.device_stats(f"entry{i}")["queued_polls"] for i in range(5)) == 3
+
+
+async def test_coordinator_polls_on_its_phase(hass, setup_integration):
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    scheduler = coordinator.poll_scheduler
+    assert scheduler is not None
+
+    await coordinator.async_refresh()
+    stats = coordinator.stats()["poll_phase"]
+    assert stats["phase"] == round(scheduler.phase(entry.entry_id), 4)
+    assert stats["polls"] >= 1
+    assert stats["queued_polls"] == 0
+    assert stats["phase_offset"] <= coordinator.update_interval.total_seconds()
+
+    # The next scheduled poll lands on the device's phase
+    interval = coordinator.update_interval.total_seconds()
+    expected = scheduler.next_delay(entry.entry_id, interval, hass.loop.time())
+    coordinator._schedule_refresh()  # noqa: SLF001
+    assert coordinator._unsub_refresh is not None  # noqa: SLF001
+    timers = [h for h in hass.loop._scheduled if not h.cancelled() and "_on_phased_refresh" in repr(h)]  # noqa: SLF001
+    assert len(timers) == 1
+    assert abs(timers[0].when() - hass.loop.time() - expected) < 1.0
+
+    # A phased poll still in flight is cancelled with the entry
+    hold = asyncio.Event()
+
+    async def _hang():
+        await hold.wait()
+
+    coordinator.client.get_device_params.side_effect = _hang
+    coordinator._on_phased_refresh()  # noqa: SLF001
+    await asyncio.sleep(0)
+    running = [task for task in entry._background_tasks if "refresh" in task.get_name()]  # noqa: SLF001
+    assert len(running) == 1 and not running[0].done()
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    assert running[0].cancelled()
+    assert scheduler.phase(entry.entry_id) is None
+
+
+async def test_connect_gate_bounds_concurrent_connections():
+    gate = SiegeniaConnectGate(max_concurrent=2, jitter=0.0)
+    release = asyncio.Event()
+    waits: list[float] = []
+
+    async def _connect():
+        async with gate.admit() as waited:
+            waits.append(waited)
+            await release.wait()
+
+    tasks = [asyncio.create_task(_connect()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert gate.stats()["connecting"] == 2
+    release.set()
+    await asyncio.gather(*tasks)
+    assert gate.stats() == {"max_concurrent": 2, "admitted": 5, "connecting": 0, "peak_connecting": 2}
+    assert len(waits) == 5
+
+
+async def test_platforms_load_before_the_device_connects(hass, mock_client, config_entry_data, monkeypatch):  # noqa: ARG001
+    release = asyncio.Event()
+    original_setup = SiegeniaDataUpdateCoordinator.async_setup
+
+    async def _slow_setup(self):
+        await release.wait()
+        await original_setup(self)
+
+    monkeypatch.setattr(SiegeniaDataUpdateCoordinator, "async_setup", _slow_setup)
+    entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data, title="Siegenia Test", unique_id="00112233")
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    cover = next(s.entity_id for s in hass.states.async_all("cover") if s.entity_id.endswith("_window"))
+    assert hass.states.get(cover).state == "unavailable"
+    assert "platforms_ready" in coordinator.setup_timing
+    assert "result" not in coordinator.setup_timing
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "00112233")})
+    assert device.name == "Siegenia Device"
+
+    release.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.states.get(cover).state == "closed"
+    timing = coordinator.stats()["setup"]
+    assert timing["result"] == "connected"
+    assert timing["total"] >= timing["platforms_ready"]
+    assert {"admission_wait", "connect", "first_refresh"} <= timing.keys()
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "00112233")})
+    assert device.name == "Siegenia Test"
+    assert device.sw_version == "1.7.2"
+
+
+async def test_failed_connect_frees_the_gate_and_retries_on_schedule(hass, mock_client, config_entry_data, monkeypatch):  # noqa: ARG001
+    async def _offline_setup(self):
+        raise OSError("offline")
+
+    monkeypatch.setattr(SiegeniaDataUpdateCoordinator, "async_setup", _offline_setup)
+    entry = MockConfigEntry(domain=DOMAIN, data=config_entry_data, title="Siegenia Test")
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # No second connect attempt inside the gate; the slot is free again
+    coordinator.client.get_device_params.assert_not_awaited()
+    assert hass.data[f"{DOMAIN}_connect_gate"].stats()["connecting"] == 0
+    timing = coordinator.stats()["setup"]
+    assert timing["result"] == "offline"
+    assert "first_refresh" not in timing
+    cover = next(s.entity_id for s in hass.states.async_all("cover") if s.entity_id.endswith("_window"))
+    assert hass.states.get(cover).state == "unavailable"
+    assert coordinator.schedule_state == "offline_backoff"
+    assert coordinator._unsub_refresh is not None  # noqa: SLF001
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.siegenia.siegenia_client import (
+    AuthenticationError,
+    SiegeniaClient,
+    SiegeniaError,
+    SiegeniaSimulator,
+)
+from custom_components.siegenia.snapshot import DeviceSnapshot
+
+
+def _client(sim: SiegeniaSimulator, **kwargs) -> SiegeniaClient:  # noqa: ANN003
+    return SiegeniaClient("sim", ws_protocol="ws", transport=sim.transport(), **kwargs)
+
+
+async def test_client_talks_to_simulator_over_loopback() -> None:
+    sim = SiegeniaSimulator(sashes=2, motion_time=0.05, push_interval=0.01)
+    client = _client(sim)
+    await client.connect()
+    await client.login("admin", "password")
+
+    device = await client.get_device()
+    assert device["data"]["serialnr"] == "SIM00000001"
+
+    async with client.subscribe(commands={"deviceParams"}) as stream:
+        await client.open_close_many({0: "OPEN", 1: "GAP_VENT"})
+        seen: list[dict[str, str]] = []
+        async for msg in stream:
+            seen.append(msg["data"]["states"])
+            if "MOVING" not in msg["data"]["states"].values():
+                break
+
+    assert seen[0] == {"0": "MOVING", "1": "MOVING"}
+    assert seen[-1] == {"0": "OPEN", "1": "GAP_VENT"}
+    params = await client.get_device_params()
+    assert params["data"]["states"] == {"0": "OPEN", "1": "GAP_VENT"}
+    # The simulated payload parses like a real device's
+    assert DeviceSnapshot.from_params(params, 1).timer_remaining == (0, 0)
+
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_simulator_injects_failures_and_expiry() -> None:
+    sim = SiegeniaSimulator()
+    client = _client(sim)
+    await client.connect()
+
+    with pytest.raises(AuthenticationError):
+        await client.login("admin", "wrong")
+    await client.login("admin", "password")
+
+    sim.inject_failure("getDeviceParams")
+    with pytest.raises(SiegeniaError, match="error"):
+        await client.get_device_params()
+
+    sim.expire_sessions()
+    assert (await client.get_device_params())["status"] == "ok"
+    assert client.session_stats()["relogins"] == 1
+
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_simulator_rejects_partly_invalid_requests_without_moving() -> None:
+    sim = SiegeniaSimulator(sashes=2, motion_time=0.01)
+    client = _client(sim)
+    await client.connect()
+    await client.login("admin", "password")
+
+    with pytest.raises(SiegeniaError, match="error"):
+        await client.set_device_params({"openclose": {"0": "OPEN", "5": "OPEN"}})
+    await asyncio.sleep(0.05)
+    assert sim.params["states"] == {"0": "CLOSED", "1": "CLOSED"}
+
+    await client.disconnect()
+    await sim.close()
+
+
+async def test_simulator_drop_triggers_client_reconnect() -> None:
+    sim = SiegeniaSimulator(latency=lambda command: 0.01 if command == "getDeviceParams" else 0)
+    client = _client(sim, auto_reconnect=True, replay_requests=True, reconnect_min_delay=0)
+    await client.connect()
+    await client.login("admin", "password")
+
+    poll = asyncio.create_task(client.get_device_params())
+    await asyncio.sleep(0)
+    sim.drop_connections()
+
+    assert (await asyncio.wait_for(poll, timeout=2))["status"] == "ok"
+    assert client.reconnect_stats()["reconnects"] == 1
+    assert sim.connections == 1
+
+    await client.disconnect()
+    await sim.close()
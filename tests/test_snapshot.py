@@ -0,0 +1,66 @@
+import pytest
+
+from custom_components.siegenia.snapshot import EMPTY_SNAPSHOT, DeviceSnapshot
+
+
+def test_snapshot_parses_params_once_and_is_immutable():
+    snap = DeviceSnapshot.from_params(
+        {
+            "data": {
+                "states": {"0": "OPEN", "1": "MOVING"},
+                "warnings": ["Battery low", {"code": 3}],
+                "timer": {"enabled": 1, "remainingtime": {"hour": "1", "minute": 5}},
+                "stopover": 3,
+                "max_stopover": 13,
+                "devicestate": {"deviceactive": True},
+                "firmware_update": 0,
+            }
+        },
+        7,
+    )
+    assert snap.version == 7
+    assert dict(snap.states) == {0: "OPEN", 1: "MOVING"}
+    assert snap.state("1") == "MOVING"
+    assert snap.sashes == [0, 1]
+    assert snap.moving is True
+    assert snap.warnings == ("Battery low", "{'code': 3}")
+    assert snap.timer_enabled is True
+    assert snap.timer_remaining == (1, 5)
+    assert (snap.stopover, snap.max_stopover) == (3, 13)
+    assert snap.device_active is True
+    assert snap.firmware_update == 0
+    with pytest.raises(AttributeError):
+        snap.stopover = 4
+    with pytest.raises(TypeError):
+        snap.states[0] = "CLOSED"
+    assert not hasattr(snap, "__dict__")
+
+
+def test_empty_snapshot_defaults():
+    snap = DeviceSnapshot.from_params({"status": "ok"}, 1)
+    assert snap.states == {}
+    assert snap.sashes == [0]
+    assert snap.warnings == ()
+    assert snap.timer_remaining is None
+    assert snap.device_active is None
+    assert EMPTY_SNAPSHOT.version == 0
+
+
+async def test_coordinator_snapshot_versions_follow_polls_and_pushes(hass, setup_integration):
+    entry = setup_integration
+    coordinator = hass.data[entry.domain][entry.entry_id]
+    first = coordinator.snapshot
+    assert first.state(0) == "CLOSED"
+    assert coordinator.snapshot is first
+
+    coordinator._handle_push_update({"command": "deviceParams", "data": {"states": {"0": "OPEN"}}})  # noqa: SLF001
+    pushed = coordinator.snapshot
+    assert pushed.version > first.version
+    assert pushed.state(0) == "OPEN"
+    # Merged push keeps fields the push did not carry
+    assert pushed.max_stopover == 13
+
+    await coordinator.async_refresh()
+    assert coordinator.snapshot.version > pushed.version
+    assert coordinator.snapshot.state(0) == "CLOSED"
+    assert coordinator.stats()["snapshot_version"] == coordinator.snapshot.version